@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import src.utility as utility
+from benchmarks.timing import best_of, print_table
+from src.chainplanner import naive_cost
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+
+
+"""Matrix chain planning
+
+P points of D coordinates pushed through a chain of DxD matrices whose first matrix is mutated every update.
+"Coalesce" multiplies the chain into one matrix before transforming the points; "planned" uses `Sequence.apply()`,
+which multiplies the chain and the points in the order which takes the fewest scalar multiplications.
+"""
+
+
+def benchmark():
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for dimensions in (4, 64, 256):
+        for count in (4, 1000, 100000):
+            sequence = Sequence()
+            first = MutableMatrix("E0", rng.standard_normal((dimensions, dimensions)))
+            sequence.register_node(first, None)
+            for index in range(1, 8):
+                matrix = rng.standard_normal((dimensions, dimensions))
+                sequence.register_node(MutableMatrix(f"E{index}", matrix), np.dot)
+
+            points = rng.standard_normal((count, dimensions))
+            mutate = first.get_mutator((0, 0))
+
+            def coalesce():
+                mutate(1)
+                return utility.apply_transform(sequence.get_matrix(), points)
+
+            def planned():
+                mutate(1)
+                return sequence.apply(points)
+
+            coalesced = best_of(coalesce, repeat=3)
+            planned = best_of(planned, repeat=3)
+
+            plan = sequence.get_plan()
+            chain = [count] + [dimensions] * 9
+            rows.append((dimensions, count, plan.get_order(), naive_cost(chain[::-1]) / plan.get_cost(),
+                         coalesced * 1e3, planned * 1e3, coalesced / planned))
+
+    print_table(["D", "P", "order", "flop ratio", "coalesce ms", "planned ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
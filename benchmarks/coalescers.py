@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import src.coalescers as coalescers
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+
+
+"""Block coalescers
+
+Assembling [R | Tᵀ; B] from an N x N matrix R, a translation row T and a bottom row B, after mutating T. "lambda"
+concatenates one node at a time with anonymous coalescers, allocating every intermediate matrix; "block" uses the
+named block coalescers, which write every matrix into one new array (for results of at least `ASSEMBLE_MIN_SIZE`
+elements); "block reuse" writes into one reused array, rewriting only T.
+"""
+
+
+def assemble(size, append_column, concatenate_rows, reuse_buffers=False):
+    R = MutableMatrix("R", np.random.default_rng(0).standard_normal((size, size)))
+    T = MutableMatrix("T", np.zeros((1, size)))
+    B = MutableMatrix("B", np.eye(1, size + 1, size))
+
+    sequence = Sequence(reuse_buffers=reuse_buffers)
+    sequence.register_node(R, None)
+    sequence.register_node(T, append_column)
+    sequence.register_node(B, concatenate_rows)
+
+    mutate = T.get_mutator((0, 0))
+
+    def evaluate():
+        mutate(1)
+        return sequence.get_matrix()
+
+    return evaluate
+
+
+def benchmark(number=1000):
+    rows = []
+    for size in (3, 64, 512):
+        lambdas = assemble(size, lambda a, b: np.concatenate((a, b.T), axis=1),
+                           lambda a, b: np.concatenate((a, b), axis=0))
+        block = assemble(size, coalescers.append_column, coalescers.concatenate_rows)
+        reuse = assemble(size, coalescers.append_column, coalescers.concatenate_rows, reuse_buffers=True)
+
+        times = [best_of(func, number=number) for func in (lambdas, block, reuse)]
+        rows.append([size] + [seconds * 1e6 for seconds in times] + [times[0] / times[2]])
+
+    print_table(["N", "lambda µs", "block µs", "block reuse µs", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import src.utility as utility
+from benchmarks.timing import best_of, print_table
+from src.colortransform import ColorTransform
+
+
+"""Image color transforms
+
+An affine (3x4) color matrix applied to every pixel of an (H, W, 3) uint8 image. "Per-pixel" is the original
+`np.apply_along_axis()` path of `experiments/color/shift.py`; "float32" is `ColorTransform.apply()` into a reused
+buffer; "uint8" is the fixed-point `ColorTransform.apply_uint8()`.
+"""
+
+
+def benchmark():
+    rng = np.random.default_rng(0)
+    matrix = np.array([[0.3, 0.6, 0.1, 10], [0.2, 0.7, 0.1, -5], [0.2, 0.1, 0.7, 0]])
+
+    color = ColorTransform()
+    color.register_transform(matrix, label="M")
+
+    rows = []
+    for height, width in ((64, 64), (405, 304), (4048, 3040)):
+        image = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        shifted = np.empty_like(image)
+        pixels = height * width
+
+        if pixels <= 64 * 64:
+            per_pixel = best_of(lambda: np.apply_along_axis(utility.transform(matrix), 2, image), repeat=3)
+        else:
+            # The per-pixel path takes minutes at this size.
+            per_pixel = float("nan")
+
+        floating = best_of(lambda: color.apply(image), repeat=3)
+        fixed = best_of(lambda: color.apply_uint8(image, out=shifted), repeat=3)
+
+        rows.append((f"{height}x{width}", per_pixel * 1e3, floating * 1e3, fixed * 1e3,
+                     pixels / floating / 1e6, pixels / fixed / 1e6))
+
+    print_table(["image", "per-pixel ms", "float32 ms", "uint8 ms", "float32 MPix/s", "uint8 MPix/s"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+
+import os
+
+import numpy as np
+
+import src.utility as utility
+from benchmarks.timing import best_of, print_table
+from src.colortransform import ColorTransform
+from src.executor import TileExecutor
+
+
+"""Parallel tile execution
+
+A 4x4 homogenous matrix applied to N 3D points, and an affine (3x4) color matrix applied to an (H, W, 3) uint8
+image, by `TileExecutor` thread and process pools of increasing size. Speedup is relative to the single-threaded
+`utility.apply_transform()` and `ColorTransform.apply_uint8()`.
+"""
+
+
+def benchmark():
+    rng = np.random.default_rng(0)
+    matrix = rng.standard_normal((4, 4))
+    points = rng.standard_normal((10 ** 7, 3))
+    points_out = np.empty_like(points)
+
+    color = ColorTransform()
+    color.register_transform(np.array([[0.3, 0.6, 0.1, 10], [0.2, 0.7, 0.1, -5], [0.2, 0.1, 0.7, 0]]), label="M")
+    image = rng.integers(0, 256, (4048, 3040, 3), dtype=np.uint8)
+    image_out = np.empty_like(image)
+
+    serial_points = best_of(lambda: utility.apply_transform(matrix, points, out=points_out), repeat=3)
+    serial_image = best_of(lambda: color.apply_uint8(image, out=image_out), repeat=3)
+
+    cores = os.cpu_count() or 1
+    counts = sorted({1, 2, 4, cores} | {count for count in (8, 16) if count <= cores})
+
+    rows = []
+    for processes in (False, True):
+        for workers in counts:
+            with TileExecutor(workers=workers, processes=processes) as executor:
+                pool_points = best_of(lambda: executor.apply_transform(matrix, points, out=points_out), repeat=3)
+                pool_image = best_of(lambda: executor.apply_color(color, image, out=image_out), repeat=3)
+
+            rows.append(("processes" if processes else "threads", workers, pool_points * 1e3,
+                         serial_points / pool_points, pool_image * 1e3, serial_image / pool_image))
+
+    print(f"{cores} CPUs; serial points {serial_points * 1e3:.4g} ms, serial image {serial_image * 1e3:.4g} ms")
+    print_table(["pool", "workers", "points ms", "points speedup", "image ms", "image speedup"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
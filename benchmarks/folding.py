@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+
+
+"""Constant folding
+
+A chain of N S×S matrices multiplied by `np.dot`, where only the first and middle matrices have mutators (as with a
+slider on each); the rest are constant. Each timed call mutates the first matrix and reads the coalesced matrix,
+with and without folding the constant runs into one matrix each.
+"""
+
+
+def chain(length, size, fold_constants):
+    rng = np.random.default_rng(0)
+    sequence = Sequence(fold_constants=fold_constants)
+
+    mutators = []
+    for index in range(length):
+        component = MutableMatrix(f"M{index}", np.identity(size) + rng.random((size, size)) / size)
+        if index in (0, length // 2):
+            mutators.append(component.get_mutator((0, 0)))
+        sequence.register_node(component, np.dot if index else None)
+
+    return sequence, mutators[0]
+
+
+def benchmark():
+    rows = []
+    for length in (8, 32, 128):
+        for size in (4, 64):
+            timings = []
+            for fold_constants in (False, True):
+                sequence, mutator = chain(length, size, fold_constants)
+                sequence.get_matrix()
+
+                def update():
+                    mutator(1)
+                    sequence.get_matrix()
+
+                timings.append(best_of(update, number=20))
+
+            rows.append((length, size, sequence.get_eliminated(), timings[0] * 1e6, timings[1] * 1e6,
+                         timings[0] / timings[1]))
+
+    print_table(["N", "S", "eliminated", "unfolded µs", "folded µs", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from matplotlib import figure
+
+import src.instrumentation as instrumentation
+from benchmarks.timing import best_of, print_table
+from src.instrumentation import Profiler
+from src.interactivesquare import InteractiveSquare
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+
+
+"""Instrumentation overhead
+
+Cost of recoalescing a chain of D 3x3 matrices after mutating its first component, and of updating an interactive
+square through such a chain, with profiling disabled and enabled. "check" is the cost of the `get_profiler()` call
+which is all that instrumented code pays per call while disabled.
+"""
+
+
+def benchmark(number=2000):
+    check = best_of(instrumentation.get_profiler, number=100000)
+
+    rows = []
+    for depth in (1, 8, 32):
+        sequence = Sequence()
+        for link in range(depth):
+            sequence.register_node(MutableMatrix(f"M{link}", np.identity(3)), np.dot if link else None)
+        mutate = sequence.get_node(0).get_component().get_mutator((0, 1))
+
+        square = InteractiveSquare(figure.Figure().add_subplot(), (0, 0), add_coords=(1,))
+        square.register_transform(sequence)
+
+        def coalesce():
+            mutate(0.5)
+            sequence.get_matrix()
+
+        def update():
+            mutate(0.5)
+            square._update_patch()
+
+        for name, func in (("coalesce", coalesce), ("update", update)):
+            disabled = best_of(func, number=number)
+            with Profiler(max_events=0):
+                enabled = best_of(func, number=number)
+
+            rows.append((name, depth, disabled * 1e6, enabled * 1e6, enabled / disabled))
+
+    print(f"check: {check * 1e9:.4g} ns")
+    print_table(["", "depth", "disabled µs", "enabled µs", "ratio"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
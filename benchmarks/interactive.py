@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+
+import numpy as np
+from matplotlib import patches, widgets
+
+import src.style as style
+import src.utility as utility
+from benchmarks.timing import print_table
+from experiments.matrix import projection
+from src.blitmanager import BlitManager
+from src.headless import create_figure, drive_sliders
+from src.interactivesquare import InteractiveSquare
+from src.mutablematrix import MutableMatrix
+
+
+"""Interactive frame rate
+
+One slider driven through F values, headlessly (Agg canvas), updating N squares which each coalesce a chain of D
+2x2 matrices. Prints the mean milliseconds per frame of each stage, and frames per second. Then drives the nine
+sliders of the projection experiment.
+
+Finally compares redrawing the whole figure with blitting (see `BlitManager`) N squares with vertex labels over a
+static background of gray baseline squares and a grid.
+"""
+
+STAGES = ("mutate", "coalesce", "transform", "convert", "patch", "draw")
+
+
+def _drive(figure, artists, sliders, frames, redraw=None):
+    values = {slider: np.linspace(slider.valmin, slider.valmax, frames) for slider in sliders}
+    results = drive_sliders(figure, artists, values, redraw=redraw)
+    return [results.get(stage, 0.0) * 1e3 for stage in STAGES] + [results["fps"]]
+
+
+def _blitting(shapes, frames, blit):
+    figure = create_figure()
+    axes = figure.add_subplot(10, 1, (1, 9))
+    axes.grid(True)
+    slider = widgets.Slider(figure.add_subplot(10, 1, 10), "θ", 0, 1, valinit=0)
+
+    squares = []
+    for index in range(shapes):
+        origin = (2 * (index % 10), 2 * (index // 10))
+        axes.add_patch(patches.Polygon(utility.square(origin), **style.gray))
+
+        square = InteractiveSquare(axes, origin, label_vertices=True, style=style.blue)
+        square.register_transform(MutableMatrix("M", np.identity(2)))
+        square.register_slider(0, (0, 1), slider)
+        squares.append(square)
+
+    axes.set_xlim(-2, 20)
+    axes.set_ylim(-2, 2 * ((shapes - 1) // 10) + 2)
+
+    redraw = None
+    if blit:
+        manager = BlitManager(figure.canvas)
+        for square in squares:
+            manager.add_interactive(square)
+        manager.add_slider(slider, redraw=False)
+        redraw = manager.update
+
+    figure.canvas.draw()
+    return _drive(figure, squares, [slider], frames, redraw)
+
+
+def benchmark(frames=50):
+    rows = []
+    for shapes in (1, 10, 100):
+        for depth in (1, 4, 16):
+            figure = create_figure()
+            axes = figure.add_subplot(10, 1, (1, 9))
+            slider = widgets.Slider(figure.add_subplot(10, 1, 10), "θ", 0, 1, valinit=0)
+
+            squares = []
+            for index in range(shapes):
+                square = InteractiveSquare(axes, (index % 10, index // 10))
+                for link in range(depth):
+                    square.register_transform(MutableMatrix(f"M{link}", np.identity(2)))
+                square.register_slider(0, (0, 1), slider)
+                squares.append(square)
+
+            rows.append([shapes, depth] + _drive(figure, squares, [slider], frames))
+
+    figure = create_figure()
+    square, sliders = projection.build(figure)
+    rows.append(["projection", 9] + _drive(figure, [square], sliders, frames))
+
+    print_table(["shapes", "depth"] + [f"{stage} ms" for stage in STAGES] + ["fps"], rows)
+    print()
+
+    rows = []
+    for shapes in (1, 10, 100):
+        for blit in (False, True):
+            rows.append([shapes, "blit" if blit else "full"] + _blitting(shapes, frames, blit))
+
+    print_table(["shapes", "redraw"] + [f"{stage} ms" for stage in STAGES] + ["fps"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,45 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+
+
+"""Sequence labels
+
+Labels of a sequence of N nodes, each a nested sequence of 4 matrices. "first" builds the label from scratch (as
+every call did before labels were cached); "cached" reads it again after it was built.
+"""
+
+
+def nested(width):
+    sequence = Sequence()
+    for index in range(width):
+        inner = Sequence()
+        for link in range(4):
+            inner.register_node(MutableMatrix(f"M{index}_{link}", np.identity(2)), np.dot if link else None)
+        sequence.register_node(inner, np.dot if index else None)
+
+    return sequence
+
+
+def benchmark():
+    rows = []
+    for width in (4, 64, 1024):
+        # Each timed call labels a sequence which was never labelled.
+        sequences = iter([nested(width) for _ in range(5)])
+        first = best_of(lambda: next(sequences).get_label(), repeat=5)
+
+        sequence = nested(width)
+        sequence.get_label()
+        cached = best_of(sequence.get_label, number=1000)
+
+        rows.append((width, first * 1e6, cached * 1e6))
+
+    print_table(["N", "first µs", "cached µs"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
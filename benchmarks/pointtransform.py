@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import src.utility as utility
+from benchmarks.timing import best_of, print_table
+
+
+"""Point transform scaling
+
+Compares the per-point `np.apply_along_axis(utility.transform(...))` path against the batched
+`utility.apply_transform()` for a 4x4 homogenous matrix applied to N 3D points.
+"""
+
+
+def benchmark():
+    rng = np.random.default_rng(0)
+    matrix = rng.standard_normal((4, 4))
+
+    rows = []
+    for exponent in range(2, 8):
+        count = 10 ** exponent
+
+        for dtype in (np.float64, np.float32):
+            points = rng.standard_normal((count, 3)).astype(dtype)
+            out = np.empty_like(points)
+
+            batched = best_of(lambda: utility.apply_transform(matrix, points, out=out))
+
+            if count <= 10 ** 4:
+                per_point = best_of(lambda: np.apply_along_axis(utility.transform(matrix), 1, points), repeat=3)
+                speedup = per_point / batched
+            else:
+                # The per-point path takes minutes at this size.
+                per_point = speedup = float("nan")
+
+            rows.append((count, np.dtype(dtype).name, per_point * 1e3, batched * 1e3, count / batched / 1e6, speedup))
+
+    print_table(["N", "dtype", "per-point ms", "batched ms", "batched Mpts/s", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+
+import functools
+
+import numpy as np
+
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+
+
+"""Sequence prefix cache
+
+Chains of N 4x4 rotations where one slider mutates a single leaf. Without caching every evaluation folds the whole
+chain (N - 1 matmuls); with prefix caching only the nodes from the mutated leaf onward are coalesced again. Finding
+the mutated leaf still checks the version of every node before it.
+"""
+
+
+def chain(depth):
+    sequence = Sequence()
+    components = []
+    for index in range(depth):
+        component = MutableMatrix(f"R{index}", np.identity(4))
+        sequence.register_node(component, np.dot)
+        components.append(component)
+
+    return sequence, components
+
+
+def uncached(components):
+    return functools.reduce(np.dot, (component.get_matrix() for component in components))
+
+
+def benchmark():
+    rows = []
+    for depth in (8, 64, 512, 4096):
+        sequence, components = chain(depth)
+
+        full = best_of(lambda: uncached(components), repeat=5, number=10)
+
+        for position in (0, depth // 2, depth - 1):
+            mutate = components[position].get_mutator((0, 1))
+            value = iter(range(10 ** 9))
+
+            def update():
+                mutate(next(value))
+                return sequence.get_matrix()
+
+            cached = best_of(update, repeat=5, number=10)
+            rows.append((depth, position, depth - position, full * 1e6, cached * 1e6, full / cached))
+
+    print_table(["chain", "mutated", "suffix", "uncached µs", "cached µs", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
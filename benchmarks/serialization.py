@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+
+import numpy as np
+
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.serialization import load_sequence, save_sequence
+
+
+"""Sequence serialization
+
+A library of N sequences, each a chain of 8 4x4 matrices, built in Python (as experiments do), saved, then loaded
+memory-mapped (the default) and into memory. "first matrix" is the time to coalesce every sequence once after a
+memory-mapped load.
+"""
+
+
+def library(count, rng):
+    root = Sequence()
+    for index in range(count):
+        chain = Sequence()
+        for link in range(8):
+            matrix = rng.standard_normal((4, 4))
+            chain.register_node(MutableMatrix(f"M{index}_{link}", matrix), np.dot if link else None)
+        root.register_node(chain, np.add if index else None)
+
+    return root
+
+
+def benchmark():
+    rng = np.random.default_rng(0)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as directory:
+        for count in (10, 100, 1000):
+            path = os.path.join(directory, str(count))
+
+            built = best_of(lambda: library(count, rng), repeat=3)
+            sequence = library(count, rng)
+            saved = best_of(lambda: save_sequence(sequence, path), repeat=3)
+            mapped = best_of(lambda: load_sequence(path), repeat=3)
+            loaded = best_of(lambda: load_sequence(path, mmap_mode=None), repeat=3)
+            first = best_of(lambda: load_sequence(path).get_matrix(), repeat=3) - mapped
+
+            rows.append((count, built * 1e3, saved * 1e3, mapped * 1e3, loaded * 1e3, max(first, 0.0) * 1e3))
+
+    print_table(["N", "build ms", "save ms", "load mmap ms", "load ms", "first matrix ms"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
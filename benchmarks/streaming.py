@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.timing import print_table
+from src.colortransform import ColorTransform
+from src.streaming import iter_strips, open_image, transform_image
+
+
+"""Streaming image transforms
+
+An affine (3x4) color matrix applied to a memory-mapped (H, W, 3) uint8 .npy image, written to a memory-mapped .npy
+image a strip of rows at a time. Peak memory is the peak traced by `tracemalloc` during the transform, which bounds
+the strip buffers but not the pages of the memory-mapped files (which the operating system may evict).
+"""
+
+
+def benchmark(height=8192, width=8192):
+    matrix = np.array([[0.3, 0.6, 0.1, 10], [0.2, 0.7, 0.1, -5], [0.2, 0.1, 0.7, 0]])
+    rng = np.random.default_rng(0)
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "source.npy")
+        destination = os.path.join(directory, "destination.npy")
+
+        image = open_image(source, "w+", (height, width, 3), np.uint8)
+        for rows in iter_strips(height, 256):
+            image[rows] = rng.integers(0, 256, image[rows].shape, dtype=np.uint8)
+        image.flush()
+        del image
+
+        pixels = height * width
+
+        rows = []
+        for strip_pixels in (1 << 16, 1 << 20, 1 << 24):
+            # A new transform per run, so its scratch buffers are included in the peak.
+            color = ColorTransform()
+            color.register_transform(matrix, label="M")
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            transform_image(color, source, destination, strip_pixels=strip_pixels)
+            elapsed = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            rows.append((f"{height}x{width}", strip_pixels, pixels * 3 / 2 ** 20, peak / 2 ** 20, elapsed,
+                         pixels / elapsed / 1e6))
+
+    print_table(["image", "strip pixels", "image MiB", "peak MiB", "seconds", "MPix/s"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+import src.structures as structures
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+
+
+"""Structured components
+
+A chain of a dense S×S matrix followed by 8 matrices of one structure, each with a mutator handed out (as with a
+slider at rest), so none are folded. Each timed call mutates the dense matrix and reads the coalesced matrix, which
+multiplies by all 8 matrices again. "dense" is the same chain with dense matrices instead. "detect" is the cost of
+detecting the structure of one matrix, paid once per mutation of a structured matrix.
+"""
+
+
+def chain(matrices):
+    sequence = Sequence()
+
+    first = MutableMatrix("A", np.random.default_rng(0).random(matrices[0].shape))
+    sequence.register_node(first, None)
+
+    for index, matrix in enumerate(matrices):
+        component = MutableMatrix(f"M{index}", matrix)
+        component.get_mutator((0, 0))
+        sequence.register_node(component, np.dot)
+
+    return sequence, first.get_mutator((0, 0))
+
+
+def time_update(sequence, mutator):
+    def update():
+        mutator(1)
+        sequence.get_matrix()
+
+    sequence.get_matrix()
+    return best_of(update, number=20)
+
+
+def benchmark():
+    rng = np.random.default_rng(1)
+
+    rows = []
+    for size in (4, 64, 256):
+        dense = time_update(*chain([rng.random((size, size)) for _ in range(8)]))
+
+        for matrix in (np.identity(size), np.diag(rng.random(size) + 1), np.identity(size)[rng.permutation(size)]):
+            structured = time_update(*chain([matrix] * 8))
+            detect = best_of(lambda: structures.detect_structure(matrix), number=20)
+
+            rows.append((size, structures.detect_structure(matrix), dense * 1e6, structured * 1e6, dense / structured,
+                         detect * 1e6))
+
+    print_table(["S", "structure", "dense µs", "structured µs", "speedup", "detect µs"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
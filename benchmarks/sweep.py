@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+
+import math
+
+import numpy as np
+
+import src.coalescers as coalescers
+import src.utility as utility
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.sweep import sweep
+from src.transforms import EulerRotation
+
+
+"""Parameter sweeps
+
+K evaluations of a K·[R|T; B] projection chain for swept rotation angles and translation, transforming a square of
+P vertices each time. "Mutators" drives the components one value at a time, as sliders do; "sweep" evaluates all K
+at once with `sweep()`.
+"""
+
+
+def benchmark():
+    K = MutableMatrix("K", [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]])
+    R = EulerRotation("R", axes="zyx")
+    T = MutableMatrix("T", [[0, 0, 1]])
+    B = MutableMatrix("B", [[0, 0, 0, 1]])
+
+    RT = Sequence()
+    RT.register_node(R, None)
+    RT.register_node(T, coalescers.append_column)
+    RT.register_node(B, coalescers.concatenate_rows)
+
+    sequence = Sequence()
+    sequence.register_node(K, None)
+    sequence.register_node(RT, np.dot)
+
+    slots = [((1, 0), 0, math.radians), ((1, 0), 1, math.radians), ((1, 1), (0, 2))]
+    mutators = [R.get_mutator(0, math.radians), R.get_mutator(1, math.radians), T.get_mutator((0, 2))]
+    points = utility.square((0, 0), 1, add_coords=(0, 1))
+
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for count in (10, 1000, 10000):
+        values = rng.uniform(0, 90, (count, len(slots)))
+
+        def mutate():
+            for row in values:
+                for mutator, value in zip(mutators, row):
+                    mutator(value)
+                utility.apply_transform(sequence.get_matrix(), points)
+
+        def swept():
+            return sweep(sequence, slots, values, points=points)
+
+        mutated = best_of(mutate, repeat=3)
+        swept = best_of(swept, repeat=3)
+
+        rows.append((count, mutated * 1e3, swept * 1e3, mutated / swept))
+
+    print_table(["K", "mutators ms", "sweep ms", "speedup"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
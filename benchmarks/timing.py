@@ -0,0 +1,46 @@
+import timeit
+import typing
+
+
+def best_of(func: typing.Callable[[], typing.Any], repeat: int = 5, number: int = 1) -> float:
+    """Returns the best time, in seconds, of `repeat` runs of `number` calls to `func` divided by `number`
+
+    Parameters
+    ----------
+    func : typing.Callable[[], typing.Any]
+        Function to time.
+
+    repeat : int, optional
+        Number of timing runs, by default 5.
+
+    number : int, optional
+        Number of calls per timing run, by default 1.
+
+    Returns
+    -------
+    float
+        Seconds per call.
+
+    """
+    return min(timeit.repeat(func, repeat=repeat, number=number)) / number
+
+
+def print_table(headers: typing.Sequence[str], rows: typing.Iterable[typing.Sequence]):
+    """Print `rows` as a right-aligned text table with `headers`
+
+    Parameters
+    ----------
+    headers : typing.Sequence[str]
+        Column headers.
+
+    rows : typing.Iterable[typing.Sequence]
+        Table rows. Floats are printed with 4 significant digits.
+
+    """
+    cells = [list(headers)]
+    for row in rows:
+        cells.append([f"{value:.4g}" if isinstance(value, float) else str(value) for value in row])
+
+    widths = [max(len(row[column]) for row in cells) for column in range(len(headers))]
+    for row in cells:
+        print("  ".join(cell.rjust(width) for cell, width in zip(row, widths)))
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+
+import numpy as np
+
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.treesequence import TreeSequence
+
+
+"""Segment tree sequence
+
+Chains of N 4x4 matrices where one slider mutates the node in the middle of the chain. `Sequence` coalesces the
+suffix after the mutated node (N / 2 matmuls), `TreeSequence` coalesces its path to the root (log2 N matmuls).
+Mutators push their changes into the segment trees, so "read" times reading the matrix of the unchanged
+`TreeSequence`, which neither checks versions nor multiplies, and stays flat as N grows.
+"""
+
+
+def chain(sequence, depth):
+    components = []
+    for index in range(depth):
+        component = MutableMatrix(f"R{index}", np.identity(4))
+        sequence.register_node(component, np.dot)
+        components.append(component)
+
+    return components
+
+
+def benchmark():
+    rows = []
+    for depth in (8, 64, 512, 4096):
+        timings = []
+        for sequence in (Sequence(), TreeSequence()):
+            components = chain(sequence, depth)
+            sequence.get_matrix()
+
+            mutate = components[depth // 2].get_mutator((0, 1))
+            value = iter(range(10 ** 9))
+
+            def update():
+                mutate(next(value))
+                return sequence.get_matrix()
+
+            timings.append(best_of(update, repeat=5, number=10))
+
+        read = best_of(sequence.get_matrix, repeat=5, number=10)
+
+        flat, tree = timings
+        rows.append((depth, flat * 1e6, tree * 1e6, flat / tree, read * 1e6))
+
+    print_table(["chain", "Sequence µs", "TreeSequence µs", "speedup", "read µs"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
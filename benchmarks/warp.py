@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+
+import math
+
+import numpy as np
+
+from benchmarks.timing import best_of, print_table
+from src.mutablematrix import MutableMatrix
+from src.transforms import EulerRotation
+from src.warp import ImageWarp
+
+
+"""Image warping
+
+A rotation and perspective tilt of an (H, W, 3) uint8 image, re-warped after every change of the rotation angle as
+a slider would. Frame rate is the warp alone, without drawing.
+"""
+
+
+def benchmark():
+    rng = np.random.default_rng(0)
+
+    rows = []
+    for height, width in ((405, 304), (1080, 1920), (4048, 3040)):
+        image = rng.integers(0, 256, (height, width, 3), dtype=np.uint8)
+        warped = np.empty_like(image)
+
+        for interpolation in ("nearest", "bilinear"):
+            rotation = EulerRotation("R", axes="zyx")
+            mutate = rotation.get_mutator(0, math.radians)
+
+            warp = ImageWarp(interpolation=interpolation)
+            warp.register_transform(rotation)
+            warp.register_transform(MutableMatrix("P", [[1, 0, 0], [0, 1, 0], [0.0002, 0.0001, 1]]))
+
+            def frame():
+                mutate(10)
+                warp.apply(image, out=warped)
+
+            seconds = best_of(frame, repeat=3)
+            rows.append((f"{height}x{width}", interpolation, seconds * 1e3, 1 / seconds,
+                         height * width / seconds / 1e6))
+
+    print_table(["image", "interpolation", "ms", "frames/s", "MPix/s"], rows)
+
+
+if __name__ == "__main__":
+    benchmark()
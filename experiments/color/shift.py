@@ -1,28 +1,59 @@
 #!/usr/bin/env python3
 
 import numpy as np
-from matplotlib import image, pyplot
+from matplotlib import image, pyplot, widgets
 
+from src.colortransform import ColorTransform
+from src.lut import ColorLookup, gamma
+from src.mutablematrix import MutableMatrix
+from src.updatescheduler import UpdateScheduler
 
-def shift(red: int, green: int, blue: int):
-    scalars = np.array([red, green, blue])
 
-    def func(rgb: np.array):
-        rgb[:] = np.multiply(rgb, scalars)
-
-    return func
+def shift(red: float, green: float, blue: float) -> MutableMatrix:
+    return MutableMatrix("shift", np.diag([red, green, blue]))
 
 
 def experiment():
-    trees = "resource/smaller.jpg"
-    trees = np.array(image.imread(trees), dtype=float)
+    trees = "resource/Larix_decidua_Aletschwald.jpg"
+    trees = np.ascontiguousarray(image.imread(trees))
+
+    scalars = shift(0.8, 0.5, 1.2)
+
+    color = ColorTransform()
+    color.register_transform(scalars)
+
+    lookup = ColorLookup()
+    curve = lookup.register_modifier(gamma, parameters=(1,))
+
+    figure, axes = pyplot.subplots()
+    pyplot.subplots_adjust(bottom=0.3)
+    scheduler = UpdateScheduler(figure.canvas)
+
+    shifted = np.empty_like(trees)
+
+    def shift_image():
+        color.apply_uint8(trees, out=shifted)
+        return lookup.apply(shifted, out=shifted)
+
+    artist = axes.imshow(shift_image())
+
+    def update():
+        artist.set_data(shift_image())
 
-    np.apply_along_axis(shift(0.8, 0.5, 1.2), 2, trees)
+    sliders = []
+    for channel, name in enumerate(("Red", "Green", "Blue")):
+        slider_axes = pyplot.axes([0.25, 0.15 - channel * 0.05, 0.5, 0.03])
+        slider = widgets.Slider(slider_axes, name, 0, 2, valinit=scalars.get_matrix()[channel, channel])
+        slider.on_changed(scalars.get_mutator((channel, channel)))
+        slider.on_changed(lambda _: scheduler.schedule(update))
+        sliders.append(slider)
 
-    trees = trees.astype(int)
+    slider_axes = pyplot.axes([0.25, 0.2, 0.5, 0.03])
+    slider = widgets.Slider(slider_axes, "Gamma", 0.2, 3, valinit=1)
+    slider.on_changed(lookup.get_mutator(curve))
+    slider.on_changed(lambda _: scheduler.schedule(update))
+    sliders.append(slider)
 
-    # print(trees)
-    pyplot.imshow(trees)
     pyplot.show()
 
 
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+
+import math
+
+import numpy as np
+from matplotlib import image, pyplot, widgets
+
+from src.mutablematrix import MutableMatrix
+from src.transforms import EulerRotation, Translation
+from src.updatescheduler import UpdateScheduler
+from src.warp import ImageWarp
+
+
+def experiment():
+    trees = "resource/smaller.jpg"
+    trees = np.ascontiguousarray(image.imread(trees))
+    height, width = trees.shape[:2]
+
+    # Rotate and tilt about the image center: C · R · P · C⁻¹
+    # The third coordinate is homogenous, so a rotation about z is a 2D rotation.
+    rotation = EulerRotation("R", axes="zyx")
+    perspective = MutableMatrix("P", np.identity(3))
+
+    warp = ImageWarp()
+    warp.register_transform(Translation("C", (width / 2, height / 2)))
+    warp.register_transform(rotation)
+    warp.register_transform(perspective)
+    warp.register_transform(Translation("C⁻¹", (-width / 2, -height / 2)))
+
+    figure, axes = pyplot.subplots()
+    pyplot.subplots_adjust(bottom=0.25)
+    scheduler = UpdateScheduler(figure.canvas)
+
+    warped = np.empty_like(trees)
+    artist = axes.imshow(warp.apply(trees, out=warped))
+    axes.set_title(warp.get_label())
+
+    def update():
+        artist.set_data(warp.apply(trees, out=warped))
+
+    controls = (
+        ("Rotation", -180, 180, rotation.get_mutator(0, math.radians)),
+        ("Tilt x", -0.002, 0.002, perspective.get_mutator((2, 0))),
+        ("Tilt y", -0.002, 0.002, perspective.get_mutator((2, 1)))
+    )
+
+    sliders = []
+    for index, (name, minimum, maximum, mutator) in enumerate(controls):
+        slider_axes = pyplot.axes([0.25, 0.15 - index * 0.05, 0.5, 0.03])
+        slider = widgets.Slider(slider_axes, name, minimum, maximum, valinit=0)
+        slider.on_changed(mutator)
+        slider.on_changed(lambda _: scheduler.schedule(update))
+        sliders.append(slider)
+
+    pyplot.show()
+
+
+if __name__ == "__main__":
+    experiment()
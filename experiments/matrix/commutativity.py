@@ -6,6 +6,7 @@ from matplotlib import image, patches, pyplot, widgets
 import src.style as style
 import src.utility as utility
 from src.interactivesquare import InteractiveSquare
+from src.mutablematrix import MutableMatrix
 
 
 """Commutativity experiments
@@ -56,7 +57,9 @@ def experiment():
     T = np.dot(Y, X)  # YXv -> Shear horizontally, then vertically
     T_ = np.dot(X.T, Y.T)  # YXv --> v'X'Y'
 
-    blue = InteractiveSquare(origin, style=style.blue, transform_matrix=X)
+    blue = InteractiveSquare(ax, origin, style=style.blue)
+    blue.register_transform(X, label="X")
+    blue.register_transform(MutableMatrix("Y", Y))  # Shear scale set by the slider
     red = utility.apply_transform(T, red)  # YXv
     green = utility.apply_transform(T_, green, row_vector=True)  # v'X'Y'
     purple = utility.apply_transform(T.transpose(), purple, row_vector=True)  # v'(YX)'
@@ -65,14 +68,12 @@ def experiment():
     ax.add_patch(patches.Polygon(gray, **style.gray))
     ax.add_patch(patches.Polygon(red, **style.red))
     ax.add_patch(patches.Polygon(green, **style.green))
-    ax.add_patch(blue.get_patch())
     ax.add_patch(patches.Polygon(purple, **style.purple))
 
     shear_ax_blue = fig.add_axes([0.1, 0.05, 0.8, 0.025])
     ax.add_child_axes(shear_ax_blue)
 
-    slider = widgets.Slider(shear_ax_blue, "Shear Scale", 0, 1, 0.5)
-    #blue.register_slider(0, (0, 1), slider)
+    slider = widgets.Slider(shear_ax_blue, "Shear Scale", 0, 1, valinit=0.5)
     blue.register_slider(1, (1, 0), slider)
     blue._update_patch()
 
@@ -7,14 +7,34 @@ import numpy as np
 from matplotlib import gridspec, image, patches, pyplot, ticker, widgets
 from numpy.linalg import norm
 
+import src.coalescers as coalescers
 import src.style as style
 import src.utility as utility
+from src.blitmanager import BlitManager
 from src.interactivesquare import InteractiveSquare
 from src.mutablematrix import MutableMatrix
 from src.sequence import Sequence
+from src.transforms import EulerRotation
+from src.updatescheduler import UpdateScheduler
 
 
-def experiment():
+def build(figure, scheduler=None):
+    """Build the projection experiment on `figure`.
+
+    Parameters
+    ----------
+    figure : matplotlib.figure.Figure
+        Figure to build on.
+
+    scheduler : UpdateScheduler, optional
+        Scheduler of the interactive square's updates, by default None.
+
+    Returns
+    -------
+    typing.Tuple[InteractiveSquare, typing.List[widgets.Slider]]
+        Interactive (green) square, and its sliders.
+
+    """
     # TODO: When is M^-1 =/= M^T?
 
     # TODO: Calculate distance from the camera at every pixel, and tint pixel to be lighter the farther it is from the camera.
@@ -22,9 +42,8 @@ def experiment():
     viewport_ratio = 4  # 3/4 rows for viewport, 1/4 rows for sliders
     num_sliders = 6
 
-    figure: pyplot.Figure = pyplot.figure()
     grid: pyplot.GridSpec = gridspec.GridSpec(viewport_ratio, 1, figure=figure)
-    axes: pyplot.Axes = pyplot.subplot(grid[:viewport_ratio - 1, :])
+    axes: pyplot.Axes = figure.add_subplot(grid[:viewport_ratio - 1, :])
 
     sliders = gridspec.GridSpecFromSubplotSpec(num_sliders, 2, grid[-1, :], wspace=0.4)
 
@@ -48,82 +67,92 @@ def experiment():
         [0, 0, 1, 0]   # [0  0  1  0]
     ], dtype=float)
 
-    Rx = np.identity(3, dtype=float)  # Extrinsic parameter matrix
-    Ry = np.identity(3, dtype=float)  # [R,3x3 T,3x1]
-    Rz = np.identity(3, dtype=float)  # [0,1x3     1]
+    R = EulerRotation("R", axes="zyx")  # Extrinsic parameter matrix
+                                        # [R,3x3 T,3x1]
+                                        # [0,1x3     1]
     T = np.array([[0, 0, 0]], dtype=float)
     B = np.array([[0, 0, 0, 1]], dtype=float)
 
     green = InteractiveSquare(axes, (0, 0), 1, (0, 1), style=style.green,
-                              convert_2d=utility.from_homogenous, label_vertices=True)
+                              convert_2d=utility.from_homogenous, label_vertices=True, scheduler=scheduler)
 
     green.register_transform(K, label="K")
 
-    # Rx, Ry, Rz, T, B must be resolved before K can dot it.
+    # R (= Rz·Ry·Rx), T, B must be resolved before K can dot it.
     RT = Sequence()
-    RT.register_node(MutableMatrix("Rz", Rz), None)
-    RT.register_node(MutableMatrix("Ry", Ry), np.dot)
-    RT.register_node(MutableMatrix("Rx", Rx), np.dot)
-    RT.register_node(MutableMatrix("T", T), lambda a, b: np.concatenate((a, b.T), axis=1))
-    RT.register_node(MutableMatrix("B", B), lambda a, b: np.concatenate((a, b), axis=0))
+    RT.register_node(R, None)
+    RT.register_node(MutableMatrix("T", T), coalescers.append_column)
+    RT.register_node(MutableMatrix("B", B), coalescers.concatenate_rows)
     green.register_transform(RT)
 
     # TODO: Do not register sliders to x, y, z angles. Register them to yaw (α), pitch (β), and roll (γ).
     #       Would need to register matrices/sliders with functions to calculate world rotations so that
     #       yaw, pitch, roll are valid--need to convert from intrinsic to extrinsic angles.
 
+    # Each slider sets one angle of R; its sine and cosine are evaluated once per change.
+
     # Yaw (α)
-    slider_1 = widgets.Slider(pyplot.subplot(sliders[0, 0]), "Rotate: α", 0, 360, 0, **style.darkgreen)
-    green.register_slider((1, 0), (0, 0), slider_1, lambda v: math.cos(math.radians(v)))
-    green.register_slider((1, 0), (0, 1), slider_1, lambda v: (-1 * math.sin(math.radians(v))))
-    green.register_slider((1, 0), (1, 0), slider_1, lambda v: math.sin(math.radians(v)))
-    green.register_slider((1, 0), (1, 1), slider_1, lambda v: math.cos(math.radians(v)))
+    slider_1 = widgets.Slider(figure.add_subplot(sliders[0, 0]), "Rotate: α", 0, 360, valinit=0, **style.darkgreen)
+    green.register_slider((1, 0), 0, slider_1, math.radians)
 
     # Pitch (β)
-    slider_2 = widgets.Slider(pyplot.subplot(sliders[1, 0]), "Rotate: β", 0, 360, 0, **style.darkgreen)
-    green.register_slider((1, 1), (0, 0), slider_2, lambda v: math.cos(math.radians(v)))
-    green.register_slider((1, 1), (0, 2), slider_2, lambda v: math.sin(math.radians(v)))
-    green.register_slider((1, 1), (2, 0), slider_2, lambda v: (-1 * math.sin(math.radians(v))))
-    green.register_slider((1, 1), (2, 2), slider_2, lambda v: math.cos(math.radians(v)))
+    slider_2 = widgets.Slider(figure.add_subplot(sliders[1, 0]), "Rotate: β", 0, 360, valinit=0, **style.darkgreen)
+    green.register_slider((1, 0), 1, slider_2, math.radians)
 
     # Roll (γ)
-    slider_3 = widgets.Slider(pyplot.subplot(sliders[2, 0]), "Rotate: γ", 0, 360, 0, **style.darkgreen)
-    green.register_slider((1, 2), (1, 1), slider_3, lambda v: math.cos(math.radians(v)))
-    green.register_slider((1, 2), (1, 2), slider_3, lambda v: (-1 * math.sin(math.radians(v))))
-    green.register_slider((1, 2), (2, 1), slider_3, lambda v: math.sin(math.radians(v)))
-    green.register_slider((1, 2), (2, 2), slider_3, lambda v: math.cos(math.radians(v)))
+    slider_3 = widgets.Slider(figure.add_subplot(sliders[2, 0]), "Rotate: γ", 0, 360, valinit=0, **style.darkgreen)
+    green.register_slider((1, 0), 2, slider_3, math.radians)
 
     # Focal length
-    slider_4 = widgets.Slider(pyplot.subplot(sliders[3, 0]), "Focal:", 0, 2, 0, **style.darkgreen)
+    slider_4 = widgets.Slider(figure.add_subplot(sliders[3, 0]), "Focal:", 0, 2, valinit=0, **style.darkgreen)
     green.register_slider(0, (1, 0), slider_4)
     green.register_slider(0, (0, 1), slider_4)
 
     # Princible point x component
-    slider_5 = widgets.Slider(pyplot.subplot(sliders[4, 0]), "PPx:", -5, 5, 0, **style.darkgreen)
+    slider_5 = widgets.Slider(figure.add_subplot(sliders[4, 0]), "PPx:", -5, 5, valinit=0, **style.darkgreen)
     green.register_slider(0, (0, 2), slider_5)
 
     # Principle point y component
-    slider_6 = widgets.Slider(pyplot.subplot(sliders[5, 0]), "PPy:", -5, 5, 0, **style.darkgreen)
+    slider_6 = widgets.Slider(figure.add_subplot(sliders[5, 0]), "PPy:", -5, 5, valinit=0, **style.darkgreen)
     green.register_slider(0, (1, 2), slider_6)
 
     # World origin x component
-    slider_7 = widgets.Slider(pyplot.subplot(sliders[0, 1]), "Tx", -5, 5, 0, **style.darkgreen)
-    green.register_slider((1, 3), (0, 0), slider_7)
+    slider_7 = widgets.Slider(figure.add_subplot(sliders[0, 1]), "Tx", -5, 5, valinit=0, **style.darkgreen)
+    green.register_slider((1, 1), (0, 0), slider_7)
 
     # World origin y component
-    slider_8 = widgets.Slider(pyplot.subplot(sliders[1, 1]), "Ty", -5, 5, 0, **style.darkgreen)
-    green.register_slider((1, 3), (0, 1), slider_8)
+    slider_8 = widgets.Slider(figure.add_subplot(sliders[1, 1]), "Ty", -5, 5, valinit=0, **style.darkgreen)
+    green.register_slider((1, 1), (0, 1), slider_8)
 
     # World origin z component
-    slider_9 = widgets.Slider(pyplot.subplot(sliders[2, 1]), "Tz", -5, 5, 1, **style.darkgreen)
-    green.register_slider((1, 3), (0, 2), slider_9)
+    slider_9 = widgets.Slider(figure.add_subplot(sliders[2, 1]), "Tz", -5, 5, valinit=1, **style.darkgreen)
+    green.register_slider((1, 1), (0, 2), slider_9)
 
     logging.info(green.get_label())
 
     axes.relim()
     axes.autoscale_view()
 
-    pyplot.tight_layout()
+    figure.tight_layout()
+
+    return green, [slider_1, slider_2, slider_3, slider_4, slider_5, slider_6, slider_7, slider_8, slider_9]
+
+
+def experiment():
+    figure: pyplot.Figure = pyplot.figure()
+
+    # Several sliders mutate the same square; update it at most once per frame, redrawing only the square, its
+    # labels and the sliders over the cached background.
+    manager = BlitManager(figure.canvas)
+    scheduler = UpdateScheduler(figure.canvas, redraw=manager.update)
+
+    # Keep a reference to the sliders so they remain responsive.
+    green, sliders = build(figure, scheduler)
+
+    manager.add_interactive(green)
+    for slider in sliders:
+        manager.add_slider(slider, redraw=False)
+
     pyplot.show()
 
 
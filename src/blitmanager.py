@@ -0,0 +1,114 @@
+class BlitManager:
+    """Redraws only animated artists over a cached background, instead of redrawing the whole figure.
+
+    Artists added to the manager are marked animated, so full figure draws skip them. After every full draw (e.g. the
+    first draw, or a resize) the manager caches the rendered background (axes, grid, static patches) and draws the
+    animated artists over it. `update()` then restores the background, draws only the animated artists, and blits the
+    figure to the screen.
+
+    Sliders added to the manager stop requesting full redraws; their axes are animated instead, so they are redrawn
+    with every update.
+
+    Parameters
+    ----------
+    canvas : matplotlib.backend_bases.FigureCanvasBase
+        Canvas to draw on. Backends without blitting (e.g. Agg) still render updates into their buffer.
+
+    Example
+    -------
+    ```python
+    manager = BlitManager(figure.canvas)
+    scheduler = UpdateScheduler(figure.canvas, redraw=manager.update)
+
+    square = InteractiveSquare(axes, origin, label_vertices=True, scheduler=scheduler)
+    square.register_slider(0, (0, 0), slider)
+
+    manager.add_interactive(square)
+    manager.add_slider(slider, redraw=False)  # The scheduler's frames end with manager.update()
+    ```
+    """
+    def __init__(self, canvas):
+        """Construct an instance."""
+        self._canvas = canvas
+        self._artists = []
+        self._background = None
+
+        self._draw_connection = canvas.mpl_connect("draw_event", self._on_draw)
+
+    def disconnect(self):
+        """Stop caching the background after full draws."""
+        self._canvas.mpl_disconnect(self._draw_connection)
+
+    def get_artists(self):
+        """Get animated artists, in drawing order."""
+        return list(self._artists)
+
+    def add_artist(self, artist):
+        """Animate `artist`, drawing it on every update.
+
+        Parameters
+        ----------
+        artist : matplotlib.artist.Artist
+            Artist of the manager's figure.
+
+        Raises
+        ------
+        ValueError
+            Raised when `artist` belongs to a different figure.
+
+        """
+        if artist.figure is not self._canvas.figure:
+            raise ValueError("Artist must belong to the manager's figure!")
+
+        artist.set_animated(True)
+        self._artists.append(artist)
+
+        # The background was captured with the artist drawn in it.
+        self._background = None
+
+    def add_interactive(self, interactive):
+        """Animate every artist of `interactive`, e.g. an `InteractiveSquare` and its vertex labels."""
+        for artist in interactive.get_artists():
+            self.add_artist(artist)
+
+    def add_slider(self, slider, redraw=True):
+        """Animate the axes of `slider`, and stop it from requesting full redraws.
+
+        Parameters
+        ----------
+        slider : matplotlib.widgets.Slider
+            Slider of the manager's figure.
+
+        redraw : bool, optional
+            Call `update()` whenever the slider changes, by default True. Register the slider to its interactive
+            artists first, so they are updated before the blit. Pass False when updates are scheduled by an
+            `UpdateScheduler` whose frames end with `update()`.
+
+        """
+        slider.drawon = False
+        self.add_artist(slider.ax)
+
+        if redraw:
+            slider.on_changed(lambda _: self.update())
+
+    def update(self):
+        """Restore the background, draw every animated artist over it, and blit the figure."""
+        if self._background is None:
+            # Full draw, which captures the background (see _on_draw()).
+            self._canvas.draw()
+            return
+
+        self._canvas.restore_region(self._background)
+        self._draw_animated()
+        self._canvas.blit(self._canvas.figure.bbox)
+        self._canvas.flush_events()
+
+    def _on_draw(self, _):
+        """Capture the background after a full draw, then draw the animated artists over it."""
+        self._background = self._canvas.copy_from_bbox(self._canvas.figure.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        figure = self._canvas.figure
+        for artist in self._artists:
+            figure.draw_artist(artist)
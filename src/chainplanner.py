@@ -0,0 +1,127 @@
+import typing
+
+import numpy as np
+
+
+MULTIPLICATIVE_COALESCERS = frozenset({np.dot, np.matmul})
+
+
+class ChainPlan:
+    """Cheapest multiplication order of a chain of matrices.
+
+    Finds the parenthesization of A₀A₁...Aₙ₋₁ which takes the fewest scalar multiplications using the classic
+    matrix-chain-order dynamic program, where multiplying a (p x q) matrix by a (q x r) matrix costs p·q·r.
+
+    Parameters
+    ----------
+    dimensions : typing.Sequence[int]
+        Dimensions p₀, p₁, ..., pₙ of the chain, where matrix Aᵢ has shape (pᵢ, pᵢ₊₁).
+
+    Example
+    -------
+    ```python
+    >>> plan = ChainPlan([10, 30, 5, 60])
+    >>> plan.get_cost()
+    4500
+    >>> plan.get_order()
+    '((A0 A1) A2)'
+
+    ```
+    """
+    def __init__(self, dimensions):
+        """Construct an instance."""
+        self._dimensions = tuple(dimensions)
+
+        count = len(self._dimensions) - 1
+        if count < 1:
+            raise ValueError("Chain has no matrices!")
+
+        p = self._dimensions
+
+        # cost[i][j] is the cheapest cost of multiplying Aᵢ...Aⱼ, which splits into (Aᵢ...Aₖ)(Aₖ₊₁...Aⱼ) at split[i][j].
+        cost = [[0] * count for _ in range(count)]
+        split = [[0] * count for _ in range(count)]
+
+        for length in range(2, count + 1):
+            for i in range(count - length + 1):
+                j = i + length - 1
+                cost[i][j] = None
+                for k in range(i, j):
+                    candidate = cost[i][k] + cost[k + 1][j] + p[i] * p[k + 1] * p[j + 1]
+                    if cost[i][j] is None or candidate < cost[i][j]:
+                        cost[i][j] = candidate
+                        split[i][j] = k
+
+        self._cost = cost
+        self._split = split
+
+    def get_dimensions(self) -> typing.Tuple[int]:
+        """Get dimensions of the chain."""
+        return self._dimensions
+
+    def get_cost(self) -> int:
+        """Get number of scalar multiplications taken by the planned order."""
+        return self._cost[0][-1]
+
+    def get_order(self) -> str:
+        """Get string representation of the planned order."""
+        def order(i, j):
+            if i == j:
+                return f"A{i}"
+            k = self._split[i][j]
+            return f"({order(i, k)} {order(k + 1, j)})"
+
+        return order(0, len(self._split) - 1)
+
+    def evaluate(self, operands: typing.Sequence[np.ndarray], out: np.ndarray = None, dtype=None) -> np.ndarray:
+        """Multiply `operands` in the planned order.
+
+        Parameters
+        ----------
+        operands : typing.Sequence[np.ndarray]
+            Matrices of the chain, with shapes matching the planned dimensions.
+
+        out : np.ndarray, optional
+            Preallocated array to write the product into, by default None.
+
+        dtype : np.dtype, optional
+            Data type of products with the first operand (e.g. points of lower precision than the other operands),
+            by default that of `np.matmul`. Products of other operands keep their own precision, and are cast only
+            when multiplied with the first operand.
+
+        Returns
+        -------
+        np.ndarray
+            Product of the chain.
+
+        """
+        def multiply(i, j, out=None):
+            if i == j:
+                if out is None:
+                    return operands[i]
+                out[...] = operands[i]
+                return out
+            k = self._split[i][j]
+            rhs = multiply(k + 1, j)
+            if i == 0 and dtype is not None:
+                rhs = rhs.astype(dtype, copy=False)
+            return np.matmul(multiply(i, k), rhs, out=out)
+
+        return multiply(0, len(operands) - 1, out)
+
+
+def naive_cost(dimensions: typing.Sequence[int]) -> int:
+    """Returns number of scalar multiplications taken to multiply a chain left to right
+
+    Parameters
+    ----------
+    dimensions : typing.Sequence[int]
+        Dimensions p₀, p₁, ..., pₙ of the chain, where matrix Aᵢ has shape (pᵢ, pᵢ₊₁).
+
+    Returns
+    -------
+    int
+        Cost of ((A₀A₁)A₂)...Aₙ₋₁.
+
+    """
+    return sum(dimensions[0] * dimensions[k] * dimensions[k + 1] for k in range(1, len(dimensions) - 1))
@@ -0,0 +1,204 @@
+import typing
+
+import numpy as np
+
+
+class CoalescerInfo(typing.NamedTuple):
+    """What is known about a registered coalescer.
+
+    Attributes
+    ----------
+    name : str
+        Registered name, e.g. for `serialization.save_sequence()`.
+
+    function : typing.Callable[[np.ndarray, np.ndarray], np.ndarray]
+        The coalescer.
+
+    associative : bool
+        Whether coalescing runs of nodes in any grouping gives the same result (see `TreeSequence`).
+
+    shape : typing.Callable[[tuple, tuple], tuple], optional
+        Shape of the coalescence of matrices of shapes (lhs, rhs), raising ValueError for incompatible shapes.
+
+    batched : typing.Callable[[np.ndarray, np.ndarray], np.ndarray], optional
+        Equivalent which broadcasts over stacks of matrices (K, M, N) (see `sweep()`).
+
+    place : typing.Callable[[np.ndarray, tuple, np.ndarray], None], optional
+        For block coalescers, whose result holds lhs in its top-left corner and rhs beside or below it: writes rhs
+        into an array holding lhs (of the given shape) in its top-left corner. Runs of block coalescers are
+        assembled by `Sequence` into one array, without intermediate arrays.
+
+    """
+    name: str
+    function: typing.Callable
+    associative: bool = False
+    shape: typing.Optional[typing.Callable] = None
+    batched: typing.Optional[typing.Callable] = None
+    place: typing.Optional[typing.Callable] = None
+
+
+def append_column(lhs, rhs):
+    """Coalescer [A | Bᵀ], e.g. appending a translation row vector to a rotation matrix as a column."""
+    return np.concatenate((lhs, rhs.T), axis=1)
+
+
+def concatenate_columns(lhs, rhs):
+    """Coalescer [A | B]."""
+    return np.concatenate((lhs, rhs), axis=1)
+
+
+def concatenate_rows(lhs, rhs):
+    """Coalescer [A; B], e.g. appending the homogenous row [0 0 0 1]."""
+    return np.concatenate((lhs, rhs), axis=0)
+
+
+def _product_shape(lhs, rhs):
+    if lhs[1] != rhs[0]:
+        raise ValueError(f"shapes {lhs} and {rhs} not aligned: {lhs[1]} (dim 1) != {rhs[0]} (dim 0)")
+    return lhs[0], rhs[1]
+
+
+def _append_column_shape(lhs, rhs):
+    if lhs[0] != rhs[1]:
+        raise ValueError(f"Can not append columns of shape {rhs[::-1]} to rows of shape {lhs}!")
+    return lhs[0], lhs[1] + rhs[0]
+
+
+def _concatenate_columns_shape(lhs, rhs):
+    if lhs[0] != rhs[0]:
+        raise ValueError(f"Can not append columns of shape {rhs} to rows of shape {lhs}!")
+    return lhs[0], lhs[1] + rhs[1]
+
+
+def _concatenate_rows_shape(lhs, rhs):
+    if lhs[1] != rhs[1]:
+        raise ValueError(f"Can not append rows of shape {rhs} to columns of shape {lhs}!")
+    return lhs[0] + rhs[0], lhs[1]
+
+
+def _place_append_column(out, lhs, rhs):
+    out[:lhs[0], lhs[1]:lhs[1] + rhs.shape[0]] = rhs.T
+
+
+def _place_concatenate_columns(out, lhs, rhs):
+    out[:lhs[0], lhs[1]:lhs[1] + rhs.shape[1]] = rhs
+
+
+def _place_concatenate_rows(out, lhs, rhs):
+    out[lhs[0]:lhs[0] + rhs.shape[0], :lhs[1]] = rhs
+
+
+def _broadcast_concatenate(lhs, rhs, axis):
+    """Concatenate stacks of matrices, broadcasting their leading (stack) dimensions."""
+    stack = np.broadcast_shapes(lhs.shape[:-2], rhs.shape[:-2])
+    return np.concatenate((np.broadcast_to(lhs, stack + lhs.shape[-2:]), np.broadcast_to(rhs, stack + rhs.shape[-2:])),
+                          axis=axis)
+
+
+_coalescers = {}
+_infos = {}
+
+
+def register_coalescer(name: str, coalescer, associative=False, shape=None, batched=None, place=None):
+    """Register `coalescer` under `name`, with what is known about it (see `CoalescerInfo`).
+
+    Registering a coalescer again under the same name replaces what is known about it. Registering it under another
+    name adds an alias for `get_coalescer()`; what is known about it stays as registered under its first name.
+
+    Parameters
+    ----------
+    name : str
+        Name of the coalescer.
+
+    coalescer : typing.Callable[[np.ndarray, np.ndarray], np.ndarray]
+        Function which merges components in a sequence.
+
+    associative : bool, optional
+        Whether the coalescer is associative, by default False.
+
+    shape : typing.Callable[[tuple, tuple], tuple], optional
+        Output shape of the coalescer, by default unknown.
+
+    batched : typing.Callable[[np.ndarray, np.ndarray], np.ndarray], optional
+        Equivalent which broadcasts over stacks of matrices, by default none.
+
+    place : typing.Callable[[np.ndarray, tuple, np.ndarray], None], optional
+        Block placement of rhs, by default none. Requires `shape`.
+
+    Raises
+    ------
+    ValueError
+        Raised when `name` is already registered to a different coalescer, or `place` is given without `shape`.
+
+    """
+    registered = _coalescers.get(name)
+    if registered is not None and registered.function is not coalescer:
+        raise ValueError(f"Coalescer name {name!r} is already registered!")
+
+    if place is not None and shape is None:
+        raise ValueError("Block coalescers must provide their output shape!")
+
+    info = CoalescerInfo(name, coalescer, associative, shape, batched, place)
+    _coalescers[name] = info
+
+    # The first name a coalescer is registered under is the one saved (see `get_coalescer_name()`); registering it
+    # again under that name replaces what is known about it, while other names only alias it.
+    registered = _infos.get(coalescer)
+    if registered is None or registered.name == name:
+        _infos[coalescer] = info
+
+
+def get_coalescer(name: str):
+    """Get coalescer registered under `name`.
+
+    Raises
+    ------
+    ValueError
+        Raised when no coalescer is registered under `name`.
+
+    """
+    try:
+        return _coalescers[name].function
+    except KeyError:
+        raise ValueError(f"No coalescer registered as {name!r}!") from None
+
+
+def get_info(coalescer) -> typing.Optional[CoalescerInfo]:
+    """Get what is known about `coalescer`, or None if it is not registered."""
+    try:
+        return _infos.get(coalescer)
+    except TypeError:
+        # Unhashable callable.
+        return None
+
+
+def get_coalescer_name(coalescer):
+    """Get name `coalescer` is registered under, or None if it is not registered."""
+    info = get_info(coalescer)
+    return None if info is None else info.name
+
+
+def is_associative(coalescer) -> bool:
+    """Whether `coalescer` is registered as associative."""
+    info = get_info(coalescer)
+    return info is not None and info.associative
+
+
+def is_block(coalescer) -> bool:
+    """Whether `coalescer` is registered as a block coalescer (see `CoalescerInfo.place`)."""
+    info = get_info(coalescer)
+    return info is not None and info.place is not None
+
+
+register_coalescer("dot", np.dot, associative=True, shape=_product_shape, batched=np.matmul)
+register_coalescer("matmul", np.matmul, associative=True, shape=_product_shape, batched=np.matmul)
+register_coalescer("add", np.add, associative=True, shape=np.broadcast_shapes, batched=np.add)
+register_coalescer("subtract", np.subtract, shape=np.broadcast_shapes, batched=np.subtract)
+register_coalescer("multiply", np.multiply, associative=True, shape=np.broadcast_shapes, batched=np.multiply)
+
+register_coalescer("append_column", append_column, shape=_append_column_shape, place=_place_append_column,
+                   batched=lambda lhs, rhs: _broadcast_concatenate(lhs, np.swapaxes(rhs, -1, -2), -1))
+register_coalescer("concatenate_columns", concatenate_columns, shape=_concatenate_columns_shape,
+                   place=_place_concatenate_columns, batched=lambda lhs, rhs: _broadcast_concatenate(lhs, rhs, -1))
+register_coalescer("concatenate_rows", concatenate_rows, shape=_concatenate_rows_shape,
+                   place=_place_concatenate_rows, batched=lambda lhs, rhs: _broadcast_concatenate(lhs, rhs, -2))
@@ -0,0 +1,205 @@
+import numpy as np
+
+import src.utility as utility
+from src.sequence import Sequence
+
+
+class ColorTransform:
+    """Per-pixel color transform of images via a sequence of component matrices.
+
+    Every pixel of an (H, W, C) image is a color vector transformed by the coalesced matrix of the sequence, which is
+    either (C x C) or affine (C x C+1, or C+1 x C+1). The image is viewed as (H·W, C) points and transformed with a
+    single `utility.apply_transform()`, so e.g. an RGB image is one (H·W x 3) by (3 x 3) matrix multiplication.
+
+    `apply()` writes float32 colors into a preallocated buffer. `apply_uint8()` transforms uint8 images into uint8
+    images without a float copy of the image: pixels are converted, transformed, rounded, clipped and written back to
+    uint8 a strip at a time through a small float32 scratch buffer which stays in cache.
+
+    Colors are transformed in the units of the image, e.g. 0-255 for uint8 images.
+
+    Parameters
+    ----------
+    sequence : Sequence, optional
+        Sequence of color matrices, by default a new empty sequence.
+
+    strip_size : int, optional
+        Number of pixels transformed at a time by `apply_uint8()`, by default 262144.
+
+    Example
+    -------
+    ```python
+    >>> color = ColorTransform()
+    >>> color.register_transform(np.diag([0.8, 0.5, 1.2]), label="shift")
+    >>> color.apply_uint8(np.array([[[100, 100, 100]]], dtype=np.uint8))
+    array([[[ 80,  50, 120]]], dtype=uint8)
+
+    ```
+    """
+    def __init__(self, sequence=None, strip_size=1 << 18):
+        """Construct an instance."""
+        self._sequence = Sequence() if sequence is None else sequence
+        self._strip_size = strip_size
+
+        # Output of apply(), reused while the image shape stays the same.
+        self._buffer = None
+
+        # Float32 (pixels, transformed pixels) strips used by apply_uint8().
+        self._scratch = None
+
+    def get_sequence(self) -> Sequence:
+        """Get sequence of color matrices."""
+        return self._sequence
+
+    def get_label(self) -> str:
+        """Get string representation of component relationship."""
+        return self._sequence.get_label()
+
+    def register_transform(self, component, coalescer=None, label=None):
+        """Register the color matrix as a component matrix (see `utility.register_transform()`)."""
+        utility.register_transform(self._sequence, component, coalescer, label)
+
+    def apply(self, image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Transform the colors of every pixel of `image` into a float32 array
+
+        Parameters
+        ----------
+        image : np.ndarray
+            Image of shape (H, W, C).
+
+        out : np.ndarray, optional
+            Preallocated C-contiguous float32 array of shape (H, W, C) to write into, by default an internal buffer
+            which is reused (and overwritten) by the next call.
+
+        Returns
+        -------
+        np.ndarray
+            Transformed image.
+
+        Raises
+        ------
+        ValueError
+            Raised when `out` is not a C-contiguous float32 array of shape (H, W, C).
+
+        """
+        matrix = self._sequence.get_matrix().astype(np.float32, copy=False)
+        height, width, channels = image.shape
+        shape = (height, width, min(matrix.shape[0], channels))
+
+        if out is None:
+            if self._buffer is None or self._buffer.shape != shape:
+                self._buffer = np.empty(shape, dtype=np.float32)
+            out = self._buffer
+        else:
+            utility.check_out(out, shape, np.float32)
+
+        pixels = image.reshape(-1, channels)
+        utility.apply_transform(matrix, pixels, out=out.reshape(-1, shape[2]))
+
+        return out
+
+    def apply_uint8(self, image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Transform the colors of every pixel of uint8 `image` into a uint8 array
+
+        Results are rounded and clipped to 0-255.
+
+        Parameters
+        ----------
+        image : np.ndarray
+            uint8 image of shape (H, W, C).
+
+        out : np.ndarray, optional
+            Preallocated C-contiguous uint8 array of shape (H, W, C) to write into, by default a new array.
+
+        Returns
+        -------
+        np.ndarray
+            Transformed image.
+
+        Raises
+        ------
+        TypeError
+            Raised when `image` is not uint8.
+
+        ValueError
+            Raised when `out` is not a C-contiguous uint8 array of shape (H, W, C).
+
+        """
+        if image.dtype != np.uint8:
+            raise TypeError(f"Expected uint8 image, got {image.dtype}!")
+
+        height, width, channels = image.shape
+        matrix = self._sequence.get_matrix()
+        shape = (height, width, min(matrix.shape[0], channels))
+
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8)
+        else:
+            utility.check_out(out, shape, np.uint8)
+
+        strip = max(1, min(self._strip_size, height * width))
+        if self._scratch is None or self._scratch[0].shape != (strip, channels) \
+                or self._scratch[1].shape != (strip, shape[2]):
+            self._scratch = (np.empty((strip, channels), dtype=np.float32),
+                             np.empty((strip, shape[2]), dtype=np.float32))
+
+        transform_uint8(matrix, image.reshape(-1, channels), out.reshape(-1, shape[2]), self._scratch)
+
+        return out
+
+
+def transform_uint8(matrix: np.ndarray, pixels: np.ndarray, out: np.ndarray, scratch=None, strip_size: int = 1 << 18):
+    """Transform uint8 `pixels` by color `matrix` into uint8 `out`, a strip at a time through float32 scratch buffers
+
+    Results are rounded and clipped to 0-255. See `ColorTransform.apply_uint8()`.
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        Color matrix of shape (C', C) or affine (C', C+1).
+
+    pixels : np.ndarray
+        uint8 pixels of shape (N, C).
+
+    out : np.ndarray
+        uint8 array of shape (N, C') to write into, where C' is at most C.
+
+    scratch : typing.Tuple[np.ndarray, np.ndarray], optional
+        float32 (S, C) and (S, C') buffers to transform strips of S pixels through, by default new buffers of
+        `strip_size` pixels.
+
+    strip_size : int, optional
+        Number of pixels per strip when `scratch` is not given, by default 262144.
+
+    Raises
+    ------
+    ValueError
+        Raised when `matrix` has fewer columns than pixels have channels.
+
+    """
+    channels = pixels.shape[1]
+
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if matrix.shape[1] < channels:
+        raise ValueError(f"Color matrix of shape {matrix.shape} cannot transform {channels} channels!")
+
+    matrix = matrix[:channels]
+    linear = np.ascontiguousarray(matrix[:, :channels].T)
+
+    # Affine columns (and the rounding half) are constant for every pixel.
+    bias = matrix[:, channels:].sum(axis=1) + np.float32(0.5)
+
+    if scratch is None:
+        strip = max(1, min(strip_size, len(pixels)))
+        scratch = (np.empty((strip, channels), dtype=np.float32), np.empty((strip, out.shape[1]), dtype=np.float32))
+
+    strip = len(scratch[0])
+    for start in range(0, len(pixels), strip):
+        stop = min(start + strip, len(pixels))
+        converted = scratch[0][:stop - start]
+        transformed = scratch[1][:stop - start]
+
+        converted[...] = pixels[start:stop]
+        np.matmul(converted, linear, out=transformed)
+        transformed += bias
+        np.clip(transformed, 0, 255, out=transformed)
+        out[start:stop] = transformed
@@ -1,7 +1,10 @@
 import abc
+import weakref
 
 import numpy
 
+import src.structures as structures
+
 
 class ComponentMatrix(metaclass=abc.ABCMeta):
 
@@ -14,3 +17,69 @@ class ComponentMatrix(metaclass=abc.ABCMeta):
     def get_label(self) -> str:
         """Get string representation of component."""
         raise NotImplementedError
+
+    def get_version(self) -> int:
+        """Get counter which increases whenever the managed matrix changes.
+
+        Used by containers to cache results derived from the managed matrix. Components whose matrix never changes
+        may use this default.
+        """
+        return 0
+
+    def add_listener(self, listener) -> bool:
+        """Call `listener(self)` whenever the managed matrix changes, while the object of `listener` is alive.
+
+        Lets containers find changed components without checking the version of every component. Components which
+        notify listeners set `self._listeners = []` when constructed and call `_notify()` whenever their version
+        increases; components which do not (the default) must be polled with `get_version()`.
+
+        Parameters
+        ----------
+        listener : typing.Callable[[ComponentMatrix], None]
+            Bound method to call. Only a weak reference to it is kept.
+
+        Returns
+        -------
+        bool
+            Whether the component notifies listeners.
+
+        """
+        listeners = getattr(self, "_listeners", None)
+        if listeners is None:
+            return False
+
+        listeners.append(weakref.WeakMethod(listener))
+        return True
+
+    def _notify(self):
+        """Call every listener (see `add_listener()`), forgetting listeners whose objects were deleted."""
+        if not self._listeners:
+            return
+
+        alive = []
+        for reference in self._listeners:
+            listener = reference()
+            if listener is not None:
+                listener(self)
+                alive.append(reference)
+        self._listeners[:] = alive
+
+    def is_constant(self) -> bool:
+        """Whether the managed matrix is expected never to change.
+
+        Containers may coalesce constant components once, ahead of time (see `Sequence`). The expectation is a hint:
+        containers still check `get_version()`, and coalesce again if a constant component changes anyway.
+        """
+        return False
+
+    def get_structure(self) -> str:
+        """Get structure of the managed matrix (see `structures.detect_structure()`), e.g. `structures.IDENTITY`.
+
+        Used by containers to multiply by the managed matrix cheaply (see `structures.multiply()`). Components of
+        unknown structure may use this default, `structures.DENSE`.
+        """
+        return structures.DENSE
+
+    def get_tree(self) -> dict:
+        """Get structure of component as JSON-compatible {"type": class name, "label": label}."""
+        return {"type": type(self).__name__, "label": self.get_label()}
@@ -0,0 +1,228 @@
+import os
+from concurrent import futures
+from multiprocessing import shared_memory
+
+import numpy as np
+
+import src.colortransform as colortransform
+import src.utility as utility
+
+
+class TileExecutor:
+    """Applies transforms to large point arrays and images in tiles across a pool of workers.
+
+    Points (or the pixels of an image, viewed as (H·W, C) points) are partitioned into contiguous tiles of rows, and
+    each worker writes its tile directly into its rows of the output, so the result does not depend on which worker
+    finishes first. Matrices are coalesced once, before any tile is submitted; workers never touch the sequence.
+
+    NumPy releases the GIL during matrix multiplication, so threads (the default) run tiles in parallel without
+    copying. With `processes=True`, inputs and outputs are instead copied through `multiprocessing.shared_memory`
+    blocks which worker processes attach to.
+
+    Parameters
+    ----------
+    workers : int, optional
+        Number of workers, by default the number of CPUs.
+
+    processes : bool, optional
+        Use a process pool with shared-memory buffers instead of a thread pool, by default False.
+
+    min_tile : int, optional
+        Minimum number of rows per tile; smaller inputs use fewer tiles, by default 65536.
+
+    Example
+    -------
+    ```python
+    with TileExecutor(workers=4) as executor:
+        transformed = executor.apply_transform(matrix, points)
+    ```
+    """
+    def __init__(self, workers=None, processes=False, min_tile=1 << 16):
+        """Construct an instance."""
+        self._workers = workers or os.cpu_count() or 1
+        self._processes = processes
+        self._min_tile = min_tile
+
+        if processes:
+            self._pool = futures.ProcessPoolExecutor(self._workers)
+        else:
+            self._pool = futures.ThreadPoolExecutor(self._workers)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.shutdown()
+
+    def shutdown(self):
+        """Wait for submitted tiles, then release the workers."""
+        self._pool.shutdown()
+
+    def get_workers(self) -> int:
+        """Get number of workers."""
+        return self._workers
+
+    def get_tiles(self, count: int):
+        """Returns slices of consecutive rows partitioning `count` rows into at most one tile per worker
+
+        Parameters
+        ----------
+        count : int
+            Number of rows.
+
+        Returns
+        -------
+        typing.List[slice]
+            Rows of each tile, in order.
+
+        """
+        tiles = max(1, min(self._workers, count // max(1, self._min_tile)))
+        bounds = np.linspace(0, count, tiles + 1).astype(int)
+        return [slice(start, stop) for start, stop in zip(bounds[:-1], bounds[1:])]
+
+    def apply_transform(self, transform_matrix: np.ndarray, points: np.ndarray, row_vector: bool = False,
+                        out: np.ndarray = None) -> np.ndarray:
+        """Applies `transform_matrix` to all points in array `points`, in parallel. See `utility.apply_transform()`.
+
+        Parameters
+        ----------
+        transform_matrix : np.ndarray
+            Transformation matrix to apply to all points.
+
+        points : np.ndarray
+            Array of points to transform, with shape (P, D).
+
+        row_vector : bool, optional
+            `False` to treat points as column vectors, `True` to treat points as row vectors, by default False.
+
+        out : np.ndarray, optional
+            Preallocated C-contiguous array to write transformed points into, by default None.
+
+        Returns
+        -------
+        np.ndarray
+            Transformed points.
+
+        """
+        matrix = np.asarray(transform_matrix)
+        points = np.asarray(points)
+
+        if row_vector:
+            matrix = matrix.T
+
+        if out is None:
+            if np.issubdtype(points.dtype, np.floating):
+                dtype = points.dtype
+            else:
+                dtype = np.result_type(matrix, points)
+            out = np.empty((points.shape[0], min(matrix.shape[0], points.shape[1])), dtype=dtype)
+
+        return self._run(_transform_points, matrix, points, out)
+
+    def apply_color(self, color, image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Transform the colors of every pixel of `image`, in parallel. See `ColorTransform`.
+
+        uint8 images are transformed into uint8 images (see `ColorTransform.apply_uint8()`), other images into float32
+        images (see `ColorTransform.apply()`).
+
+        Parameters
+        ----------
+        color : ColorTransform
+            Color transform to apply.
+
+        image : np.ndarray
+            Image of shape (H, W, C).
+
+        out : np.ndarray, optional
+            Preallocated C-contiguous array of shape (H, W, C) to write into, by default None.
+
+        Returns
+        -------
+        np.ndarray
+            Transformed image.
+
+        """
+        matrix = color.get_sequence().get_matrix()
+        height, width, channels = image.shape
+        shape = (height, width, min(matrix.shape[0], channels))
+
+        if out is None:
+            out = np.empty(shape, dtype=np.uint8 if image.dtype == np.uint8 else np.float32)
+
+        if image.dtype == np.uint8 and out.dtype == np.uint8:
+            kernel = _transform_uint8
+        else:
+            kernel = _transform_points
+            matrix = np.asarray(matrix, dtype=np.float32)
+
+        self._run(kernel, matrix, image.reshape(-1, channels), out.reshape(-1, shape[2]))
+        return out
+
+    def _run(self, kernel, matrix, source, destination):
+        """Run `kernel(matrix, source[tile], destination[tile])` for every tile, and wait for all of them."""
+        tiles = self.get_tiles(len(source))
+
+        if len(tiles) == 1:
+            kernel(matrix, source, destination)
+            return destination
+
+        if not self._processes:
+            pending = [self._pool.submit(kernel, matrix, source[tile], destination[tile]) for tile in tiles]
+            for future in pending:
+                future.result()
+            return destination
+
+        # Blocks are cleaned up as soon as they are created, even if creating the next one fails.
+        blocks = []
+        try:
+            shared_source, source_block = _share(source)
+            blocks.append(source_block)
+            shared_destination, destination_block = _share(destination, copy=False)
+            blocks.append(destination_block)
+
+            pending = [self._pool.submit(_run_shared, kernel, matrix, shared_source, shared_destination, tile)
+                       for tile in tiles]
+            for future in pending:
+                future.result()
+
+            destination[...] = np.ndarray(destination.shape, destination.dtype, buffer=destination_block.buf)
+        finally:
+            for block in blocks:
+                block.close()
+                block.unlink()
+
+        return destination
+
+
+def _transform_points(matrix, points, out):
+    utility.apply_transform(matrix, points, out=out)
+
+
+def _transform_uint8(matrix, pixels, out):
+    colortransform.transform_uint8(matrix, pixels, out)
+
+
+def _share(array, copy=True):
+    """Returns (name, shape, dtype) of a new shared-memory block holding `array`, and the block."""
+    block = shared_memory.SharedMemory(create=True, size=max(1, array.nbytes))
+    if copy:
+        try:
+            np.ndarray(array.shape, array.dtype, buffer=block.buf)[...] = array
+        except BaseException:
+            block.close()
+            block.unlink()
+            raise
+    return (block.name, array.shape, array.dtype.str), block
+
+
+def _run_shared(kernel, matrix, source, destination, tile):
+    """Worker process entry point: attach to shared `source` and `destination` and run `kernel` on `tile`."""
+    blocks = [shared_memory.SharedMemory(name=name) for name, _, _ in (source, destination)]
+    try:
+        source_array, destination_array = (np.ndarray(shape, np.dtype(dtype), buffer=block.buf)
+                                            for block, (_, shape, dtype) in zip(blocks, (source, destination)))
+        kernel(matrix, source_array[tile], destination_array[tile])
+        del source_array, destination_array
+    finally:
+        for block in blocks:
+            block.close()
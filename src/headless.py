@@ -0,0 +1,108 @@
+import time
+import typing
+
+from matplotlib import figure as mfigure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+import src.instrumentation as instrumentation
+
+
+def create_figure(**kwargs) -> mfigure.Figure:
+    """Returns a figure drawn by an Agg canvas, which renders off-screen without a window or event loop
+
+    Parameters
+    ----------
+    **kwargs
+        `matplotlib.figure.Figure` parameters.
+
+    Returns
+    -------
+    matplotlib.figure.Figure
+        Headless figure.
+
+    """
+    figure = mfigure.Figure(**kwargs)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def drive_sliders(figure, artists, values: typing.Mapping, draw: bool = True,
+                  redraw: typing.Callable[[], None] = None) -> typing.Dict[str, float]:
+    """Drive sliders through sequences of values, one value per frame, and time every stage of every frame
+
+    Each frame sets every slider to its next value (running its mutators and updating the artists registered to it,
+    see `Interactive.register_slider()`), then draws the figure once. Artists must update immediately, i.e. be
+    constructed without a scheduler. The sliders' own redraws are suspended while driving, since an Agg canvas would
+    otherwise draw the whole figure inside every `slider.set_val()`.
+
+    Parameters
+    ----------
+    figure : matplotlib.figure.Figure
+        Figure of the artists, e.g. from `create_figure()`.
+
+    artists : typing.Iterable[Interactive]
+        Artists whose update stages are timed.
+
+    values : typing.Mapping[widgets.Slider, typing.Sequence[float]]
+        Value of each slider in each frame. Frames stop at the shortest sequence.
+
+    draw : bool, optional
+        Draw the figure every frame, by default True.
+
+    redraw : typing.Callable[[], None], optional
+        Function which draws each frame, by default `figure.canvas.draw()`. For example, `BlitManager.update()`.
+
+    Returns
+    -------
+    typing.Dict[str, float]
+        Mean seconds per frame of "mutate" (slider callbacks other than artist updates), each update stage of the
+        artists (e.g. "coalesce", "transform", "convert", "patch"), "draw" and "frame" (all of the above), plus
+        "fps", frames per second.
+
+    """
+    timings = {}
+    for artist in artists:
+        artist.record_timings(timings)
+
+    if redraw is None:
+        redraw = figure.canvas.draw
+
+    drawon = {slider: slider.drawon for slider in values}
+    for slider in values:
+        slider.drawon = False
+
+    frames = min(len(sequence) for sequence in values.values())
+    updating = drawing = 0
+
+    try:
+        for frame in range(frames):
+            start = time.perf_counter()
+            for slider, sequence in values.items():
+                slider.set_val(sequence[frame])
+            updated = time.perf_counter()
+
+            if draw:
+                redraw()
+
+                profiler = instrumentation.get_profiler()
+                if profiler is not None:
+                    profiler.record("Figure.draw", updated, category="draw")
+
+            updating += updated - start
+            drawing += time.perf_counter() - updated
+    finally:
+        for artist in artists:
+            artist.record_timings(None)
+        for slider, value in drawon.items():
+            slider.drawon = value
+
+    stages = sum(timings.values())
+    results = {"mutate": updating - stages}
+    results.update(timings)
+    results["draw"] = drawing
+    results["frame"] = updating + drawing
+
+    results = {name: seconds / max(frames, 1) for name, seconds in results.items()}
+    results["fps"] = 1 / results["frame"] if results["frame"] else float("inf")
+
+    return results
@@ -0,0 +1,134 @@
+import numpy as np
+
+import src.precision as precision
+import src.utility as utility
+
+
+class HomogenousPoints:
+    """Array of points stored alongside a spare homogenous coordinate.
+
+    Points are stored as rows [x₁, ..., xₙ, w] of a single C-contiguous buffer. The homogenous points are the whole
+    buffer, and once every w is 1 the cartesian points are the buffer without its last column, so converting between
+    the two spaces returns a view instead of allocating a copy.
+
+    Parameters
+    ----------
+    points : typing.Iterable
+        Cartesian points, one per row.
+
+    dtype : np.dtype, optional
+        Buffer data type, by default the data type of `points` if it is floating, otherwise
+        `precision.get_point_dtype()`.
+
+    Example
+    -------
+    ```python
+    >>> points = HomogenousPoints([[1, 2], [3, 4]])
+    >>> points.get_homogenous().tolist()
+    [[1.0, 2.0, 1.0], [3.0, 4.0, 1.0]]
+
+    >>> projected = points.transform(np.diag([1, 1, 2]))
+    >>> projected.get_cartesian().tolist()
+    [[0.5, 1.0], [1.5, 2.0]]
+
+    ```
+    """
+    def __init__(self, points, dtype=None):
+        """Construct an instance."""
+        points = np.asarray(points)
+
+        if dtype is None:
+            dtype = points.dtype if np.issubdtype(points.dtype, np.floating) else precision.get_point_dtype()
+
+        self._buffer = np.empty((points.shape[0], points.shape[1] + 1), dtype=dtype)
+        utility.to_homogenous(points, out=self._buffer)
+        self._normalized = True
+
+    @classmethod
+    def from_homogenous(cls, array):
+        """Construct an instance which manages homogenous points `array` (without copying when possible).
+
+        Parameters
+        ----------
+        array : np.ndarray
+            Homogenous points, one per row.
+
+        Returns
+        -------
+        HomogenousPoints
+            Instance managing `array`.
+
+        """
+        instance = cls.__new__(cls)
+        instance._buffer = np.ascontiguousarray(array)
+        if not np.issubdtype(instance._buffer.dtype, np.floating):
+            instance._buffer = instance._buffer.astype(float)
+        instance._normalized = False
+        return instance
+
+    def get_homogenous(self) -> np.ndarray:
+        """Get homogenous points (a view of the managed buffer)."""
+        return self._buffer
+
+    def get_cartesian(self, epsilon=None, fill=None) -> np.ndarray:
+        """Get cartesian points (a view of the managed buffer), normalizing the points first if needed.
+
+        Parameters
+        ----------
+        epsilon : float, optional
+            See `utility.from_homogenous()`, by default None
+
+        fill : float, optional
+            See `utility.from_homogenous()`, by default None
+
+        Returns
+        -------
+        np.ndarray
+            Cartesian points.
+
+        """
+        if not self._normalized:
+            self.normalize(epsilon, fill)
+
+        return self._buffer[:, :-1]
+
+    def normalize(self, epsilon=None, fill=None):
+        """Divide each point by its homogenous coordinate in-place, so that every w is 1.
+
+        Parameters
+        ----------
+        epsilon : float, optional
+            See `utility.from_homogenous()`, by default None
+
+        fill : float, optional
+            See `utility.from_homogenous()`, by default None
+
+        """
+        utility.from_homogenous(self._buffer, out=self._buffer[:, :-1], epsilon=epsilon, fill=fill)
+        self._buffer[:, -1] = 1
+        self._normalized = True
+
+    def transform(self, matrix, out=None):
+        """Apply transformation `matrix` to the homogenous points.
+
+        Parameters
+        ----------
+        matrix : np.ndarray
+            Transformation matrix whose columns match the number of homogenous coordinates.
+
+        out : HomogenousPoints, optional
+            Instance to write transformed points into, by default None
+
+        Returns
+        -------
+        HomogenousPoints
+            Transformed (unnormalized) points.
+
+        """
+        if out is None:
+            buffer = utility.apply_transform(matrix, self._buffer)
+            return HomogenousPoints.from_homogenous(buffer)
+
+        utility.apply_transform(matrix, self._buffer, out=out._buffer)
+        out._normalized = False
+        return out
@@ -0,0 +1,169 @@
+import collections
+import json
+import os
+import threading
+import time
+
+
+# Instrumented code fetches the active profiler once per call with `get_profiler()` and skips all bookkeeping when it
+# is None, so instrumentation costs one function call and one comparison while no profiler is enabled.
+
+
+_profiler = None
+
+
+def get_profiler():
+    """Get the enabled profiler, or None when profiling is disabled."""
+    return _profiler
+
+
+class Profiler:
+    """Opt-in timing and counting of instrumented code.
+
+    While enabled, instrumented code records spans (named, timed sections, e.g. coalescing one node of a `Sequence`
+    or one update stage of an `InteractiveSquare`) and counters (e.g. prefix cache hits and misses, updates per
+    artist). Spans are totalled per name, and the first `max_events` are also kept in order for export as a Chrome
+    trace (see `get_chrome_trace()`), viewable in chrome://tracing or https://ui.perfetto.dev.
+
+    Parameters
+    ----------
+    max_events : int, optional
+        Maximum number of spans kept for the trace, by default 100000. Totals include every span.
+
+    Example
+    -------
+    ```python
+    with Profiler() as profiler:
+        square._update_patch()
+
+    print(profiler.get_stats())
+    profiler.export_chrome_trace("trace.json")
+    ```
+    """
+    def __init__(self, max_events=100000):
+        """Construct an instance."""
+        self._max_events = max_events
+
+        # [calls, seconds] by span name.
+        self._totals = {}
+        self._counters = collections.Counter()
+
+        # (name, category, start, duration, thread id) of each span, in order of completion.
+        self._events = []
+
+        self._origin = time.perf_counter()
+        self._previous = None
+
+    def __enter__(self):
+        self.enable()
+        return self
+
+    def __exit__(self, *_):
+        self.disable()
+
+    def enable(self):
+        """Make this the profiler which instrumented code records to."""
+        global _profiler
+
+        if _profiler is not self:
+            self._previous = _profiler
+            _profiler = self
+
+    def disable(self):
+        """Stop recording, restoring the profiler enabled before this one (if any)."""
+        global _profiler
+
+        if _profiler is self:
+            _profiler = self._previous
+            self._previous = None
+
+    def reset(self):
+        """Discard all recorded spans and counters."""
+        self._totals.clear()
+        self._counters.clear()
+        self._events.clear()
+        self._origin = time.perf_counter()
+
+    @staticmethod
+    def clock() -> float:
+        """Returns the current time in seconds, for the `start` of `record()`."""
+        return time.perf_counter()
+
+    def record(self, name: str, start: float, end: float = None, category: str = ""):
+        """Record a span.
+
+        Parameters
+        ----------
+        name : str
+            Name of the span. Spans of the same name are totalled together.
+
+        start : float
+            Start of the span, from `clock()`.
+
+        end : float, optional
+            End of the span, from `clock()`, by default now.
+
+        category : str, optional
+            Category of the span in the trace, by default none.
+
+        """
+        if end is None:
+            end = time.perf_counter()
+
+        total = self._totals.get(name)
+        if total is None:
+            total = self._totals[name] = [0, 0.0]
+        total[0] += 1
+        total[1] += end - start
+
+        if len(self._events) < self._max_events:
+            self._events.append((name, category, start, end - start, threading.get_ident()))
+
+    def count(self, name: str, amount: int = 1):
+        """Add `amount` to counter `name`."""
+        self._counters[name] += amount
+
+    def get_stats(self) -> dict:
+        """Returns recorded totals
+
+        Returns
+        -------
+        dict
+            {"spans": {name: {"calls": int, "seconds": float}}, "counters": {name: int}}.
+
+        """
+        return {
+            "spans": {name: {"calls": calls, "seconds": seconds} for name, (calls, seconds) in self._totals.items()},
+            "counters": dict(self._counters)
+        }
+
+    def get_chrome_trace(self) -> dict:
+        """Returns recorded spans, and final counter values, in Chrome trace event format."""
+        pid = os.getpid()
+
+        events = [{
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": (start - self._origin) * 1e6,
+            "dur": duration * 1e6,
+            "pid": pid,
+            "tid": tid
+        } for name, category, start, duration, tid in self._events]
+
+        if self._counters:
+            end = max((start + duration for _, _, start, duration, _ in self._events), default=self._origin)
+            events.append({
+                "name": "counters",
+                "ph": "C",
+                "ts": (end - self._origin) * 1e6,
+                "pid": pid,
+                "args": dict(self._counters)
+            })
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def export_chrome_trace(self, path):
+        """Write `get_chrome_trace()` to JSON file `path`."""
+        with open(path, "w") as file:
+            json.dump(self.get_chrome_trace(), file)
@@ -0,0 +1,208 @@
+import abc
+import time
+
+import numpy as np
+
+import src.instrumentation as instrumentation
+import src.utility as utility
+from src.sequence import Sequence
+
+
+class Interactive(metaclass=abc.ABCMeta):
+    """Artist interactable via transform matrices, and sliders which alter matrix-index values.
+
+    Manages the sequence of transform matrices applied to the artist's points, and the sliders which mutate them.
+    Subclasses split updating the artist into named stages (e.g. coalescing the sequence, transforming points,
+    converting them to 2D, updating the artist) returned by `_get_stages()`, which `_update_patch()` runs in order.
+    Each stage is passed the result of the previous stage.
+
+    Parameters
+    ----------
+    convert_2d: typing.Callable[[np.ndarray], np.ndarray], optional
+        Conversion function from the point's space to 2d space.
+
+    scheduler: UpdateScheduler, optional
+        Scheduler which coalesces slider updates into at most one update per frame, by default None.
+        Without a scheduler the artist is updated immediately by every slider callback.
+
+    """
+    def __init__(self, convert_2d=None, scheduler=None):
+        """Construct an instance."""
+        self._sequence = Sequence(reuse_buffers=True)
+        self._scheduler = scheduler
+
+        if convert_2d is None:
+            self._convert_2d = self._first_two_coordinates
+        else:
+            self._convert_2d = convert_2d
+
+        # Connection id of self._update on each slider registered to the artist.
+        self._update_connections = {}
+
+        # Transformed vertices, reallocated only when the coalesced matrix changes shape.
+        self._transformed = None
+
+        # (name, function) stages of _update_patch(), built on first update.
+        self._stages = None
+
+        # Seconds spent in each stage by name, when recording timings.
+        self._timings = None
+
+    @staticmethod
+    def _first_two_coordinates(point):
+        """Converts an N-dimensional point vector into a 2-dimensional point vector by truncating coordinates past the second
+
+        Parameters
+        ----------
+        point : np.ndarray
+            Point to convert.
+
+        Returns
+        -------
+        np.ndarray
+            2D point vector.
+
+        """
+        return point[:, :2]
+
+    @abc.abstractmethod
+    def _get_stages(self):
+        """Returns the (name, function) stages which update the artist, in order.
+
+        Returns
+        -------
+        typing.List[typing.Tuple[str, typing.Callable[[typing.Any], typing.Any]]]
+            Stages, each taking the result of the previous stage (None for the first stage).
+
+        """
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_vertices(self) -> np.ndarray:
+        """Get untransformed vertices of the artist, one per row."""
+        raise NotImplementedError
+
+    @abc.abstractmethod
+    def get_artists(self):
+        """Returns every matplotlib artist which `_update_patch()` changes, e.g. for blitting (see `BlitManager`).
+
+        Returns
+        -------
+        typing.List[matplotlib.artist.Artist]
+            Artists of the interactive artist.
+
+        """
+        raise NotImplementedError
+
+    def _transform(self, transform):
+        """Apply coalesced matrix `transform` to the vertices, reusing the transformed vertex array where possible."""
+        vertices = self.get_vertices()
+
+        shape = (vertices.shape[0], min(transform.shape[0], vertices.shape[1]))
+        if self._transformed is None or self._transformed.shape != shape or self._transformed.dtype != vertices.dtype:
+            self._transformed = np.empty(shape, dtype=vertices.dtype)
+
+        return utility.apply_transform(transform, vertices, out=self._transformed)
+
+    def _convert(self, points):
+        """Convert transformed vertices to 2D."""
+        if points.shape[1] > 2:
+            return self._convert_2d(points)
+        return points
+
+    def _update_patch(self):
+        """Update the artist given the current transform matrix.
+
+        Stages are timed while recording timings (see `record_timings()`) or profiling (see `Profiler`).
+        """
+        if self._stages is None:
+            self._stages = self._get_stages()
+
+        profiler = instrumentation.get_profiler()
+
+        value = None
+        if self._timings is None and profiler is None:
+            for _, stage in self._stages:
+                value = stage(value)
+            return
+
+        kind = type(self).__name__
+        for name, stage in self._stages:
+            start = time.perf_counter()
+            value = stage(value)
+            end = time.perf_counter()
+
+            if self._timings is not None:
+                self._timings[name] = self._timings.get(name, 0) + end - start
+            if profiler is not None:
+                profiler.record(f"{kind}.{name}", start, end, category="interactive")
+
+        if profiler is not None:
+            profiler.count(f"{kind}@{id(self):#x} updates")
+
+    def record_timings(self, timings):
+        """Accumulate seconds spent in each stage of updating the artist into `timings`.
+
+        Parameters
+        ----------
+        timings : typing.Optional[typing.Dict[str, float]]
+            Seconds by stage name to add to, or None to stop recording.
+
+        """
+        self._timings = timings
+
+    def get_label(self) -> str:
+        """Get string representation of component relationship."""
+        return self._sequence.get_label()
+
+    def _update(self, _):
+        """Callback function for slider.on_changed() that discards the given parameter."""
+        if self._scheduler is None:
+            self._update_patch()
+        else:
+            self._scheduler.schedule(self._update_patch)
+
+    def register_transform(self, component, coalescer=None, label=None):
+        """Register the transformation matrix as a component matrix (see `utility.register_transform()`)."""
+        utility.register_transform(self._sequence, component, coalescer, label)
+
+    def register_slider(self, index_of_component, index_within_component, slider, modifier=None):
+        """Register a slider to control the value of matrix `order` at `index`
+
+        Parameters
+        ----------
+        index_of_component : typing.Union[int, typing.Tuple[int]]
+            Index of the matrix to select. Can be a tuple of indices to traverse into nested sequences.
+
+        index_within_component : typing.Union[int, typing.Tuple[int]]
+            Index (R, C) of the value within the selected matrix, or index of the parameter within the selected
+            `StructuredTransform`.
+
+        slider : widgets.Slider
+            Slider to register.
+
+        modifier : typing.Callable[[int], int], optional
+            Callable function to mutate the slider value, by default None.
+            e.g. to convert the slider value from degrees to radians.
+
+        """
+        if isinstance(index_of_component, int):
+            index_of_component = (index_of_component,)
+
+        node = self._sequence.get_node(index_of_component[0])
+        for index in index_of_component[1:]:
+            node = node.get_component().get_node(index)
+
+        component = node.get_component()
+
+        callback = component.get_mutator(index_within_component, modifier)
+        slider.on_changed(callback)
+
+        # self._update must be called last! Disconnect and reconnect it if it was already registered.
+        # Note: This will cause fragmentation of indices in the slider.
+        if slider in self._update_connections:
+            slider.disconnect(self._update_connections[slider])
+
+        self._update_connections[slider] = slider.on_changed(self._update)
+
+        callback(slider.valinit)
@@ -0,0 +1,216 @@
+import warnings
+
+import numpy as np
+from matplotlib import collections, patches
+
+import src.mesh as mesh
+import src.precision as precision
+from src.interactive import Interactive
+
+
+class InteractiveShape(Interactive):
+    """Shape interactable via transform matrices, and sliders which alter matrix-index values.
+
+    Generalization of `InteractiveSquare` to any polygon or mesh. Vertices are copied into a single preallocated
+    C-contiguous float array, so every update transforms all vertices with one batched `utility.apply_transform()`
+    into a second preallocated array.
+
+    Shapes without `faces` are drawn as one `patches.Polygon` through their vertices in order. Shapes with `faces`
+    (e.g. a grid or triangle mesh) are drawn as one `collections.PolyCollection` with a polygon per face.
+
+    Updates do not allocate arrays sized by the number of vertices: the sequence multiplies into reused buffers (see
+    `Sequence`), vertices are transformed into a reused array, and transformed 2D vertices are copied straight into
+    the vertex arrays of the artist's paths instead of being passed to `set_xy()` or `set_verts()`, which copy.
+
+    Parameters
+    ----------
+    axes : axes.Axes
+        Axes object on which the shape resides.
+
+    vertices : typing.Iterable
+        Vertices of the shape, one per row.
+
+    faces : typing.Iterable, optional
+        Faces of the shape as rows of vertex indices, by default None.
+
+    add_coords : typing.Iterable, optional
+        Include these additional coordinates in each vertex, by default None.
+
+    style : dict, optional
+        Patch style, by default None.
+
+    convert_2d: typing.Callable[[np.ndarray], np.ndarray], optional
+        Conversion function from the point's space to 2d space.
+
+    labels : typing.Union[bool, typing.Iterable[str]], optional
+        Vertex labels, or True to label vertices by index, by default None.
+
+    max_labels : int, optional
+        Labels are disabled (with a warning) for shapes with more vertices than this, as updating text artists is
+        far slower than transforming vertices, by default 64.
+
+    scheduler: UpdateScheduler, optional
+        Scheduler which coalesces slider updates into at most one update per frame, by default None.
+
+    dtype : np.dtype, optional
+        Data type of vertices, by default `precision.get_point_dtype()`.
+
+    plan_chain : bool, optional
+        Multiply trailing transform matrices together with the vertices in the cheapest order (see
+        `Sequence.apply()`) instead of coalescing the sequence first, by default False.
+
+    """
+    def __init__(self, axes, vertices, faces=None, add_coords=None, style=None, convert_2d=None, labels=None,
+                 max_labels=64, scheduler=None, dtype=None, plan_chain=False):
+        """Construct an instance."""
+        super().__init__(convert_2d, scheduler)
+
+        self._plan_chain = plan_chain
+
+        if dtype is None:
+            dtype = precision.get_point_dtype()
+
+        vertices = np.asarray(vertices)
+        extra = np.asarray(add_coords if add_coords else [], dtype=dtype)
+
+        self._vertices = np.empty((vertices.shape[0], vertices.shape[1] + extra.shape[0]), dtype=dtype)
+        self._vertices[:, :vertices.shape[1]] = vertices
+        self._vertices[:, vertices.shape[1]:] = extra
+
+        if faces is None:
+            self._faces = None
+            self._patch = patches.Polygon(self._vertices[:, :2], **(style or {}))
+            axes.add_patch(self._patch)
+
+            # The closed polygon's path repeats the first vertex at the end.
+            self._path_vertices = self._patch.get_path().vertices
+        else:
+            self._faces = np.ascontiguousarray(faces, dtype=np.intp)
+
+            # Faces closed by repeating their first vertex, gathered into one (F, K + 1, 2) float array which the
+            # paths of the collection are views of.
+            self._closed_faces = np.concatenate((self._faces, self._faces[:, :1]), axis=1)
+            self._path_vertices = self._vertices[:, :2][self._closed_faces].astype(float)
+            # Contiguous 2D points and gathered faces, in the points' type.
+            self._face_scratch = None
+
+            self._patch = collections.PolyCollection(list(self._path_vertices), closed=False, **(style or {}))
+            axes.add_collection(self._patch)
+
+        if labels is True:
+            labels = [str(index) for index in range(len(self._vertices))]
+
+        self._labels = []
+        if labels:
+            if len(self._vertices) > max_labels:
+                warnings.warn(f"Shape has {len(self._vertices)} vertices (more than {max_labels}); "
+                              f"vertex labels are disabled.")
+            else:
+                for (x, y), label in zip(self._vertices[:, :2], labels):
+                    text = axes.text(x, y, label)
+                    text.set_clip_on(True)
+                    self._labels.append(text)
+
+    @classmethod
+    def from_obj(cls, axes, file, **kwargs):
+        """Construct an instance from the vertices and faces of an OBJ-like file. See `mesh.load_obj()`.
+
+        Parameters
+        ----------
+        axes : axes.Axes
+            Axes object on which the shape resides.
+
+        file : typing.Union[str, os.PathLike, typing.Iterable[str]]
+            Path of the file to load, or an iterable of its lines.
+
+        **kwargs
+            Remaining `InteractiveShape` parameters.
+
+        Returns
+        -------
+        InteractiveShape
+            Shape of the mesh.
+
+        """
+        vertices, faces = mesh.load_obj(file)
+        return cls(axes, vertices, faces, **kwargs)
+
+    def get_vertices(self) -> np.ndarray:
+        """Get untransformed vertices."""
+        return self._vertices
+
+    def get_faces(self) -> np.ndarray:
+        """Get faces as rows of vertex indices, or None when the shape is a single polygon."""
+        return self._faces
+
+    def get_patch(self):
+        """Returns the artist which draws the shape.
+
+        Returns
+        -------
+        typing.Union[patches.Polygon, collections.PolyCollection]
+            Polygon for shapes without faces, otherwise collection of faces.
+
+        """
+        return self._patch
+
+    def get_artists(self):
+        """Returns the shape's artist, followed by its vertex labels."""
+        return [self._patch] + self._labels
+
+    def _get_stages(self):
+        """Returns the stages which coalesce the sequence, transform vertices, convert them to 2D and draw them."""
+        return [
+            ("coalesce", self._coalesce),
+            ("transform", self._transform),
+            ("convert", self._convert),
+            ("patch", self._set_patch)
+        ]
+
+    def _coalesce(self, _):
+        """Returns the coalesced matrix, or None when multiplying the chain with the vertices (see `plan_chain`)."""
+        if self._plan_chain:
+            return None
+        return self._sequence.get_matrix()
+
+    def _set_patch(self, points):
+        """Move the artist's vertices, and vertex labels, to 2D `points`."""
+        self._set_path_vertices(points)
+
+        if self._labels:
+            for label, (x, y) in zip(self._labels, points):
+                label.set_x(x)
+                label.set_y(y)
+
+    def _set_path_vertices(self, points):
+        """Copy 2D `points` into the vertex arrays of the artist's paths, and mark the artist for redrawing."""
+        if self._faces is None:
+            np.copyto(self._path_vertices[:-1], points)
+            np.copyto(self._path_vertices[-1], points[0])
+        else:
+            shape = self._path_vertices.shape
+            if self._face_scratch is None or self._face_scratch[0].shape != points.shape \
+                    or self._face_scratch[0].dtype != points.dtype:
+                self._face_scratch = (np.empty(points.shape, dtype=points.dtype),
+                                      np.empty(shape, dtype=points.dtype))
+            contiguous, gathered = self._face_scratch
+
+            # np.take() copies non-contiguous sources (e.g. the first two columns of the transformed vertices).
+            if not points.flags.c_contiguous:
+                np.copyto(contiguous, points)
+                points = contiguous
+
+            # np.take() cannot cast, so faces are gathered in the points' type and then copied into the paths.
+            # Unlike the default mode, "clip" does not buffer `out`; face indices are always in range.
+            np.take(points, self._closed_faces, axis=0, out=gathered, mode="clip")
+            np.copyto(self._path_vertices, gathered)
+
+        self._patch.stale = True
+
+    def _transform(self, transform):
+        """Apply `transform` to the vertices, or the chain of transforms when `transform` is None (see
+        `plan_chain`)."""
+        if transform is None:
+            return self._sequence.apply(self._vertices)
+
+        return super()._transform(transform)
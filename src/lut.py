@@ -0,0 +1,217 @@
+import collections
+
+import numpy as np
+
+
+def gamma(values, exponent):
+    """Gamma curve of 0-255 channel `values`, for use as a `ColorLookup` modifier."""
+    return 255 * (np.asarray(values) / 255) ** exponent
+
+
+class ColorLookup:
+    """Per-channel nonlinear color adjustments of uint8 images via cached lookup tables.
+
+    Modifiers are callables like those accepted by `MutableMatrix.get_mutator()`, taking a channel value and returning
+    the adjusted value, optionally followed by `parameters` (e.g. the exponent of `gamma()`). The chain of modifiers
+    registered to each channel is compiled into a 256-entry table per channel by evaluating it once for every possible
+    value. Images are then adjusted with one `np.take()` of the shared table when every channel has the same table, or
+    one `np.take()` per channel otherwise.
+
+    Compiled tables are cached by the parameters of every modifier, with least-recently-used eviction, so moving a
+    slider back to a previous value reuses its tables.
+
+    Modifiers are called with an array of all 256 values; modifiers which only accept scalars (e.g. `math.sqrt`) are
+    called once per value instead. Results are rounded and clipped to 0-255.
+
+    Parameters
+    ----------
+    channels : int, optional
+        Number of channels of adjusted images, by default 3.
+
+    maxsize : int, optional
+        Maximum number of cached tables, by default 32.
+
+    Example
+    -------
+    ```python
+    >>> lookup = ColorLookup()
+    >>> stage = lookup.register_modifier(gamma, parameters=(0.5,))
+    >>> lookup.apply(np.array([[[0, 64, 255]]], dtype=np.uint8))
+    array([[[  0, 128, 255]]], dtype=uint8)
+
+    ```
+    """
+    def __init__(self, channels=3, maxsize=32):
+        """Construct an instance."""
+        self._channels = channels
+        self._maxsize = maxsize
+
+        # (modifier, channels, parameters) of each stage, in order of application.
+        self._stages = []
+
+        # Compiled (C, 256) tables by parameters of every stage, least recently used first.
+        self._cache = collections.OrderedDict()
+        self._hits = 0
+        self._misses = 0
+
+    def register_modifier(self, modifier, channels=None, parameters=()) -> int:
+        """Register a modifier to apply after every previously registered modifier.
+
+        Parameters
+        ----------
+        modifier : typing.Callable[..., float]
+            Function of a channel value (and `parameters`) returning the adjusted value.
+
+        channels : typing.Iterable[int], optional
+            Channels to adjust, by default all channels.
+
+        parameters : typing.Iterable[float], optional
+            Initial parameters passed to `modifier` after the value, by default none.
+
+        Returns
+        -------
+        int
+            Index of the stage, for `set_parameters()` and `get_mutator()`.
+
+        """
+        if channels is None:
+            channels = range(self._channels)
+
+        self._stages.append((modifier, frozenset(channels), tuple(parameters)))
+        return len(self._stages) - 1
+
+    def get_parameters(self, index) -> tuple:
+        """Get parameters of stage `index`."""
+        return self._stages[index][2]
+
+    def set_parameters(self, index, parameters):
+        """Set parameters of stage `index`."""
+        modifier, channels, _ = self._stages[index]
+        self._stages[index] = (modifier, channels, tuple(parameters))
+
+    def get_mutator(self, index, parameter_index=0, modifier=None):
+        """Returns a function which sets parameter `parameter_index` of stage `index`, e.g. for `slider.on_changed()`
+
+        Parameters
+        ----------
+        index : int
+            Index of the stage.
+
+        parameter_index : int, optional
+            Index of the parameter within the stage, by default 0.
+
+        modifier : typing.Callable[[float], float], optional
+            Callable function to mutate the value before it is set, by default None.
+
+        Returns
+        -------
+        typing.Callable[[float], None]
+            Mutator function.
+
+        """
+        def func(value):
+            if modifier is not None:
+                value = modifier(value)
+
+            parameters = list(self.get_parameters(index))
+            parameters[parameter_index] = value
+            self.set_parameters(index, parameters)
+
+        return func
+
+    def get_cache_info(self):
+        """Returns (hits, misses, number of cached tables) of the table cache."""
+        return self._hits, self._misses, len(self._cache)
+
+    def get_tables(self) -> np.ndarray:
+        """Returns the compiled (C, 256) uint8 tables for the current parameters of every stage."""
+        key = tuple(parameters for _, _, parameters in self._stages)
+
+        tables = self._cache.get(key)
+        if tables is not None:
+            self._hits += 1
+            self._cache.move_to_end(key)
+            return tables
+
+        self._misses += 1
+        tables = self._compile()
+
+        self._cache[key] = tables
+        if len(self._cache) > self._maxsize:
+            self._cache.popitem(last=False)
+
+        return tables
+
+    def _compile(self):
+        """Evaluate the modifiers of every channel for all 256 values."""
+        values = np.repeat(np.arange(256, dtype=float)[np.newaxis], self._channels, axis=0)
+
+        for modifier, channels, parameters in self._stages:
+            for channel in channels:
+                values[channel] = _evaluate(modifier, values[channel], parameters)
+
+        tables = np.clip(np.rint(values), 0, 255).astype(np.uint8)
+        tables.flags.writeable = False
+        return tables
+
+    def apply(self, image: np.ndarray, out: np.ndarray = None) -> np.ndarray:
+        """Adjust the colors of every pixel of uint8 `image`
+
+        Parameters
+        ----------
+        image : np.ndarray
+            uint8 image of shape (H, W, C).
+
+        out : np.ndarray, optional
+            Preallocated uint8 array of shape (H, W, C) to write into, by default a new array.
+
+        Returns
+        -------
+        np.ndarray
+            Adjusted image.
+
+        Raises
+        ------
+        TypeError
+            Raised when `image` is not uint8.
+
+        ValueError
+            Raised when `image` does not have the channels of the lookup, or `out` is not a uint8 array of the shape
+            of `image`.
+
+        """
+        if image.dtype != np.uint8:
+            raise TypeError(f"Expected uint8 image, got {image.dtype}!")
+
+        if image.shape[-1] != self._channels:
+            raise ValueError(f"Expected {self._channels} channels, got {image.shape[-1]}!")
+
+        if out is not None and (out.shape != image.shape or out.dtype != np.uint8):
+            raise ValueError(f"Expected uint8 out of shape {image.shape}, got {out.dtype} of shape {out.shape}!")
+
+        tables = self.get_tables()
+
+        if (tables == tables[0]).all():
+            # Every channel shares one table, which indexes the image directly.
+            return np.take(tables[0], image, out=out)
+
+        if out is None:
+            out = np.empty_like(image)
+
+        # Indexing flattened tables with image + channel offsets would need an intp index 8x the image's size.
+        for channel in range(self._channels):
+            np.take(tables[channel], image[..., channel], out=out[..., channel])
+
+        return out
+
+
+def _evaluate(modifier, values, parameters):
+    """Apply `modifier` to all `values` at once, falling back to one call per value for scalar-only modifiers."""
+    try:
+        modified = np.asarray(modifier(values, *parameters), dtype=float)
+        if modified.shape == values.shape:
+            return modified
+    except TypeError:
+        pass
+
+    return np.array([modifier(value, *parameters) for value in values], dtype=float)
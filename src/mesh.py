@@ -0,0 +1,76 @@
+import os
+import typing
+
+import numpy as np
+
+
+def load_obj(file) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Load vertices and triangle faces from a Wavefront OBJ-like text file
+
+    Only vertex (`v x y [z [w]]`) and face (`f a b c ...`) statements are read; everything else is ignored. Face
+    indices are 1-based and may be negative (relative to the last vertex read) or carry texture/normal indices
+    (`f 1/1/1 2/2/2 3/3/3`), which are discarded. Faces with more than three vertices are triangulated as fans.
+
+    Parameters
+    ----------
+    file : typing.Union[str, os.PathLike, typing.Iterable[str]]
+        Path of the file to load, or an iterable of its lines (e.g. an open file).
+
+    Returns
+    -------
+    typing.Tuple[np.ndarray, np.ndarray]
+        C-contiguous array of vertices, one per row, and array of triangles as 0-based vertex indices.
+
+    Raises
+    ------
+    ValueError
+        Raised when a face references a vertex which does not exist, or vertices have different dimensions.
+
+    Example
+    -------
+    ```python
+    >>> vertices, faces = load_obj([
+    ...     "v 0 0 0",
+    ...     "v 1 0 0",
+    ...     "v 1 1 0",
+    ...     "v 0 1 0",
+    ...     "f 1 2 3 4",
+    ... ])
+    >>> faces.tolist()
+    [[0, 1, 2], [0, 2, 3]]
+
+    ```
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file) as lines:
+            return load_obj(lines)
+
+    vertices = []
+    triangles = []
+
+    for line in file:
+        fields = line.split()
+        if not fields:
+            continue
+
+        if fields[0] == "v":
+            vertices.append([float(value) for value in fields[1:]])
+        elif fields[0] == "f":
+            indices = []
+            for field in fields[1:]:
+                index = int(field.split("/")[0])
+                indices.append(index - 1 if index > 0 else len(vertices) + index)
+
+            for second, third in zip(indices[1:-1], indices[2:]):
+                triangles.append((indices[0], second, third))
+
+    try:
+        vertices = np.array(vertices, dtype=float, ndmin=2)
+    except ValueError:
+        raise ValueError("Vertices have different dimensions!")
+
+    faces = np.array(triangles, dtype=np.intp).reshape(-1, 3)
+    if faces.size and (faces.min() < 0 or faces.max() >= len(vertices)):
+        raise ValueError("Face references a vertex which does not exist!")
+
+    return vertices, faces
@@ -2,6 +2,8 @@ import typing
 
 import numpy as np
 
+import src.precision as precision
+import src.structures as structures
 from src.componentmatrix import ComponentMatrix
 
 
@@ -11,6 +13,9 @@ class MutableMatrix(ComponentMatrix):
     Manages an 2D np.ndarray (matrix) which can have its values mutated on a
     per-index basis through functions returned by `get_mutator()`.
 
+    The matrix is stored as floats (see `precision.get_matrix_dtype()`), so
+    values set by mutators are never truncated to integers.
+
     Parameters
     ----------
     label : str
@@ -19,15 +24,40 @@ class MutableMatrix(ComponentMatrix):
     matrix : typing.Iterable, optional
         Matrix to manage, by default None
 
+    dtype : np.dtype, optional
+        Data type of the managed matrix, by default `precision.get_matrix_dtype()`
+
+    copy : bool, optional
+        Copy `matrix`, by default True. When False, an array `matrix` of `dtype` is managed as is (e.g. a view into a
+        memory-mapped file), and mutators write into it.
+
     """
-    def __init__(self, label, matrix=None):
+    def __init__(self, label, matrix=None, dtype=None, copy=True):
         """Construct an instance."""
         self._label = label
 
         if matrix is None:
             matrix = []
 
-        self._matrix = np.array(matrix, ndmin=2)
+        if copy:
+            self._matrix = precision.as_matrix(matrix, dtype)
+        else:
+            if dtype is None:
+                dtype = precision.get_matrix_dtype()
+            matrix = np.asarray(matrix, dtype=dtype)
+            self._matrix = matrix if matrix.ndim == 2 else np.atleast_2d(matrix)
+
+        self._version = 0
+
+        # Weak references to listeners notified of mutations (see `ComponentMatrix.add_listener()`).
+        self._listeners = []
+
+        # Whether no mutator was handed out, i.e. nothing is expected to change the matrix.
+        self._constant = True
+
+        # Structure of the matrix, and the version it was detected at.
+        self._structure = None
+        self._structure_version = None
 
     def get_matrix(self) -> np.ndarray:
         """Get managed matrix."""
@@ -37,6 +67,22 @@ class MutableMatrix(ComponentMatrix):
         """Get label."""
         return self._label
 
+    def get_version(self) -> int:
+        """Get counter which increases whenever a mutator changes the managed matrix."""
+        return self._version
+
+    def is_constant(self) -> bool:
+        """Whether no mutator of the managed matrix was handed out."""
+        return self._constant
+
+    def get_structure(self) -> str:
+        """Get structure of the managed matrix, detected again only after a mutator changes it."""
+        if self._structure_version != self._version:
+            self._structure = structures.detect_structure(self._matrix)
+            self._structure_version = self._version
+
+        return self._structure
+
     def get_mutator(self, index, modifier=None):
         """Returns a function which sets the `index` of the managed matrix to the
         value it is given.
@@ -61,7 +107,7 @@ class MutableMatrix(ComponentMatrix):
         Example
         -------
         ```python
-        >>> mm = MutableMatrix([
+        >>> mm = MutableMatrix("M", [
         ...     [1, 0],
         ...     [0, 1]
         ... ])
@@ -69,22 +115,28 @@ class MutableMatrix(ComponentMatrix):
         >>> mutator = mm.get_mutator((0, 1))
         >>> mutator(2)
         >>> mm.get_matrix().tolist()  # doctest: +NORMALIZE_WHITESPACE
-        [[1, 2],
-         [0, 1]]
+        [[1.0, 2.0],
+         [0.0, 1.0]]
 
         >>> mutator = mm.get_mutator((1, 0), modifier=lambda v: v + 1)
-        >>> mutator(2)
+        >>> mutator(0.5)
         >>> mm.get_matrix().tolist()  # doctest: +NORMALIZE_WHITESPACE
-        [[1, 2],
-         [3, 1]]
+        [[1.0, 2.0],
+         [1.5, 1.0]]
 
         ```
         """
+        self._constant = False
+
         if modifier is None:
             def mutate(value: float):
                 self._matrix[index] = value
+                self._version += 1
+                self._notify()
         else:
             def mutate(value: float):
                 self._matrix[index] = modifier(value)
+                self._version += 1
+                self._notify()
 
         return mutate
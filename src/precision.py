@@ -0,0 +1,59 @@
+import numpy as np
+
+
+# Points default to float32, halving the memory bandwidth of transforming large point sets, while matrices (and the
+# products accumulated by coalescing a sequence) default to float64, so long chains stay accurate. A coalesced matrix
+# is only rounded to the points' precision when it is applied to them (see `utility.apply_transform()`).
+
+
+_point_dtype = np.dtype(np.float32)
+_matrix_dtype = np.dtype(np.float64)
+
+
+def get_point_dtype() -> np.dtype:
+    """Get default data type of points."""
+    return _point_dtype
+
+
+def get_matrix_dtype() -> np.dtype:
+    """Get default data type of matrices."""
+    return _matrix_dtype
+
+
+def set_precision(points=None, matrices=None):
+    """Set default data types of points and matrices created from now on
+
+    Parameters
+    ----------
+    points : np.dtype, optional
+        Floating-point data type of points, by default unchanged.
+
+    matrices : np.dtype, optional
+        Floating-point data type of matrices, by default unchanged.
+
+    Raises
+    ------
+    TypeError
+        Raised when a data type is not floating-point.
+
+    """
+    global _point_dtype, _matrix_dtype
+
+    for dtype in (points, matrices):
+        if dtype is not None and not np.issubdtype(dtype, np.floating):
+            raise TypeError(f"Precision must be a floating-point type, got {np.dtype(dtype)}!")
+
+    if points is not None:
+        _point_dtype = np.dtype(points)
+    if matrices is not None:
+        _matrix_dtype = np.dtype(matrices)
+
+
+def as_points(points, dtype=None) -> np.ndarray:
+    """Returns `points` as a C-contiguous array of `dtype`, by default the point data type, copying only if needed."""
+    return np.ascontiguousarray(points, dtype=_point_dtype if dtype is None else dtype)
+
+
+def as_matrix(matrix, dtype=None) -> np.ndarray:
+    """Returns a copy of `matrix` as a 2D array of `dtype`, by default the matrix data type."""
+    return np.array(matrix, dtype=_matrix_dtype if dtype is None else dtype, ndmin=2)
@@ -0,0 +1,202 @@
+import numpy as np
+from matplotlib import collections
+
+import src.precision as precision
+import src.utility as utility
+from src.interactive import Interactive
+
+
+class Scene(Interactive):
+    """Many shapes transformed by one shared sequence of transform matrices.
+
+    Vertices of every shape are stacked into one contiguous array, so each update coalesces the shared sequence once
+    and transforms every vertex of every shape with a single batched `utility.apply_transform()`. Shapes are drawn by
+    a single `collections.PolyCollection` instead of one `patches.Polygon` per shape.
+
+    Transforms and sliders are registered to the scene exactly like `InteractiveSquare`.
+
+    Parameters
+    ----------
+    axes : axes.Axes
+        Axes object on which the scene resides.
+
+    style : dict, optional
+        Collection style, by default None.
+
+    convert_2d: typing.Callable[[np.ndarray], np.ndarray], optional
+        Conversion function from the point's space to 2d space.
+
+    scheduler: UpdateScheduler, optional
+        Scheduler which coalesces slider updates into at most one update per frame, by default None.
+
+    dtype : np.dtype, optional
+        Data type of vertices, by default `precision.get_point_dtype()`.
+
+    Example
+    -------
+    ```python
+    scene = Scene(axes, style=style.green)
+    for x in range(100):
+        scene.add_square((x, 0))
+
+    scene.register_transform(shear_x, label="Sx")
+    scene.register_slider(0, (0, 1), my_slider)
+    scene.update()
+    ```
+    """
+    def __init__(self, axes, style=None, convert_2d=None, scheduler=None, dtype=None):
+        """Construct an instance."""
+        super().__init__(convert_2d, scheduler)
+
+        self._dtype = precision.get_point_dtype() if dtype is None else np.dtype(dtype)
+
+        # Vertex arrays of added shapes, restacked into one array by get_vertices().
+        self._shapes = []
+        self._vertices = None
+
+        # Vertex index at which each shape starts, and the total number of vertices.
+        self._offsets = [0]
+
+        if style:
+            self._collection = collections.PolyCollection([], **style)
+        else:
+            self._collection = collections.PolyCollection([])
+
+        axes.add_collection(self._collection)
+
+    def add_shape(self, vertices) -> int:
+        """Add a shape to the scene. Call `update()` to draw added shapes.
+
+        Parameters
+        ----------
+        vertices : typing.Iterable
+            Vertices of the shape, one per row. Every shape in the scene must have the same number of coordinates.
+
+        Returns
+        -------
+        int
+            Index of the shape.
+
+        Raises
+        ------
+        ValueError
+            Raised when the shape's vertices have a different number of coordinates than prior shapes.
+
+        """
+        return self.add_shapes(np.asarray(vertices, dtype=self._dtype)[np.newaxis])[0]
+
+    def add_shapes(self, shapes) -> range:
+        """Add shapes which have the same number of vertices to the scene. Call `update()` to draw added shapes.
+
+        Parameters
+        ----------
+        shapes : typing.Iterable
+            Array of shape (S, V, D): S shapes of V vertices with D coordinates each.
+
+        Returns
+        -------
+        range
+            Indices of the shapes.
+
+        Raises
+        ------
+        ValueError
+            Raised when the shapes' vertices have a different number of coordinates than prior shapes.
+
+        """
+        shapes = np.asarray(shapes, dtype=self._dtype)
+
+        if self._shapes and shapes.shape[2] != self._shapes[0].shape[1]:
+            raise ValueError(f"Shapes have {shapes.shape[2]} coordinates, "
+                             f"but scene shapes have {self._shapes[0].shape[1]}!")
+
+        first = len(self._offsets) - 1
+        count, vertices, _ = shapes.shape
+
+        self._shapes.append(shapes.reshape(count * vertices, -1))
+        self._offsets.extend(range(self._offsets[-1] + vertices, self._offsets[-1] + (count + 1) * vertices, vertices))
+
+        # Restack vertices on next access.
+        self._vertices = None
+
+        return range(first, first + count)
+
+    def add_square(self, origin=None, scale=1, add_coords=None) -> int:
+        """Add a square to the scene. See `utility.square()`.
+
+        Returns
+        -------
+        int
+            Index of the square.
+
+        """
+        return self.add_shape(utility.square(origin, scale, add_coords=add_coords))
+
+    def get_vertices(self) -> np.ndarray:
+        """Get untransformed vertices of every shape, stacked in one contiguous array."""
+        if self._vertices is None:
+            if self._shapes:
+                self._shapes = [np.ascontiguousarray(np.concatenate(self._shapes))]
+                self._vertices = self._shapes[0]
+            else:
+                self._vertices = np.empty((0, 2), dtype=self._dtype)
+
+        return self._vertices
+
+    def get_shape_count(self) -> int:
+        """Get number of shapes in the scene."""
+        return len(self._offsets) - 1
+
+    def update(self):
+        """Transform and draw every shape in the scene."""
+        self._update_patch()
+
+    def get_collection(self):
+        """Returns the collection which draws the scene's shapes.
+
+        Returns
+        -------
+        collections.PolyCollection
+            Collection of shapes.
+
+        """
+        return self._collection
+
+    def get_artists(self):
+        """Returns the scene's collection."""
+        return [self._collection]
+
+    def _get_stages(self):
+        """Returns the stages which coalesce the sequence, transform vertices, convert them to 2D and draw them."""
+        return [
+            ("coalesce", self._coalesce),
+            ("transform", self._transform),
+            ("convert", self._convert),
+            ("patch", self._set_verts)
+        ]
+
+    def _coalesce(self, _):
+        """Returns the coalesced matrix, or None when no transforms are registered."""
+        if not len(self._sequence):
+            return None
+        return self._sequence.get_matrix()
+
+    def _transform(self, transform):
+        """Transform the vertices of every shape, or return them untransformed in 2D when `transform` is None."""
+        vertices = self.get_vertices()
+        if transform is None or not len(vertices):
+            return vertices[:, :2]
+
+        return super()._transform(transform)
+
+    def _set_verts(self, points):
+        """Split stacked 2D `points` into shapes and hand them to the collection."""
+        if not len(points):
+            return
+
+        counts = np.diff(self._offsets)
+        if np.all(counts == counts[0]):
+            # Shapes with equal vertex counts are passed as one (shapes, vertices, 2) array.
+            self._collection.set_verts(points.reshape(len(counts), counts[0], 2))
+        else:
+            self._collection.set_verts(np.split(points, self._offsets[1:-1]))
@@ -1,74 +1,503 @@
+import weakref
+
 import numpy as np
 
+import src.coalescers as coalescers
+import src.instrumentation as instrumentation
+import src.precision as precision
+import src.structures as structures
+import src.utility as utility
+from src.chainplanner import MULTIPLICATIVE_COALESCERS, ChainPlan
 from src.componentmatrix import ComponentMatrix
 from src.mutablematrix import MutableMatrix
 from src.node import Node
 
 
+# Without reused buffers, runs of block coalescers are assembled into one new array only when it has at least this
+# many elements; smaller matrices are faster to concatenate one node at a time.
+ASSEMBLE_MIN_SIZE = 1 << 15
+
+
 class Sequence(ComponentMatrix):
     """Matrix sequence class.
 
     Manages a sequence of component matrices.
 
+    Parameters
+    ----------
+    reuse_buffers : bool, optional
+        Multiply nodes coalesced by `np.dot` or `np.matmul` into buffers allocated on first evaluation and reused by
+        every later evaluation, instead of allocating new matrices, by default False. Matrices returned by
+        `get_matrix()` are then overwritten when the sequence changes; copy them to keep them.
+
+    fold_constants : bool, optional
+        Coalesce runs of constant nodes once, ahead of time (see `get_eliminated()`), by default True.
+
     """
-    def __init__(self):
+    def __init__(self, reuse_buffers=False, fold_constants=True):
         """Construct an instance."""
         self._nodes = []
 
+        # Nodes evaluated in place of the registered nodes, with runs of constant nodes folded into one node each, and
+        # the folded components. Planned again on first evaluation after registering a node, or after any folded
+        # component changes.
+        self._fold_constants = fold_constants
+        self._evaluated = []
+        self._folded = []
+        self._planned = False
+
+        # Buffers of prefix products by node index, when reusing buffers.
+        self._reuse_buffers = reuse_buffers
+        self._buffers = {}
+
+        # Runs of nodes with block coalescers: (end, components, coalescer infos) by index of the first node of each
+        # run, and the index of the first node of its run (or None) by node index. Found on first evaluation.
+        self._runs = None
+        self._run_starts = None
+
+        # (key, prefix shapes, dtype) of the array each run is assembled into, by index of the run's first node.
+        self._layouts = {}
+
+        # When reusing buffers: (array, lhs, component versions, prefix views) last written by each run.
+        self._blocks = {}
+
+        # Prefix products: _prefixes[i] is (version of node i's component, coalescence of nodes 0 through i).
+        self._prefixes = []
+
+        # Multiplication order used by apply(), and the chain dimensions it was planned for.
+        self._plan = None
+
+        # Points padded with ones by apply(), reused while the number of points and coordinates stay the same.
+        self._padded = None
+
+        # Label, built on first request. Labels of other components never change, so only registering a node here
+        # or in a nested sequence invalidates it; sequences this sequence is registered into are invalidated too.
+        self._label = None
+        self._parents = weakref.WeakSet()
+
     def get_matrix(self):
         """Returns managed matrix.
 
         Returns a single matrix formed from the coalescence of all nodes.
 
+        Coalescence is cached: only nodes from the first node whose component changed (see
+        `ComponentMatrix.get_version()`) onward are coalesced again. Finding that node checks the version of every node
+        up to it, and of every node of nested sequences among them, so even reading an unchanged sequence costs version
+        checks in proportion to its total number of nested nodes. The returned matrix must not be modified.
+
+        Runs of constant nodes (see `ComponentMatrix.is_constant()`) which follow a non-constant node and share an
+        associative coalescer (see `coalescers.is_associative()`) are folded into one matrix, coalesced once; for
+        example, only two multiplications remain of A → dot() → B → dot() → C → dot() → D when only B changes.
+
+        Multiplications (`np.dot` or `np.matmul`) by components of known structure (see
+        `ComponentMatrix.get_structure()`) use `structures.multiply()`: for example, identities are skipped, and
+        diagonals scale columns instead of being multiplied.
+
+        Runs of nodes with block coalescers (e.g. `coalescers.append_column()`, see `CoalescerInfo.place`) are
+        assembled by writing every matrix of the run into one array, instead of concatenating them one at a time
+        (without reused buffers, only for large results, see `ASSEMBLE_MIN_SIZE`). With reused buffers, only
+        matrices which changed are written again.
+
         Returns
         -------
         np.ndarray
             Coalesced matrix.
 
         """
-        try:
-            lhs = self._nodes[0].get_component().get_matrix()
-        except IndexError:
+        if not self._nodes:
             raise ValueError("Sequence has no nodes!")
 
-        for node in self._nodes[1:]:
-            coalesce = node.get_coalescer()
-            rhs = node.get_component().get_matrix()
-            lhs = coalesce(lhs, rhs)
+        return self._get_prefix(len(self._get_evaluated()))
+
+    def _get_evaluated(self):
+        """Get nodes to evaluate, planning them again if any folded component changed since it was folded."""
+        if not self._planned or any(folded.is_stale() for folded in self._folded):
+            self._fold()
+
+        return self._evaluated
+
+    def _fold(self):
+        """Plan nodes to evaluate, folding runs of constant nodes, and discard prefixes of nodes which were replaced."""
+        nodes = self._nodes
+        evaluated = []
+        folded = []
+
+        # Leading constant nodes are coalesced once anyway, as cached prefixes.
+        index = 0
+        while self._fold_constants and index < len(nodes) and nodes[index].get_component().is_constant():
+            index += 1
+        evaluated.extend(nodes[:index])
+
+        while index < len(nodes):
+            node = nodes[index]
+            coalescer = node.get_coalescer()
+
+            end = index + 1
+            if (self._fold_constants and index and coalescers.is_associative(coalescer)
+                    and node.get_component().is_constant()):
+                while (end < len(nodes) and nodes[end].get_coalescer() is coalescer
+                       and nodes[end].get_component().is_constant()):
+                    end += 1
+
+            if end - index > 1:
+                component = _FoldedNodes(nodes[index:end])
+                folded.append(component)
+                evaluated.append(Node(component, coalescer))
+            else:
+                evaluated.append(node)
+
+            index = end
+
+        # Prefixes of leading nodes which were not replaced stay valid.
+        kept = 0
+        while kept < min(len(self._evaluated), len(evaluated)) and self._evaluated[kept] is evaluated[kept]:
+            kept += 1
+        del self._prefixes[kept:]
+
+        self._evaluated = evaluated
+        self._folded = folded
+        self._planned = True
+        self._runs = None
+
+        profiler = instrumentation.get_profiler()
+        if profiler is not None:
+            profiler.count("Sequence folds")
+
+    def get_eliminated(self):
+        """Get number of coalescences (e.g. matrix multiplications) saved by every evaluation by folding constant
+        nodes: the number of nodes minus the number of nodes evaluated."""
+        return len(self._nodes) - len(self._get_evaluated())
+
+    def _get_prefix(self, count):
+        """Returns the coalescence of the first `count` nodes to evaluate, coalescing only nodes which changed since
+        last time."""
+        nodes = self._get_evaluated()
+        prefixes = self._prefixes
+
+        first_dirty = len(prefixes)
+        for index, (version, _) in enumerate(prefixes[:count]):
+            if nodes[index].get_component().get_version() != version:
+                first_dirty = index
+                break
+
+        if self._runs is None:
+            self._find_runs()
+
+        if first_dirty < len(prefixes):
+            # Runs are assembled whole, from their first node.
+            run_start = self._run_starts[first_dirty]
+            if run_start is not None:
+                first_dirty = run_start
+
+            del prefixes[first_dirty:]
+
+        profiler = instrumentation.get_profiler()
+        if profiler is not None:
+            profiler.count("Sequence prefix hits", min(len(prefixes), count))
+            profiler.count("Sequence prefix misses", count - min(len(prefixes), count))
+
+        kept = len(prefixes)
+        index = kept
+        while index < count:
+            node = nodes[index]
+
+            run = self._runs.get(index)
+            if run is not None:
+                if profiler is not None:
+                    start = profiler.clock()
+
+                end = self._assemble(index, run, kept, prefixes)
+
+                if end is not None:
+                    if profiler is not None:
+                        blocks = nodes[index:end]
+                        name = " ".join(_get_coalescer_name(block.get_coalescer()) + "() " +
+                                        block.get_component().get_label() for block in blocks)
+                        profiler.record(name, start, category="coalesce")
+
+                    index = end
+                    continue
+
+            component = node.get_component()
+            version = component.get_version()
+
+            if profiler is not None:
+                start = profiler.clock()
+
+            rhs = component.get_matrix()
+
+            if prefixes:
+                lhs = self._coalesce(index, node.get_coalescer(), prefixes[-1][1], rhs, component)
+            else:
+                # Products accumulate in at least the matrix precision, whatever the first component's type.
+                lhs = np.asarray(rhs).astype(np.result_type(rhs, precision.get_matrix_dtype()), copy=False)
+
+            if profiler is not None:
+                name = component.get_label()
+                if index:
+                    name = _get_coalescer_name(node.get_coalescer()) + "() " + name
+                profiler.record(name, start, category="coalesce")
+
+            prefixes.append((version, lhs))
+            index += 1
+
+        return prefixes[count - 1][1]
+
+    def _find_runs(self):
+        """Find runs of consecutive nodes to evaluate with block coalescers (see `CoalescerInfo.place`)."""
+        nodes = self._evaluated
+        self._runs = {}
+        self._run_starts = [None] * len(nodes)
+        self._layouts.clear()
+        self._blocks.clear()
+
+        # The first node has no prefix to coalesce with, so it never starts a run.
+        index = 1
+        while index < len(nodes):
+            end = index
+            while end < len(nodes) and coalescers.is_block(nodes[end].get_coalescer()):
+                self._run_starts[end] = index
+                end += 1
+
+            if end > index:
+                run = nodes[index:end]
+                self._runs[index] = (end, [node.get_component() for node in run],
+                                     [coalescers.get_info(node.get_coalescer()) for node in run])
+
+            index = end + 1
+
+    def _assemble(self, start, run, kept, prefixes):
+        """Coalesce `run` of block coalescers from node `start` into one array, appending the prefix of every node of
+        the run (each a view of the array's top-left corner) to `prefixes`.
+
+        Returns the index of the node after the run, or None (appending nothing) when any matrix is not 2D or the
+        result is too small to assemble (see `ASSEMBLE_MIN_SIZE`). When reusing buffers, matrices unchanged since they
+        were last written (including the prefix before the run, if it is among the first `kept` prefixes) are not
+        written again.
+        """
+        end, components, infos = run
+
+        layout = self._layouts.get(start)
+        if layout is not None and layout[1] is None:
+            # Found to be too small to assemble.
+            return None
+
+        lhs = prefixes[-1][1]
+        versions = [component.get_version() for component in components]
+        matrices = [np.asarray(component.get_matrix()) for component in components]
+
+        # Shapes of the prefixes of the run and dtype of the array, while the shapes and dtypes of the matrices stay
+        # the same.
+        key = [(lhs.shape, lhs.dtype)] + [(matrix.shape, matrix.dtype) for matrix in matrices]
+        if layout is None or layout[0] != key:
+            if lhs.ndim != 2 or any(matrix.ndim != 2 for matrix in matrices):
+                return None
+
+            shapes = [lhs.shape]
+            for info, matrix in zip(infos, matrices):
+                shapes.append(tuple(info.shape(shapes[-1], matrix.shape)))
+
+            if not self._reuse_buffers and shapes[-1][0] * shapes[-1][1] < ASSEMBLE_MIN_SIZE:
+                self._layouts[start] = (key, None, None)
+                return None
+
+            layout = self._layouts[start] = (key, shapes, np.result_type(lhs, *matrices))
+            self._blocks.pop(start, None)
+
+        _, shapes, dtype = layout
+
+        written = self._blocks.get(start) if self._reuse_buffers else None
+        if written is None:
+            buffer = np.empty(shapes[-1], dtype=dtype)
+            written = (buffer, None, None, [buffer[:shape[0], :shape[1]] for shape in shapes[1:]])
+
+        buffer, written_lhs, written_versions, views = written
+
+        if written_lhs is not lhs or start - 1 >= kept:
+            buffer[:lhs.shape[0], :lhs.shape[1]] = lhs
+
+        for position, (info, matrix) in enumerate(zip(infos, matrices)):
+            if written_versions is None or written_versions[position] != versions[position]:
+                info.place(buffer, shapes[position], matrix)
+
+        if self._reuse_buffers:
+            self._blocks[start] = (buffer, lhs, versions, views)
+
+        prefixes.extend(zip(versions, views))
+
+        return end
 
-        return lhs
+    def _coalesce(self, index, coalesce, lhs, rhs, component):
+        """Coalesce node `index` (of `component`) with the prefix before it, into the node's buffer when reusing
+        buffers."""
+        if coalesce not in MULTIPLICATIVE_COALESCERS or not lhs.ndim == rhs.ndim == 2:
+            return coalesce(lhs, rhs)
+
+        structure = component.get_structure()
+
+        if not self._reuse_buffers:
+            if structure == structures.DENSE:
+                return coalesce(lhs, rhs)
+            return structures.multiply(lhs, rhs, structure)
+
+        shape = (lhs.shape[0], rhs.shape[1])
+        dtype = np.result_type(lhs, rhs)
+
+        buffer = self._buffers.get(index)
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self._buffers[index] = np.empty(shape, dtype=dtype)
+
+        return structures.multiply(lhs, rhs, structure, out=buffer)
+
+    def apply(self, points, out=None):
+        """Apply the coalesced matrix to `points`, multiplying in the cheapest order.
+
+        Equivalent to `utility.apply_transform(self.get_matrix(), points, out=out)`, but trailing nodes coalesced by
+        matrix multiplication (`np.dot` or `np.matmul`) are multiplied together with the points in the order which
+        takes the fewest scalar multiplications (see `ChainPlan`). For example, few points pushed through a long
+        chain of large matrices are multiplied through each matrix in turn, instead of multiplying the chain into one
+        matrix first. Nodes before the last node with any other coalescer are coalesced into a single matrix.
+        Trailing identities (see `ComponentMatrix.get_structure()`) are left out of the chain.
+
+        The plan is cached until the shape of any matrix, or of `points`, changes.
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Array of points to transform, with shape (P, D).
+
+        out : np.ndarray, optional
+            Preallocated array to write transformed points into, by default None.
+
+        Returns
+        -------
+        np.ndarray
+            Vector of transformed points.
+
+        """
+        if not self._nodes:
+            raise ValueError("Sequence has no nodes!")
+
+        profiler = instrumentation.get_profiler()
+        if profiler is None:
+            return self._apply(points, out)
+
+        start = profiler.clock()
+        result = self._apply(points, out)
+        profiler.record("Sequence.apply", start, category="transform")
+        return result
+
+    def _apply(self, points, out):
+        """Implements `apply()`."""
+        nodes = self._get_evaluated()
+
+        head = len(nodes) - 1
+        while head > 0 and nodes[head].get_coalescer() in MULTIPLICATIVE_COALESCERS:
+            head -= 1
+
+        matrices = [self._get_prefix(head + 1)]
+        for node in nodes[head + 1:]:
+            component = node.get_component()
+            matrix = component.get_matrix()
+
+            # Identities aligned with the chain are left out of it.
+            if component.get_structure() != structures.IDENTITY or matrices[-1].shape[-1] != matrix.shape[0]:
+                matrices.append(matrix)
+
+        if len(matrices) == 1:
+            return utility.apply_transform(matrices[0], points, out=out)
+
+        dimensions = points.shape[1]
+        columns = matrices[-1].shape[1]
+        if columns < dimensions:
+            raise ValueError(f"shapes {matrices[-1].shape} and {points.shape} not aligned: "
+                             f"{columns} (matrix columns) < {dimensions} (point coordinates)")
+
+        if columns > dimensions:
+            shape = (points.shape[0], columns)
+            if self._padded is None or self._padded.shape != shape or self._padded.dtype != points.dtype:
+                self._padded = np.ones(shape, dtype=points.dtype)
+            self._padded[:, :dimensions] = points
+            points = self._padded
+
+        # Points are row vectors, so the chain is transposed: x'(AB...)' = x'...B'A'.
+        # Rows of the first matrix past `dimensions` would be truncated from the result, so they are dropped first.
+        operands = [points]
+        operands.extend(matrix.T for matrix in reversed(matrices[1:]))
+        operands.append(matrices[0][:dimensions].T)
+
+        chain = [points.shape[0]] + [operand.shape[1] for operand in operands]
+        if self._plan is None or self._plan.get_dimensions() != tuple(chain):
+            self._plan = ChainPlan(chain)
+
+        # Products of matrices alone keep the matrix precision; only those with the points are in their precision.
+        dtype = points.dtype if np.issubdtype(points.dtype, np.floating) else None
+        return self._plan.evaluate(operands, out=out, dtype=dtype)
+
+    def get_options(self):
+        """Get keyword arguments which construct an empty sequence with the options of this one."""
+        return {"reuse_buffers": self._reuse_buffers, "fold_constants": self._fold_constants}
+
+    def get_plan(self):
+        """Get multiplication order used by the last call to `apply()`, or None."""
+        return self._plan
+
+    def get_version(self):
+        """Get counter which increases whenever any node's component changes, or a node is registered.
+
+        Sums the versions of all components, so costs one version check per node, including every node of nested
+        sequences.
+        """
+        return len(self._nodes) + sum(node.get_component().get_version() for node in self._nodes)
+
+    def is_constant(self):
+        """Whether every node's component is constant."""
+        return all(node.get_component().is_constant() for node in self._nodes)
+
+    def __len__(self):
+        """Get number of nodes."""
+        return len(self._nodes)
 
     def get_label(self):
         """Get string representation of node relationship."""
-        label = ""
+        if self._label is None:
+            if not self._nodes:
+                raise ValueError("Sequence has no nodes!")
 
-        enclosed = (len(self._nodes) > 1)
-        if enclosed:
-            label += "["
+            parts = [self._nodes[0].get_component().get_label()]
+            for node in self._nodes[1:]:
+                coalescer = node.get_coalescer()
+                if coalescer:
+                    parts.append(_get_coalescer_name(coalescer) + "()")
+                parts.append(node.get_component().get_label())
 
-        try:
-            lhs = self._nodes[0].get_component().get_label()
-            label += lhs
-        except IndexError:
-            raise ValueError("Sequence has no nodes!")
+            label = " → ".join(parts)
+            if len(self._nodes) > 1:
+                label = "[" + label + "]"
 
-        for node in self._nodes[1:]:
-            label += " → "
-            coalescer = node.get_coalescer()
-            if coalescer:
-                if coalescer.__name__ == "<lambda>":
-                    label += "lambda()"
-                else:
-                    label += coalescer.__qualname__ + "()"
-                label += " → "
+            self._label = label
+
+        return self._label
 
-            rhs = node.get_component().get_label()
-            label += rhs
+    def get_tree(self):
+        """Get structure of node relationship, without parsing the label.
+
+        Returns
+        -------
+        dict
+            JSON-compatible {"type": class name, "label": label, "nodes": [{"coalescer": name or None,
+            "component": tree of component}]}, where trees of components are from `ComponentMatrix.get_tree()`.
 
-        if enclosed:
-            label += "]"
+        """
+        nodes = []
+        for node in self._nodes:
+            coalescer = node.get_coalescer()
+            nodes.append({
+                "coalescer": _get_coalescer_name(coalescer) if coalescer else None,
+                "component": node.get_component().get_tree()
+            })
 
-        return label
+        return {"type": type(self).__name__, "label": self.get_label(), "nodes": nodes}
 
     def register_node(self, component, coalescer):
         """Register a node into the sequence.
@@ -84,6 +513,22 @@ class Sequence(ComponentMatrix):
         """
         node = Node(component, coalescer)
         self._nodes.append(node)
+        self._planned = False
+
+        if isinstance(component, Sequence):
+            component._parents.add(self)
+
+        self._invalidate_label()
+
+    def _invalidate_label(self):
+        """Discard the cached label of this sequence and of every sequence containing it."""
+        if self._label is None:
+            # Labels of containing sequences are built from this label, so none of them are cached either.
+            return
+
+        self._label = None
+        for parent in self._parents:
+            parent._invalidate_label()
 
     def get_node(self, index):
         """Gets node at `index`.
@@ -100,3 +545,61 @@ class Sequence(ComponentMatrix):
 
         """
         return self._nodes[index]
+
+
+class _FoldedNodes(ComponentMatrix):
+    """Coalescence of a run of constant nodes sharing an associative coalescer, coalesced once when constructed.
+
+    Parameters
+    ----------
+    nodes : typing.List[Node]
+        Nodes of the run, in sequence order.
+
+    """
+    def __init__(self, nodes):
+        """Construct an instance."""
+        self._nodes = nodes
+        self._components = [node.get_component() for node in nodes]
+        self._versions = [component.get_version() for component in self._components]
+
+        coalescer = nodes[-1].get_coalescer()
+        matrix = self._components[0].get_matrix()
+        for component in self._components[1:]:
+            matrix = coalescer(matrix, component.get_matrix())
+        self._matrix = matrix
+        self._structure = None
+
+    def get_matrix(self):
+        """Get coalescence of the run."""
+        return self._matrix
+
+    def get_label(self):
+        """Get labels of the run, e.g. "[B → dot() → C]"."""
+        parts = [self._components[0].get_label()]
+        for node in self._nodes[1:]:
+            parts.append(_get_coalescer_name(node.get_coalescer()) + "()")
+            parts.append(node.get_component().get_label())
+
+        return "[" + " → ".join(parts) + "]"
+
+    def is_constant(self):
+        """Folded nodes are constant; see `is_stale()`."""
+        return True
+
+    def get_structure(self):
+        """Get structure of the coalescence of the run, detected once."""
+        if self._structure is None:
+            self._structure = structures.detect_structure(self._matrix)
+
+        return self._structure
+
+    def is_stale(self):
+        """Whether any component changed since it was folded."""
+        return any(component.get_version() != version for component, version in zip(self._components, self._versions))
+
+
+def _get_coalescer_name(coalescer):
+    """Get name of `coalescer`, e.g. "dot"."""
+    if coalescer.__name__ == "<lambda>":
+        return "lambda"
+    return coalescer.__qualname__
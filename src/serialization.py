@@ -0,0 +1,198 @@
+import json
+import math
+import os
+
+import numpy as np
+
+import src.coalescers as coalescers
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.treesequence import TreeSequence
+
+
+# A saved sequence is a directory holding two files:
+#   manifest.json: the graph of components. Every component is stored once, in a table; nodes refer to components
+#                  by index, so components shared between (or within) sequences are shared again when loaded.
+#                  Sequences store their options (see `Sequence.get_options()`), with coalescers by name.
+#   matrices.npy:  every matrix, flattened and concatenated into one 1D array, located by offset and shape.
+
+
+FORMAT_VERSION = 1
+
+MANIFEST = "manifest.json"
+MATRICES = "matrices.npy"
+
+_SEQUENCES = {cls.__name__: cls for cls in (Sequence, TreeSequence)}
+
+
+def save_sequence(sequence: Sequence, path, freeze=False):
+    """Save `sequence`, its nested sequences and their components into directory `path`.
+
+    Options of sequences (see `Sequence.get_options()`) are saved with them.
+
+    Parameters
+    ----------
+    sequence : Sequence
+        Sequence to save.
+
+    path : str
+        Directory to save into; created if it does not exist.
+
+    freeze : bool, optional
+        Save components other than sequences and `MutableMatrix` (e.g. `EulerRotation`) as a `MutableMatrix` of
+        their current matrix, by default False.
+
+    Raises
+    ------
+    TypeError
+        Raised when a component can not be saved.
+
+    ValueError
+        Raised when a coalescer of any node but the first, or an associative coalescer of a `TreeSequence`, is not
+        registered (see `coalescers.register_coalescer()`).
+
+    """
+    table = []
+    matrices = []
+    indices = {}
+    offset = 0
+
+    def add(component):
+        nonlocal offset
+
+        index = indices.get(id(component))
+        if index is not None:
+            return index
+
+        kind = type(component).__name__
+        if _SEQUENCES.get(kind) is type(component):
+            nodes = []
+            for position in range(len(component)):
+                node = component.get_node(position)
+                nodes.append({
+                    # The first node is never coalesced, so its coalescer is not saved.
+                    "coalescer": _get_coalescer_name(node.get_coalescer()) if position else None,
+                    "component": add(node.get_component())
+                })
+            entry = {"type": kind, "options": _save_options(component.get_options()), "nodes": nodes}
+        elif isinstance(component, MutableMatrix) or freeze:
+            matrix = np.asarray(component.get_matrix())
+            entry = {"type": "MutableMatrix", "label": component.get_label(), "offset": offset,
+                     "shape": list(matrix.shape)}
+            matrices.append((offset, matrix))
+            offset += matrix.size
+        else:
+            raise TypeError(f"Can not save {kind} {component.get_label()!r}; save with freeze=True to save its "
+                            "current matrix!")
+
+        # Nested components come first, so loading never refers to a component which is not loaded yet.
+        indices[id(component)] = len(table)
+        table.append(entry)
+        return indices[id(component)]
+
+    root = add(sequence)
+
+    dtype = np.result_type(*(matrix for _, matrix in matrices)) if matrices else np.dtype(float)
+    buffer = np.empty(offset, dtype=dtype)
+    for start, matrix in matrices:
+        buffer[start:start + matrix.size] = matrix.ravel()
+
+    manifest = {"format": FORMAT_VERSION, "dtype": dtype.str, "root": root, "components": table}
+
+    os.makedirs(path, exist_ok=True)
+    np.save(os.path.join(path, MATRICES), buffer)
+    with open(os.path.join(path, MANIFEST), "w") as file:
+        file.write(json.dumps(manifest))
+
+
+def load_sequence(path, mmap_mode="c") -> Sequence:
+    """Load a sequence saved by `save_sequence()` from directory `path`.
+
+    Matrices of loaded components are views into one array of every matrix. By default it is memory-mapped
+    copy-on-write: loading reads only the manifest, and processes loading the same file share its pages until a
+    mutator writes to them. Writes are never saved to the file.
+
+    Parameters
+    ----------
+    path : str
+        Directory to load from.
+
+    mmap_mode : str, optional
+        Memory-map mode of the matrices (see `np.load()`), or None to read them into memory, by default "c". With
+        "r", mutators of loaded matrices raise ValueError.
+
+    Returns
+    -------
+    Sequence
+        Loaded sequence.
+
+    Raises
+    ------
+    ValueError
+        Raised when the saved format is not supported, or a saved coalescer is not registered.
+
+    """
+    with open(os.path.join(path, MANIFEST)) as file:
+        manifest = json.load(file)
+
+    if manifest.get("format") != FORMAT_VERSION:
+        raise ValueError(f"Unsupported sequence format {manifest.get('format')!r}, expected {FORMAT_VERSION}!")
+
+    # Slicing a plain view of a memory map is cheaper than slicing the map itself, and shares the same pages.
+    buffer = np.load(os.path.join(path, MATRICES), mmap_mode=mmap_mode).view(np.ndarray)
+
+    components = []
+    for entry in manifest["components"]:
+        if entry["type"] == "MutableMatrix":
+            start = entry["offset"]
+            shape = tuple(entry["shape"])
+            matrix = buffer[start:start + math.prod(shape)].reshape(shape)
+            component = MutableMatrix(entry["label"], matrix, dtype=buffer.dtype, copy=False)
+        elif entry["type"] in _SEQUENCES:
+            component = _SEQUENCES[entry["type"]](**_load_options(entry.get("options", {})))
+            for node in entry["nodes"]:
+                coalescer = node["coalescer"]
+                if coalescer is not None:
+                    coalescer = coalescers.get_coalescer(coalescer)
+                component.register_node(components[node["component"]], coalescer)
+        else:
+            raise ValueError(f"Unsupported component type {entry['type']!r}!")
+
+        components.append(component)
+
+    return components[manifest["root"]]
+
+
+def _save_options(options):
+    """Get JSON-compatible `options` of a sequence, with collections of coalescers as sorted lists of names."""
+    saved = {}
+    for name, value in options.items():
+        if isinstance(value, (set, frozenset)):
+            value = {"coalescers": sorted(_get_coalescer_name(coalescer) for coalescer in value)}
+        saved[name] = value
+
+    return saved
+
+
+def _load_options(saved):
+    """Get options of a sequence saved by `_save_options()`."""
+    options = {}
+    for name, value in saved.items():
+        if isinstance(value, dict):
+            value = frozenset(coalescers.get_coalescer(coalescer) for coalescer in value["coalescers"])
+        options[name] = value
+
+    return options
+
+
+def _get_coalescer_name(coalescer):
+    """Get registered name of `coalescer`, or None for no coalescer."""
+    if coalescer is None:
+        return None
+
+    name = coalescers.get_coalescer_name(coalescer)
+    if name is None:
+        raise ValueError(f"Coalescer {coalescer!r} is not registered; register it with "
+                         "coalescers.register_coalescer() to save it!")
+
+    return name
@@ -0,0 +1,141 @@
+import os
+import typing
+
+import numpy as np
+
+from src.colortransform import ColorTransform
+
+
+def open_image(source, mode: str = "r", shape: typing.Tuple[int] = None, dtype=None) -> np.ndarray:
+    """Returns a memory-mapped (H, W, C) image, so that only the rows which are accessed are read into memory
+
+    Parameters
+    ----------
+    source : typing.Union[str, os.PathLike, np.ndarray]
+        Path of an .npy file, path of a raw file of `shape` and `dtype`, or an array (returned as-is).
+
+    mode : str, optional
+        Memory-map mode, by default "r". "w+" creates (or overwrites) an .npy file of `shape` and `dtype`.
+
+    shape : typing.Tuple[int], optional
+        Shape (H, W, C) of raw files and new .npy files, by default None.
+
+    dtype : np.dtype, optional
+        Data type of raw files and new .npy files, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        Memory-mapped image.
+
+    """
+    if isinstance(source, np.ndarray):
+        return source
+
+    if os.fspath(source).endswith(".npy"):
+        if mode == "w+":
+            return np.lib.format.open_memmap(source, mode=mode, dtype=dtype, shape=shape)
+        return np.load(source, mmap_mode=mode)
+
+    if shape is None or dtype is None:
+        raise ValueError("Must provide `shape` and `dtype` of raw image files!")
+
+    return np.memmap(source, mode=mode, dtype=dtype, shape=shape)
+
+
+def iter_strips(height: int, strip_rows: int) -> typing.Iterator[slice]:
+    """Yields slices of consecutive rows covering `height` rows, `strip_rows` rows at a time
+
+    Parameters
+    ----------
+    height : int
+        Number of rows.
+
+    strip_rows : int
+        Number of rows per strip. The last strip may be shorter.
+
+    Yields
+    ------
+    slice
+        Rows of the strip.
+
+    """
+    for start in range(0, height, strip_rows):
+        yield slice(start, min(start + strip_rows, height))
+
+
+def strip_rows_for(shape: typing.Tuple[int], strip_pixels: int) -> int:
+    """Returns the number of whole rows of an image of `shape` fitting in `strip_pixels` pixels (at least one)."""
+    return max(1, strip_pixels // shape[1])
+
+
+def transform_image(color: ColorTransform, source, destination, dtype=None, strip_rows: int = None,
+                    strip_pixels: int = 1 << 20) -> np.ndarray:
+    """Transform the colors of an image too large for memory, a strip of rows at a time
+
+    The source is memory-mapped (see `open_image()`) and the destination is a memory-mapped .npy file (or array), so
+    peak memory is bounded by the strip size rather than the image size. uint8 images written to uint8 destinations
+    use `ColorTransform.apply_uint8()`, otherwise strips are transformed into float32 by `ColorTransform.apply()`,
+    then rounded and clipped to the range of integer destinations.
+
+    Parameters
+    ----------
+    color : ColorTransform
+        Color transform to apply.
+
+    source : typing.Union[str, os.PathLike, np.ndarray]
+        Image of shape (H, W, C) to transform. See `open_image()`.
+
+    destination : typing.Union[str, os.PathLike, np.ndarray]
+        Path of the .npy file to create, or preallocated C-contiguous array to write into.
+
+    dtype : np.dtype, optional
+        Data type of a created destination, by default uint8 for uint8 sources and float32 otherwise.
+
+    strip_rows : int, optional
+        Number of rows per strip, by default as many whole rows as fit in `strip_pixels`.
+
+    strip_pixels : int, optional
+        Maximum number of pixels per strip when `strip_rows` is not given, by default 1048576.
+
+    Returns
+    -------
+    np.ndarray
+        Memory-mapped transformed image.
+
+    """
+    source = open_image(source)
+    height, width, channels = source.shape
+
+    if not isinstance(destination, np.ndarray):
+        if dtype is None:
+            dtype = np.uint8 if source.dtype == np.uint8 else np.float32
+
+        rows = color.get_sequence().get_matrix().shape[0]
+        destination = open_image(destination, "w+", (height, width, min(rows, channels)), dtype)
+
+    if strip_rows is None:
+        strip_rows = strip_rows_for(source.shape, strip_pixels)
+
+    if source.dtype == np.uint8 and destination.dtype == np.uint8:
+        for rows in iter_strips(height, strip_rows):
+            color.apply_uint8(source[rows], out=destination[rows])
+    elif np.issubdtype(destination.dtype, np.integer):
+        limits = np.iinfo(destination.dtype)
+        for rows in iter_strips(height, strip_rows):
+            # Into the transform's reused float32 buffer, then cast.
+            strip = color.apply(source[rows])
+            np.rint(strip, out=strip)
+            np.clip(strip, limits.min, limits.max, out=strip)
+            np.copyto(destination[rows], strip, casting="unsafe")
+    elif destination.dtype == np.float32:
+        for rows in iter_strips(height, strip_rows):
+            color.apply(source[rows], out=destination[rows])
+    else:
+        for rows in iter_strips(height, strip_rows):
+            destination[rows] = color.apply(source[rows])
+
+    if isinstance(destination, np.memmap):
+        destination.flush()
+
+    return destination
@@ -0,0 +1,101 @@
+import numpy as np
+
+
+# Structures of square matrices, from most to least specific. Every structure other than DENSE lets a matrix product
+# by the matrix be computed without a full matrix multiplication (see `multiply()`), except AFFINE, which is only
+# tagged.
+IDENTITY = "identity"
+DIAGONAL = "diagonal"
+PERMUTATION = "permutation"
+AFFINE = "affine"
+DENSE = "dense"
+
+# Products by diagonals and permutations with fewer elements than this are matrix multiplications, which are faster
+# for small matrices.
+MULTIPLY_MIN_SIZE = 1 << 13
+
+
+def detect_structure(matrix) -> str:
+    """Returns the most specific structure of `matrix`
+
+    Parameters
+    ----------
+    matrix : np.ndarray
+        Matrix to inspect.
+
+    Returns
+    -------
+    str
+        IDENTITY, DIAGONAL (zero off the diagonal), PERMUTATION (a single 1 in every row and column, zeros elsewhere),
+        AFFINE (last row [0 ... 0 1], e.g. a homogenous rotation and translation) or DENSE (anything else, including
+        matrices which are not square).
+
+    """
+    matrix = np.asarray(matrix)
+    if matrix.ndim != 2 or matrix.shape[0] != matrix.shape[1] or not matrix.size:
+        return DENSE
+
+    size = matrix.shape[0]
+    diagonal = np.diagonal(matrix)
+    nonzero = np.count_nonzero(matrix)
+
+    if nonzero == np.count_nonzero(diagonal):
+        return IDENTITY if (diagonal == 1).all() else DIAGONAL
+
+    if nonzero == size and np.count_nonzero(matrix == 1) == size:
+        ones = matrix == 1
+        if ones.any(axis=0).all() and ones.any(axis=1).all():
+            return PERMUTATION
+
+    last = matrix[-1]
+    if last[-1] == 1 and not np.count_nonzero(last[:-1]):
+        return AFFINE
+
+    return DENSE
+
+
+def multiply(lhs: np.ndarray, rhs: np.ndarray, structure: str, out: np.ndarray = None) -> np.ndarray:
+    """Returns matrix product lhs · rhs, where `rhs` has `structure` (see `detect_structure()`)
+
+    Products by an identity are skipped, returning `lhs` itself (not written into `out`). Products by a diagonal scale
+    the columns of `lhs`, and products by a permutation reorder them, when `rhs` has at least `MULTIPLY_MIN_SIZE`
+    elements. Other products, and products whose result would not have the dtype of `lhs` (e.g. by a matrix of higher
+    precision), are matrix multiplications.
+
+    Parameters
+    ----------
+    lhs : np.ndarray
+        2D matrix.
+
+    rhs : np.ndarray
+        2D matrix.
+
+    structure : str
+        Structure of `rhs`.
+
+    out : np.ndarray, optional
+        Preallocated array to write the product into, by default None.
+
+    Returns
+    -------
+    np.ndarray
+        Product, with the shape and dtype of `np.matmul(lhs, rhs)`.
+
+    """
+    if structure == DENSE or (structure != IDENTITY and rhs.size < MULTIPLY_MIN_SIZE):
+        # np.dot has less overhead than np.matmul for small matrices.
+        return np.dot(lhs, rhs) if out is None else np.matmul(lhs, rhs, out=out)
+
+    if (lhs.ndim == rhs.ndim == 2 and lhs.shape[1] == rhs.shape[0] == rhs.shape[1]
+            and np.result_type(lhs, rhs) == lhs.dtype):
+        if structure == IDENTITY:
+            return lhs
+
+        if structure == DIAGONAL:
+            return np.multiply(lhs, np.diagonal(rhs), out=out)
+
+        if structure == PERMUTATION:
+            # Column j of the product is column i of lhs, where rhs[i, j] is 1.
+            return np.take(lhs, np.argmax(rhs, axis=0), axis=1, out=out)
+
+    return np.matmul(lhs, rhs, out=out)
@@ -0,0 +1,147 @@
+import typing
+
+import numpy as np
+
+import src.coalescers as coalescers
+import src.utility as utility
+from src.sequence import Sequence
+from src.transforms import StructuredTransform
+
+
+def sweep(sequence: Sequence, slots: typing.Sequence[tuple], values, points: np.ndarray = None,
+          row_vector: bool = False):
+    """Evaluate `sequence` for many values of selected component indices at once, without mutating it
+
+    Each slot selects a value like `Interactive.register_slider()` does: an index of a component (or tuple of indices
+    into nested sequences), an index within it, and optionally a modifier. Row k of `values` holds the value of each
+    slot for evaluation k.
+
+    Components with swept slots are built as stacks of K matrices (structured transforms build theirs from stacked
+    parameters), and stacks are coalesced with broadcasting operations such as `np.matmul`. Only nodes whose
+    coalescer has no broadcasting equivalent (see `CoalescerInfo.batched`) are coalesced once per evaluation.
+
+    Modifiers are called with a column of K values; modifiers which only accept scalars (e.g. `math.radians`) are
+    called once per value instead.
+
+    Parameters
+    ----------
+    sequence : Sequence
+        Sequence to evaluate.
+
+    slots : typing.Sequence[tuple]
+        (index_of_component, index_within_component) or (index_of_component, index_within_component, modifier)
+        for each swept value.
+
+    values : np.ndarray
+        Values of shape (K, S) for S slots, or (K,) for a single slot.
+
+    points : np.ndarray, optional
+        Points of shape (P, D) to transform by each evaluated matrix, by default None.
+
+    row_vector : bool, optional
+        `False` to treat points as column vectors, `True` to treat points as row vectors, by default False.
+
+    Returns
+    -------
+    typing.Union[np.ndarray, typing.Tuple[np.ndarray, np.ndarray]]
+        Matrices of shape (K, M, N), and transformed points of shape (K, P, D) when `points` are given.
+
+    Example
+    -------
+    ```python
+    angles = np.linspace(0, 2 * np.pi, 360)
+    matrices, frames = sweep(sequence, [((1, 0), 0)], angles, points=square)
+    ```
+    """
+    values = np.asarray(values, dtype=float)
+    if values.ndim == 1:
+        values = values[:, np.newaxis]
+
+    if values.shape[1] != len(slots):
+        raise ValueError(f"{values.shape[1]} values per evaluation, but {len(slots)} slots!")
+
+    # Swept (index_within_component, modifier, column of values) of each component, by path of component indices.
+    swept = {}
+    for column, slot in zip(values.T, slots):
+        index_of_component, index_within_component = slot[:2]
+        modifier = slot[2] if len(slot) > 2 else None
+
+        if isinstance(index_of_component, int):
+            index_of_component = (index_of_component,)
+
+        swept.setdefault(tuple(index_of_component), []).append((index_within_component, modifier, column))
+
+    count = values.shape[0]
+    matrices = _evaluate(sequence, (), swept, count)
+    matrices = np.broadcast_to(matrices, (count,) + matrices.shape[-2:])
+
+    if points is None:
+        return matrices
+
+    return matrices, utility.apply_transform(matrices, points, row_vector=row_vector)
+
+
+def _evaluate(sequence, path, swept, count):
+    """Coalesce nodes of `sequence`, at `path` within the swept sequence, into a matrix or stack of matrices."""
+    lhs = None
+    for index in range(len(sequence)):
+        node = sequence.get_node(index)
+        component = node.get_component()
+        node_path = path + (index,)
+
+        if isinstance(component, Sequence) and any(key[:len(node_path)] == node_path for key in swept):
+            rhs = _evaluate(component, node_path, swept, count)
+        elif node_path in swept:
+            rhs = _stack(component, swept[node_path], count)
+        else:
+            rhs = component.get_matrix()
+
+        lhs = rhs if lhs is None else _coalesce(node.get_coalescer(), lhs, rhs)
+
+    return lhs
+
+
+def _stack(component, slots, count):
+    """Build a stack of `count` matrices of `component`, with `slots` set to their swept values."""
+    if isinstance(component, StructuredTransform):
+        parameters = np.repeat(component.get_parameters()[np.newaxis], count, axis=0)
+        for index, modifier, column in slots:
+            parameters[(slice(None),) + np.index_exp[index]] = _modify(modifier, column)
+        return component.get_matrices(parameters)
+
+    matrix = component.get_matrix()
+    stack = np.repeat(matrix[np.newaxis].astype(np.result_type(matrix, float)), count, axis=0)
+    for index, modifier, column in slots:
+        stack[(slice(None),) + tuple(index)] = _modify(modifier, column)
+    return stack
+
+
+def _modify(modifier, column):
+    """Apply `modifier` to a column of values, falling back to one call per value for scalar-only modifiers."""
+    if modifier is None:
+        return column
+
+    try:
+        modified = np.asarray(modifier(column), dtype=float)
+        if modified.shape == column.shape:
+            return modified
+    except TypeError:
+        pass
+
+    return np.array([modifier(value) for value in column], dtype=float)
+
+
+def _coalesce(coalescer, lhs, rhs):
+    """Coalesce matrices, or stacks of matrices, `lhs` and `rhs`."""
+    if lhs.ndim == 2 and rhs.ndim == 2:
+        return coalescer(lhs, rhs)
+
+    info = coalescers.get_info(coalescer)
+    if info is not None and info.batched is not None:
+        return info.batched(lhs, rhs)
+
+    # No broadcasting equivalent; coalesce each evaluation separately.
+    count = max(len(operand) for operand in (lhs, rhs) if operand.ndim == 3)
+    lhs = np.broadcast_to(lhs, (count,) + lhs.shape[-2:])
+    rhs = np.broadcast_to(rhs, (count,) + rhs.shape[-2:])
+    return np.stack([coalescer(l, r) for l, r in zip(lhs, rhs)])
@@ -0,0 +1,522 @@
+import abc
+
+import numpy as np
+
+import src.precision as precision
+import src.structures as structures
+from src.componentmatrix import ComponentMatrix
+
+
+class StructuredTransform(ComponentMatrix):
+    """Transform matrix built from a vector of parameters.
+
+    Manages a vector of parameters (e.g. rotation angles, or translation offsets), which can have its values mutated
+    on a per-index basis through functions returned by `get_mutator()`, like `MutableMatrix`. The matrix is built from
+    the parameters at most once per parameter change, when it is next requested.
+
+    Subclasses implement `_build()`, which must accept parameters with any number of leading (batch) dimensions.
+
+    Parameters
+    ----------
+    label : str
+        Label of the transform.
+
+    parameters : typing.Iterable[float]
+        Initial parameter values.
+
+    """
+    def __init__(self, label, parameters):
+        """Construct an instance."""
+        self._label = label
+        self._parameters = np.array(parameters, dtype=precision.get_matrix_dtype(), ndmin=1)
+
+        self._version = 0
+        self._matrix = None
+        self._matrix_version = None
+
+        # Weak references to listeners notified of parameter changes (see `ComponentMatrix.add_listener()`).
+        self._listeners = []
+
+        # Whether no mutator was handed out and the parameters were never set, i.e. nothing is expected to change them.
+        self._constant = True
+
+        # Structure of the matrix, and the version it was detected at.
+        self._structure = None
+        self._structure_version = None
+
+    @abc.abstractmethod
+    def _build(self, parameters: np.ndarray) -> np.ndarray:
+        """Build matrices from parameters of shape (..., P) into an array of shape (..., M, N)."""
+        raise NotImplementedError
+
+    def get_matrix(self) -> np.ndarray:
+        """Get transform matrix, built from the current parameters."""
+        if self._matrix_version != self._version:
+            self._matrix = self._build(self._parameters)
+            self._matrix_version = self._version
+
+        return self._matrix
+
+    def get_matrices(self, parameters) -> np.ndarray:
+        """Build a stack of transform matrices, one per row of `parameters`.
+
+        Parameters
+        ----------
+        parameters : np.ndarray
+            Parameters of shape (K, P).
+
+        Returns
+        -------
+        np.ndarray
+            Matrices of shape (K, M, N).
+
+        """
+        return self._build(np.asarray(parameters, dtype=precision.get_matrix_dtype()))
+
+    def get_label(self) -> str:
+        """Get label."""
+        return self._label
+
+    def get_version(self) -> int:
+        """Get counter which increases whenever the parameters change."""
+        return self._version
+
+    def is_constant(self) -> bool:
+        """Whether no mutator was handed out, and the parameters were never set."""
+        return self._constant
+
+    def get_structure(self) -> str:
+        """Get structure of the transform matrix, detected again only after the parameters change."""
+        if self._structure_version != self._version:
+            self._structure = structures.detect_structure(self.get_matrix())
+            self._structure_version = self._version
+
+        return self._structure
+
+    def get_parameters(self) -> np.ndarray:
+        """Get parameters. Use `set_parameters()` or a mutator to change them."""
+        return self._parameters
+
+    def set_parameters(self, parameters):
+        """Set all parameters at once.
+
+        Parameters
+        ----------
+        parameters : typing.Iterable[float]
+            New parameter values.
+
+        """
+        self._parameters[:] = parameters
+        self._version += 1
+        self._constant = False
+        self._notify()
+
+    def get_mutator(self, index, modifier=None):
+        """Returns a function which sets parameter `index` to the value it is given.
+
+        Parameters
+        ----------
+        index : typing.Union[int, typing.Tuple[int]]
+            Index into the parameters.
+
+        modifier : typing.Callable[[float], float], optional
+            Callable to modify values before setting, by default None.
+
+        Returns
+        -------
+        typing.Callable[[float], None]
+            Function which will set parameter `index` when called.
+
+        """
+        self._constant = False
+
+        if modifier is None:
+            def mutate(value: float):
+                self._parameters[index] = value
+                self._version += 1
+                self._notify()
+        else:
+            def mutate(value: float):
+                self._parameters[index] = modifier(value)
+                self._version += 1
+                self._notify()
+
+        return mutate
+
+
+def _homogenize(matrices: np.ndarray) -> np.ndarray:
+    """Embed (..., N, N) matrices into (..., N + 1, N + 1) homogenous matrices."""
+    size = matrices.shape[-1]
+    out = np.zeros(matrices.shape[:-2] + (size + 1, size + 1), dtype=matrices.dtype)
+    out[..., :size, :size] = matrices
+    out[..., size, size] = 1
+    return out
+
+
+def _multiply_quaternions(lhs: np.ndarray, rhs: np.ndarray) -> np.ndarray:
+    """Hamilton product of (..., 4) quaternions [w, x, y, z]."""
+    w1, x1, y1, z1 = np.moveaxis(lhs, -1, 0)
+    w2, x2, y2, z2 = np.moveaxis(rhs, -1, 0)
+
+    return np.stack((
+        w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+        w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+        w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+        w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+    ), axis=-1)
+
+
+class Rotation(StructuredTransform):
+    """3D rotation parameterized by a quaternion [w, x, y, z].
+
+    The quaternion is normalized when the matrix is built, so its parameters may be mutated independently.
+
+    Parameters
+    ----------
+    label : str
+        Label of the transform.
+
+    quaternion : typing.Iterable[float], optional
+        Rotation quaternion [w, x, y, z], by default the identity rotation.
+
+    homogenous : bool, optional
+        Build a 4x4 homogenous matrix instead of a 3x3 matrix, by default False.
+
+    """
+    def __init__(self, label, quaternion=(1, 0, 0, 0), homogenous=False):
+        """Construct an instance."""
+        super().__init__(label, quaternion)
+        self._homogenous = homogenous
+
+    def is_homogenous(self) -> bool:
+        """Get whether the matrix is homogenous."""
+        return self._homogenous
+
+    def get_quaternion(self) -> np.ndarray:
+        """Get normalized rotation quaternion [w, x, y, z]."""
+        return self._quaternion(self._parameters)
+
+    def _quaternion(self, parameters: np.ndarray) -> np.ndarray:
+        """Normalized quaternions of (..., P) parameters."""
+        return parameters / np.linalg.norm(parameters, axis=-1, keepdims=True)
+
+    def _build(self, parameters):
+        w, x, y, z = np.moveaxis(self._quaternion(parameters), -1, 0)
+
+        matrices = np.stack((
+            np.stack((1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)), axis=-1),
+            np.stack((2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)), axis=-1),
+            np.stack((2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)), axis=-1)
+        ), axis=-2)
+
+        if self._homogenous:
+            matrices = _homogenize(matrices)
+
+        return matrices
+
+
+class EulerRotation(Rotation):
+    """3D rotation parameterized by three angles (radians) about the axes `axes`.
+
+    The matrix is R₀(θ₀)·R₁(θ₁)·R₂(θ₂), where Rᵢ rotates about axis `axes[i]`. Each angle's sine and cosine are
+    evaluated once per parameter change, and the rotations are combined as quaternions rather than matrices.
+
+    Parameters
+    ----------
+    label : str
+        Label of the transform.
+
+    angles : typing.Iterable[float], optional
+        Angles in radians, by default (0, 0, 0).
+
+    axes : str, optional
+        Axis of each angle, by default "zyx".
+
+    homogenous : bool, optional
+        Build a 4x4 homogenous matrix instead of a 3x3 matrix, by default False.
+
+    Example
+    -------
+    ```python
+    rotation = EulerRotation("R", axes="zyx")
+    square.register_transform(rotation)
+    square.register_slider(0, 0, yaw_slider, math.radians)  # One slider and mutator per angle.
+    ```
+    """
+    _AXES = {"x": 1, "y": 2, "z": 3}
+
+    def __init__(self, label, angles=(0, 0, 0), axes="zyx", homogenous=False):
+        """Construct an instance."""
+        if len(axes) != 3 or any(axis not in self._AXES for axis in axes):
+            raise ValueError(f"Invalid rotation axes '{axes}'!")
+
+        StructuredTransform.__init__(self, label, angles)
+        self._homogenous = homogenous
+        self._axes = axes
+
+    def get_axes(self) -> str:
+        """Get axis of each angle."""
+        return self._axes
+
+    def _quaternion(self, parameters):
+        half = parameters / 2
+        cos = np.cos(half)
+        sin = np.sin(half)
+
+        quaternion = None
+        for index, axis in enumerate(self._axes):
+            factor = np.zeros(parameters.shape[:-1] + (4,), dtype=parameters.dtype)
+            factor[..., 0] = cos[..., index]
+            factor[..., self._AXES[axis]] = sin[..., index]
+            quaternion = factor if quaternion is None else _multiply_quaternions(quaternion, factor)
+
+        return quaternion
+
+
+class Translation(StructuredTransform):
+    """Homogenous translation parameterized by an offset vector.
+
+    Parameters
+    ----------
+    label : str
+        Label of the transform.
+
+    offset : typing.Iterable[float]
+        Offset along each axis; a D-dimensional offset builds a (D + 1)x(D + 1) matrix.
+
+    """
+    def __init__(self, label, offset):
+        """Construct an instance."""
+        super().__init__(label, offset)
+
+    def _build(self, parameters):
+        size = parameters.shape[-1]
+        matrices = np.zeros(parameters.shape[:-1] + (size + 1, size + 1), dtype=parameters.dtype)
+        matrices[..., np.arange(size + 1), np.arange(size + 1)] = 1
+        matrices[..., :size, size] = parameters
+        return matrices
+
+
+class Scale(StructuredTransform):
+    """Scale parameterized by a factor per axis.
+
+    Parameters
+    ----------
+    label : str
+        Label of the transform.
+
+    factors : typing.Iterable[float]
+        Factor along each axis.
+
+    homogenous : bool, optional
+        Build a homogenous matrix with one more row and column than there are factors, by default False.
+
+    """
+    def __init__(self, label, factors, homogenous=False):
+        """Construct an instance."""
+        super().__init__(label, factors)
+        self._homogenous = homogenous
+
+    def is_homogenous(self) -> bool:
+        """Get whether the matrix is homogenous."""
+        return self._homogenous
+
+    def _build(self, parameters):
+        size = parameters.shape[-1]
+        matrices = np.zeros(parameters.shape[:-1] + (size, size), dtype=parameters.dtype)
+        matrices[..., np.arange(size), np.arange(size)] = parameters
+
+        if self._homogenous:
+            matrices = _homogenize(matrices)
+
+        return matrices
+
+
+class Shear(StructuredTransform):
+    """Shear parameterized by the off-diagonal factors of an NxN matrix.
+
+    Parameters are the factors in row-major order, skipping the diagonal: for N = 2, [xy, yx] builds
+    [[1, xy], [yx, 1]].
+
+    Parameters
+    ----------
+    label : str
+        Label of the transform.
+
+    factors : typing.Iterable[float]
+        N(N - 1) off-diagonal factors.
+
+    homogenous : bool, optional
+        Build a (N + 1)x(N + 1) homogenous matrix, by default False.
+
+    """
+    def __init__(self, label, factors, homogenous=False):
+        """Construct an instance."""
+        super().__init__(label, factors)
+        self._homogenous = homogenous
+
+        # N(N - 1) = P  ->  N = (1 + sqrt(1 + 4P)) / 2
+        size = int(round((1 + np.sqrt(1 + 4 * len(self._parameters))) / 2))
+        if size * (size - 1) != len(self._parameters):
+            raise ValueError(f"{len(self._parameters)} factors do not fill the off-diagonal of a square matrix!")
+
+        rows, columns = np.nonzero(~np.identity(size, dtype=bool))
+        self._size = size
+        self._off_diagonal = (rows, columns)
+
+    def _build(self, parameters):
+        matrices = np.zeros(parameters.shape[:-1] + (self._size, self._size), dtype=parameters.dtype)
+        matrices[..., np.arange(self._size), np.arange(self._size)] = 1
+        matrices[(...,) + self._off_diagonal] = parameters
+
+        if self._homogenous:
+            matrices = _homogenize(matrices)
+
+        return matrices
+
+
+class Perspective(StructuredTransform):
+    """3x4 pinhole camera (intrinsic parameter) matrix.
+
+    Builds [[fx, s, cx, 0], [0, fy, cy, 0], [0, 0, 1, 0]] from parameters [fx, fy, cx, cy, s].
+
+    Parameters
+    ----------
+    label : str
+        Label of the transform.
+
+    focal : typing.Tuple[float, float], optional
+        Focal lengths (fx, fy), by default (1, 1).
+
+    principal : typing.Tuple[float, float], optional
+        Principal point (cx, cy), by default (0, 0).
+
+    skew : float, optional
+        Skew s, by default 0.
+
+    """
+    def __init__(self, label, focal=(1, 1), principal=(0, 0), skew=0):
+        """Construct an instance."""
+        super().__init__(label, [focal[0], focal[1], principal[0], principal[1], skew])
+
+    def _build(self, parameters):
+        fx, fy, cx, cy, skew = np.moveaxis(parameters, -1, 0)
+
+        matrices = np.zeros(parameters.shape[:-1] + (3, 4), dtype=parameters.dtype)
+        matrices[..., 0, 0] = fx
+        matrices[..., 0, 1] = skew
+        matrices[..., 0, 2] = cx
+        matrices[..., 1, 1] = fy
+        matrices[..., 1, 2] = cy
+        matrices[..., 2, 2] = 1
+        return matrices
+
+
+def compose(lhs: StructuredTransform, rhs: StructuredTransform) -> StructuredTransform:
+    """Returns a transform whose matrix is the product of `lhs` and `rhs` matrices, composed without multiplying them
+
+    Rotations compose as quaternion products, translations add, and scales multiply.
+
+    Parameters
+    ----------
+    lhs : StructuredTransform
+        Left-hand transform.
+
+    rhs : StructuredTransform
+        Right-hand transform.
+
+    Returns
+    -------
+    StructuredTransform
+        Composed transform.
+
+    Raises
+    ------
+    TypeError
+        Raised when the transforms cannot be composed analytically.
+
+    """
+    label = f"{lhs.get_label()}·{rhs.get_label()}"
+
+    if isinstance(lhs, Rotation) and isinstance(rhs, Rotation) and lhs.is_homogenous() == rhs.is_homogenous():
+        quaternion = _multiply_quaternions(lhs.get_quaternion(), rhs.get_quaternion())
+        return Rotation(label, quaternion, homogenous=lhs.is_homogenous())
+
+    if (type(lhs) is Translation and type(rhs) is Translation
+            and lhs.get_parameters().shape == rhs.get_parameters().shape):
+        return Translation(label, lhs.get_parameters() + rhs.get_parameters())
+
+    if (type(lhs) is Scale and type(rhs) is Scale and lhs.is_homogenous() == rhs.is_homogenous()
+            and lhs.get_parameters().shape == rhs.get_parameters().shape):
+        return Scale(label, lhs.get_parameters() * rhs.get_parameters(), homogenous=lhs.is_homogenous())
+
+    raise TypeError(f"Cannot compose {type(lhs).__name__} with {type(rhs).__name__}!")
+
+
+class Composite(ComponentMatrix):
+    """Product of a chain of transforms, composing adjacent structured transforms analytically.
+
+    Adjacent transforms which `compose()` supports (e.g. consecutive rotations) are combined without building or
+    multiplying their matrices; only the remaining matrices are multiplied. The product is rebuilt at most once per
+    change of any transform.
+
+    Parameters
+    ----------
+    label : str
+        Label of the composite.
+
+    transforms : typing.Iterable[ComponentMatrix]
+        Transforms whose matrices are multiplied in order.
+
+    """
+    def __init__(self, label, transforms):
+        """Construct an instance."""
+        self._label = label
+        self._transforms = list(transforms)
+
+        self._matrix = None
+        self._versions = None
+
+    def get_matrix(self) -> np.ndarray:
+        """Get product of the transforms."""
+        versions = self.get_versions()
+        if versions != self._versions:
+            folded = []
+            for transform in self._transforms:
+                if (folded and isinstance(folded[-1], StructuredTransform)
+                        and isinstance(transform, StructuredTransform)):
+                    try:
+                        folded[-1] = compose(folded[-1], transform)
+                        continue
+                    except TypeError:
+                        pass
+                folded.append(transform)
+
+            matrix = folded[0].get_matrix()
+            for transform in folded[1:]:
+                matrix = np.dot(matrix, transform.get_matrix())
+
+            self._matrix = matrix
+            self._versions = versions
+
+        return self._matrix
+
+    def get_versions(self):
+        """Get version of each transform."""
+        return [transform.get_version() for transform in self._transforms]
+
+    def get_version(self) -> int:
+        """Get counter which increases whenever any transform changes."""
+        return sum(self.get_versions())
+
+    def is_constant(self) -> bool:
+        """Whether every transform is constant."""
+        return all(transform.is_constant() for transform in self._transforms)
+
+    def get_label(self) -> str:
+        """Get label."""
+        return self._label
+
+    def get_transform(self, index) -> ComponentMatrix:
+        """Get transform at `index`."""
+        return self._transforms[index]
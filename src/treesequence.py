@@ -0,0 +1,282 @@
+import numpy as np
+
+import src.coalescers as coalescers
+import src.utility as utility
+from src.sequence import Sequence
+
+
+class _SegmentTree:
+    """Partial products of a run of components coalesced by the same coalescer.
+
+    Leaves hold component matrices, and every internal node holds the coalescence of its two children, so the root
+    holds the coalescence of the whole run. Empty leaves (padding up to a power of two) hold None.
+
+    Components which notify listeners (see `ComponentMatrix.add_listener()`) mark their leaves dirty when they change;
+    the versions of other components are checked by every `update()`.
+
+    Parameters
+    ----------
+    components : typing.List[ComponentMatrix]
+        Components of the run, in sequence order.
+
+    coalescer : typing.Callable[[np.ndarray, np.ndarray], np.ndarray]
+        Associative function which coalesces components of the run, and the run with prior runs.
+
+    index : int
+        Index of the run in its sequence.
+
+    changed : typing.Set[int]
+        Set to add `index` to whenever a component of the run notifies a change.
+
+    """
+    def __init__(self, components, coalescer, index, changed):
+        """Construct an instance."""
+        self._components = components
+        self._coalescer = coalescer
+        self._index = index
+        self._changed = changed
+
+        self._size = 1 << (len(components) - 1).bit_length()
+        self._tree = [None] * (2 * self._size)
+        self._versions = [None] * len(components)
+
+        # Leaf indices of every component, by component id, and leaf indices of components which must be polled.
+        self._leaves = {}
+        self._polled = []
+        for leaf, component in enumerate(components):
+            self._leaves.setdefault(id(component), []).append(leaf)
+
+        for component in {id(component): component for component in components}.values():
+            if not component.add_listener(self._mark_dirty):
+                self._polled.extend(self._leaves[id(component)])
+        self._polled.sort()
+
+        # Leaves to recompute by the next `update()`; initially all of them.
+        self._dirty = set(range(len(components)))
+        changed.add(index)
+
+        self._version = 0
+
+    def get_coalescer(self):
+        """Get run coalescer."""
+        return self._coalescer
+
+    def get_matrix(self):
+        """Get coalescence of the run."""
+        return self._tree[1]
+
+    def get_version(self):
+        """Get counter which increases whenever `update()` changes the coalescence of the run."""
+        return self._version
+
+    def is_polled(self):
+        """Whether the run has components which do not notify listeners, whose versions `update()` checks."""
+        return bool(self._polled)
+
+    def update(self):
+        """Recompute partial products along the paths from changed components to the root.
+
+        Only dirty leaves, and the versions of components which do not notify listeners, are visited.
+        """
+        for leaf in self._polled:
+            if self._components[leaf].get_version() != self._versions[leaf]:
+                self._dirty.add(leaf)
+
+        if not self._dirty:
+            return
+
+        leaves, self._dirty = self._dirty, set()
+
+        dirty = set()
+        for leaf in leaves:
+            component = self._components[leaf]
+            self._versions[leaf] = component.get_version()
+            position = self._size + leaf
+            self._tree[position] = component.get_matrix()
+            if position > 1:
+                dirty.add(position >> 1)
+
+        # All leaves are on the same level, so parents are recomputed one level at a time.
+        while dirty:
+            for position in dirty:
+                self._tree[position] = self._coalesce(self._tree[2 * position], self._tree[2 * position + 1])
+
+            dirty = {position >> 1 for position in dirty if position > 1}
+
+        self._version += 1
+
+    def _mark_dirty(self, component):
+        """Mark the leaves of `component` dirty (listener registered on every component, see `__init__()`)."""
+        self._dirty.update(self._leaves[id(component)])
+        self._changed.add(self._index)
+
+    def _coalesce(self, lhs, rhs):
+        """Coalesce `lhs` and `rhs`, where None is an empty leaf."""
+        if rhs is None:
+            return lhs
+        if lhs is None:
+            return rhs
+        return self._coalescer(lhs, rhs)
+
+
+class TreeSequence(Sequence):
+    """Matrix sequence which stores partial products in segment trees.
+
+    Consecutive nodes which share an associative coalescer (registered as associative, see `coalescers`, e.g.
+    `np.dot`, `np.matmul`, `np.add` and `np.multiply`) are stored in a balanced tree of partial products. When a
+    component changes, only the partial products on its path to the root of the tree are coalesced again, so updating
+    one node of a chain of n nodes costs O(log n) coalescences instead of O(n), and reading the coalesced matrix of an
+    unchanged sequence costs none. Components which notify listeners (see `ComponentMatrix.add_listener()`, e.g.
+    `MutableMatrix` and `StructuredTransform`) push their changes into the trees, so reading an unchanged sequence of
+    them returns the cached matrix at once; the versions of other components (e.g. nested sequences) are checked by
+    every read.
+
+    Nodes with any other coalescer split the sequence: trees before the node are coalesced first, then the node, then
+    the trees which follow it, preserving the left-to-right coalescence order of `Sequence`.
+
+    Parameters
+    ----------
+    associative : typing.Iterable[typing.Callable[[np.ndarray, np.ndarray], np.ndarray]], optional
+        Additional coalescers to treat as associative, by default None.
+
+    """
+    def __init__(self, associative=None):
+        """Construct an instance."""
+        super().__init__()
+
+        self._associative = frozenset(associative or ())
+
+        self._segments = None
+
+        # Indices of segments whose components notified changes, and of segments with components which are polled.
+        self._changed_segments = set()
+        self._polled_segments = []
+
+        # Prefix products of segments: (segment version, coalescence of segments 0 through i).
+        self._segment_prefixes = []
+
+    def get_matrix(self):
+        """Returns managed matrix.
+
+        Returns a single matrix formed from the coalescence of all nodes. The returned matrix must not be modified.
+
+        Costs O(log n) coalescences per changed node of a run of n nodes, plus one version check per node which does
+        not notify listeners. Reading an unchanged sequence whose nodes all notify listeners costs neither.
+
+        Returns
+        -------
+        np.ndarray
+            Coalesced matrix.
+
+        """
+        if not self._nodes:
+            raise ValueError("Sequence has no nodes!")
+
+        if self._segments is None:
+            self._segments = self._build_segments()
+            self._polled_segments = [index for index, segment in enumerate(self._segments) if segment.is_polled()]
+
+        prefixes = self._segment_prefixes
+        changed = self._changed_segments
+
+        if not changed and not self._polled_segments:
+            return prefixes[-1][1]
+
+        first_dirty = len(prefixes)
+        for index in sorted(changed.union(self._polled_segments)):
+            segment = self._segments[index]
+            segment.update()
+            changed.discard(index)
+            if first_dirty > index and prefixes[index][0] != segment.get_version():
+                first_dirty = index
+
+        del prefixes[first_dirty:]
+
+        for segment in self._segments[first_dirty:]:
+            if prefixes:
+                coalesce = segment.get_coalescer()
+                lhs = coalesce(prefixes[-1][1], segment.get_matrix())
+            else:
+                lhs = segment.get_matrix()
+
+            prefixes.append((segment.get_version(), lhs))
+
+        return prefixes[-1][1]
+
+    def get_options(self):
+        """Get keyword arguments which construct an empty sequence with the options of this one."""
+        return {"associative": self._associative}
+
+    def apply(self, points, out=None):
+        """Apply the coalesced matrix to `points`.
+
+        Partial products keep the coalesced matrix cheap to update, so points are always transformed by it rather
+        than by a planned chain (see `Sequence.apply()`).
+
+        Parameters
+        ----------
+        points : np.ndarray
+            Array of points to transform, with shape (P, D).
+
+        out : np.ndarray, optional
+            Preallocated array to write transformed points into, by default None.
+
+        Returns
+        -------
+        np.ndarray
+            Vector of transformed points.
+
+        """
+        return utility.apply_transform(self.get_matrix(), points, out=out)
+
+    def register_node(self, component, coalescer):
+        """Register a node into the sequence.
+
+        Parameters
+        ----------
+        component : ComponentMatrix
+            Component to register.
+
+        coalescer : typing.Callable[[np.ndarray, np.ndarray], np.ndarray]
+            Function to merge components in the sequence.
+
+        """
+        super().register_node(component, coalescer)
+        self._segments = None
+        self._changed_segments = set()
+        self._polled_segments = []
+        self._segment_prefixes.clear()
+
+    def _build_segments(self):
+        """Split nodes into runs which share an associative coalescer."""
+        runs = []
+
+        components = [self._nodes[0].get_component()]
+        coalescer = None
+        for node in self._nodes[1:]:
+            component = node.get_component()
+            node_coalescer = node.get_coalescer()
+            associative = node_coalescer in self._associative or coalescers.is_associative(node_coalescer)
+
+            if associative and (coalescer is None or node_coalescer is coalescer):
+                components.append(component)
+                coalescer = node_coalescer
+                continue
+
+            if components:
+                runs.append((components, coalescer))
+
+            if associative:
+                components, coalescer = [component], node_coalescer
+            else:
+                # Non-associative nodes are runs of one, joined to the runs before them by their own coalescer.
+                runs.append(([component], node_coalescer))
+                components, coalescer = [], None
+
+        if components:
+            runs.append((components, coalescer))
+
+        return [
+            _SegmentTree(components, coalescer, index, self._changed_segments)
+            for index, (components, coalescer) in enumerate(runs)
+        ]
@@ -0,0 +1,82 @@
+import typing
+
+import src.instrumentation as instrumentation
+
+
+class UpdateScheduler:
+    """Coalesces update requests so that each update runs at most once per frame.
+
+    Slider callbacks request updates through `schedule()` instead of running them immediately. The first request in a
+    frame starts a single-shot canvas timer; requests made before it fires are merged, so an update requested by
+    several sliders (or several times by one slider) runs once. When the timer fires, every pending update is run in
+    request order and the canvas is redrawn once.
+
+    Canvases without an event loop (e.g. Agg) never fire timers; call `flush()` to run pending updates instead.
+
+    Parameters
+    ----------
+    canvas : matplotlib.backend_bases.FigureCanvasBase
+        Canvas to time frames with and redraw.
+
+    max_fps : float, optional
+        Maximum number of frames per second, by default 60.
+
+    redraw : typing.Callable[[], None], optional
+        Function which redraws the canvas after each frame's updates, by default `canvas.draw_idle()`. For example,
+        `BlitManager.update()` redraws only animated artists.
+
+    """
+    def __init__(self, canvas, max_fps=60, redraw=None):
+        """Construct an instance."""
+        self._canvas = canvas
+        self._redraw = canvas.draw_idle if redraw is None else redraw
+
+        # dict as an insertion-ordered set of callbacks.
+        self._pending = {}
+        self._scheduled = False
+
+        self._timer = canvas.new_timer(interval=max(1, int(1000 / max_fps)))
+        self._timer.single_shot = True
+        self._timer.add_callback(self.flush)
+
+    def schedule(self, callback: typing.Callable[[], None]):
+        """Request that `callback` is run on the next frame.
+
+        Parameters
+        ----------
+        callback : typing.Callable[[], None]
+            Update to run. Requesting an already pending update has no effect.
+
+        """
+        self._pending[callback] = None
+
+        if not self._scheduled:
+            self._scheduled = True
+            self._timer.start()
+
+    def flush(self):
+        """Run all pending updates now and redraw the canvas."""
+        self._timer.stop()
+        self._scheduled = False
+
+        pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        profiler = instrumentation.get_profiler()
+        if profiler is not None:
+            start = profiler.clock()
+
+        for callback in pending:
+            callback()
+
+        self._redraw()
+
+        if profiler is not None:
+            profiler.record("UpdateScheduler.flush", start, category="frame")
+            profiler.count("UpdateScheduler frames")
+            profiler.count("UpdateScheduler updates", len(pending))
+
+    def pending(self) -> int:
+        """Get number of pending updates."""
+        return len(self._pending)
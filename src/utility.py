@@ -3,8 +3,12 @@ import typing
 import numpy as np
 from matplotlib import patches, widgets
 
+import src.precision as precision
+from src.componentmatrix import ComponentMatrix
+from src.mutablematrix import MutableMatrix
 
-def to_homogenous(array: np.ndarray) -> np.ndarray:
+
+def to_homogenous(array: np.ndarray, out: np.ndarray = None) -> np.ndarray:
     """Convert each point in `array` to the homogenous coordinate space
 
     Parameters
@@ -12,37 +16,74 @@ def to_homogenous(array: np.ndarray) -> np.ndarray:
     array : np.ndarray
         Array of points to convert
 
+    out : np.ndarray, optional
+        Preallocated array with one more column than `array` to write converted points into, by default None
+
     Returns
     -------
     np.ndarray
         Array of points converted to the homogenous coordinate space
 
     """
-    return np.hstack((array, np.ones((array.shape[0], 1), dtype=array.dtype)))
+    if out is None:
+        out = np.empty((array.shape[0], array.shape[1] + 1), dtype=array.dtype)
+
+    out[:, :-1] = array
+    out[:, -1] = 1
+
+    return out
 
 
-def from_homogenous(array: np.ndarray) -> np.ndarray:
+def from_homogenous(array: np.ndarray, out: np.ndarray = None, epsilon: float = None, fill: float = None) -> np.ndarray:
     """Convert each point in `array` to the cartesian coordinate space
 
+    Points whose homogenous coordinate w is 0 are mapped to infinity. To guard against this, provide `epsilon`: points
+    with |w| < `epsilon` are then divided by ±`epsilon` instead, or set to `fill` when it is provided (e.g. `np.nan`
+    to mask them out).
+
     Parameters
     ----------
     array : np.ndarray
         Array of points to convert
 
+    out : np.ndarray, optional
+        Preallocated array with one less column than `array` to write converted points into, by default None.
+        May be a view of `array` itself, e.g. `array[:, :-1]`, to convert in-place.
+
+    epsilon : float, optional
+        Smallest magnitude of w to divide by, by default None
+
+    fill : float, optional
+        Value for points with |w| < `epsilon`, by default None
+
     Returns
     -------
     np.ndarray
         Array of points converted to the cartesian coordinate space
 
     """
-    rows = []
-    for row in array:
-        rows.append(row[:-1] / row[-1])
+    coordinates = array[:, :-1]
+    w = array[:, -1:]
 
-    return np.array(rows)
+    if epsilon is None:
+        return np.divide(coordinates, w, out=out)
 
+    small = np.abs(w) < epsilon
 
-def square(origin: tuple = None, scale: float = 1, add_coords: typing.Iterable = None) -> np.ndarray:
+    if fill is None:
+        w = np.where(small, np.copysign(epsilon, w), w)
+        return np.divide(coordinates, w, out=out)
+
+    if out is None:
+        out = np.empty(coordinates.shape, dtype=np.result_type(coordinates, w, float))
+
+    np.divide(coordinates, w, out=out, where=~small)
+    out[small[:, 0]] = fill
+
+    return out
+
+
+def square(origin: tuple = None, scale: float = 1, add_coords: typing.Iterable = None, dtype=None) -> np.ndarray:
     """Returns a square with scale `scale` centered around (`center_x`, `center_y`)
 
     Parameters
@@ -56,6 +97,9 @@ def square(origin: tuple = None, scale: float = 1, add_coords: typing.Iterable =
     add_coords : typing.Iterable, optional
         Include these additional coordinates in each point, by default None
 
+    dtype : np.dtype, optional
+        Data type of the points, by default `precision.get_point_dtype()`
+
     Returns
     -------
     np.ndarray
@@ -75,19 +119,207 @@ def square(origin: tuple = None, scale: float = 1, add_coords: typing.Iterable =
         [center_x - offset, center_y + offset],  # Top left
         [center_x + offset, center_y + offset],  # Top right
         [center_x + offset, center_y - offset]   # Bottom right
-    ], dtype=float)
+    ], dtype=precision.get_point_dtype() if dtype is None else dtype)
+
+    return add_coordinates(array, add_coords)
+
+
+def polygon(sides: int, origin: tuple = None, scale: float = 1, add_coords: typing.Iterable = None,
+            dtype=None) -> np.ndarray:
+    """Returns a regular polygon with `sides` vertices on a circle of diameter `scale` centered around `origin`
+
+    Vertices are ordered counter-clockwise, starting from angle 0.
+
+    Parameters
+    ----------
+    sides : int
+        Number of vertices
+
+    origin : tuple, optional
+        2D center of polygon coordinate. Defaults to (0, 0), by default None
+
+    scale : float, optional
+        Diameter of the polygon's circumscribed circle, by default 1
+
+    add_coords : typing.Iterable, optional
+        Include these additional coordinates in each point, by default None
+
+    dtype : np.dtype, optional
+        Data type of the points, by default `precision.get_point_dtype()`
+
+    Returns
+    -------
+    np.ndarray
+        Vector of points representing a polygon
+
+    """
+    if origin is None:
+        origin = (0, 0)
+
+    angles = np.linspace(0, 2 * np.pi, sides, endpoint=False)
+
+    array = np.empty((sides, 2), dtype=precision.get_point_dtype() if dtype is None else dtype)
+    array[:, 0] = origin[0] + scale / 2 * np.cos(angles)
+    array[:, 1] = origin[1] + scale / 2 * np.sin(angles)
+
+    return add_coordinates(array, add_coords)
+
+
+def grid(rows: int, columns: int, origin: tuple = None, scale: float = 1,
+         add_coords: typing.Iterable = None, dtype=None) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Returns a grid of `rows` x `columns` square cells, each with scale `scale`, centered around `origin`
+
+    Parameters
+    ----------
+    rows : int
+        Number of cells along the y axis
+
+    columns : int
+        Number of cells along the x axis
+
+    origin : tuple, optional
+        2D center of grid coordinate. Defaults to (0, 0), by default None
+
+    scale : float, optional
+        Scale of each cell, by default 1
+
+    add_coords : typing.Iterable, optional
+        Include these additional coordinates in each point, by default None
+
+    dtype : np.dtype, optional
+        Data type of the points, by default `precision.get_point_dtype()`
+
+    Returns
+    -------
+    typing.Tuple[np.ndarray, np.ndarray]
+        Vector of (rows + 1) * (columns + 1) grid points, and array of cells as vertex indices in bottom left,
+        top left, top right, bottom right order (matching `square()`)
+
+    """
+    if origin is None:
+        origin = (0, 0)
+
+    x = origin[0] + scale * (np.arange(columns + 1) - columns / 2)
+    y = origin[1] + scale * (np.arange(rows + 1) - rows / 2)
 
-    if add_coords:
-        cols: np.ndarray = np.array(add_coords, dtype=array.dtype)
-        cols = np.tile(cols, (array.shape[0], 1))
-        array = np.hstack((array, cols))
+    array = np.empty(((rows + 1) * (columns + 1), 2), dtype=precision.get_point_dtype() if dtype is None else dtype)
+    array[:, 0] = np.tile(x, rows + 1)
+    array[:, 1] = np.repeat(y, columns + 1)
 
-    return array
+    bottom_left = (np.arange(rows)[:, np.newaxis] * (columns + 1) + np.arange(columns)).ravel()
+    faces = np.stack((bottom_left, bottom_left + columns + 1, bottom_left + columns + 2, bottom_left + 1), axis=1)
+
+    return add_coordinates(array, add_coords), faces
+
+
+def add_coordinates(array: np.ndarray, add_coords: typing.Iterable = None) -> np.ndarray:
+    """Returns `array` with coordinates `add_coords` appended to each point
+
+    Parameters
+    ----------
+    array : np.ndarray
+        Array of points
+
+    add_coords : typing.Iterable, optional
+        Coordinates to append to each point, by default None
+
+    Returns
+    -------
+    np.ndarray
+        Array of points with additional coordinates, or `array` itself when there are none to add
+
+    """
+    if not add_coords:
+        return array
+
+    cols: np.ndarray = np.array(add_coords, dtype=array.dtype)
+
+    out = np.empty((array.shape[0], array.shape[1] + cols.shape[0]), dtype=array.dtype)
+    out[:, :array.shape[1]] = array
+    out[:, array.shape[1]:] = cols
+
+    return out
+
+
+def check_out(out: np.ndarray, shape: tuple, dtype) -> np.ndarray:
+    """Returns preallocated array `out` once checked to be C-contiguous with `shape` and `dtype`
+
+    Results are written into reshaped views of `out`, which would silently be copies of a non-contiguous array.
+
+    Parameters
+    ----------
+    out : np.ndarray
+        Preallocated array to check
+
+    shape : tuple
+        Expected shape of `out`
+
+    dtype : np.dtype
+        Expected data type of `out`
+
+    Returns
+    -------
+    np.ndarray
+        `out` itself
+
+    Raises
+    ------
+    ValueError
+        Raised when `out` does not have `shape` or `dtype`, or is not C-contiguous.
+
+    """
+    if out.shape != tuple(shape) or out.dtype != dtype:
+        raise ValueError(f"Expected out of shape {tuple(shape)} and dtype {np.dtype(dtype)}, "
+                         f"got {out.shape} and {out.dtype}!")
+
+    if not out.flags.c_contiguous:
+        raise ValueError("Expected C-contiguous out!")
+
+    return out
+
+
+def register_transform(sequence, component, coalescer: typing.Callable = None, label: str = None):
+    """Registers `component` as the next node of `sequence`
+
+    Parameters
+    ----------
+    sequence : Sequence
+        Sequence to register into
+
+    component : typing.Union[np.ndarray, ComponentMatrix]
+        Component to register. Arrays are managed by a new `MutableMatrix` labeled `label`.
+
+    coalescer : typing.Callable[[np.ndarray, np.ndarray], np.ndarray], optional
+        Function that coalesces this matrix with the previously registered matrix (if applicable), by default np.dot()
+
+    label : str, optional
+        Label of the `MutableMatrix` managing an array `component`, by default None. Required for arrays; ignored
+        for components, which have labels of their own.
+
+    Raises
+    ------
+    TypeError
+        Raised when `component` is an array and `label` is not provided.
+
+    """
+    if coalescer is None:
+        coalescer = np.dot
+
+    if not isinstance(component, ComponentMatrix):
+        if label is None:
+            raise TypeError("Must provide `label` for MutableMatrix instantiation!")
+        component = MutableMatrix(label, component)
+
+    sequence.register_node(component, coalescer)
 
 
 def transform(matrix: np.ndarray, row_vector: bool = False) -> typing.Callable[[np.ndarray], None]:
     """Returns a function which transforms points using the provided transformation `matrix` via matrix (dot) point.
 
+    Points with fewer coordinates than `matrix` has columns are padded with ones (e.g. a 2D point transformed by a
+    3x3 affine matrix is treated as the homogenous point [x, y, 1]), and the result is truncated back to the number of
+    coordinates in the point.
+
     Parameters
     ----------
     matrix : np.ndarray
@@ -110,30 +342,76 @@ def transform(matrix: np.ndarray, row_vector: bool = False) -> typing.Callable[[
 
     def func(point: np.ndarray):
         point_rows = point.shape[0]
+        padding = matrix.shape[1] - point_rows
+        if padding > 0:
+            point = np.concatenate((point, np.ones(padding, dtype=point.dtype)))
         coordinate = np.dot(matrix, point)[:point_rows]
         return coordinate
 
     return func
 
 
-def apply_transform(transform_matrix: np.ndarray, points: np.ndarray, row_vector: bool = False) -> np.ndarray:
+def apply_transform(transform_matrix: np.ndarray, points: np.ndarray, row_vector: bool = False,
+                    out: np.ndarray = None) -> np.ndarray:
     """Applies `transform_matrix` to all points in array `points`
 
+    All points are transformed by a single matrix multiplication instead of one call per point. Semantics match
+    `transform()`: points with fewer coordinates than the matrix has columns are padded with ones, and each result is
+    truncated to the number of coordinates in the input points.
+
+    Floating-point `points` are transformed in their own precision, so float32 points produce float32 results even
+    when `transform_matrix` is float64.
+
+    `transform_matrix` may also be a stack of matrices with shape (K, M, N), in which case the result has shape
+    (K, P, D) for P points.
+
     Parameters
     ----------
     transform_matrix : np.ndarray
         Transformation matrix to apply to all points
 
     points : np.ndarray
-        Array of points to transform
+        Array of points to transform, with shape (P, D)
 
     row_vector : bool, optional
         `False` to treat points as column vectors, `True` to treat points as row vectors, by default False
 
+    out : np.ndarray, optional
+        Preallocated array to write transformed points into, by default None
+
     Returns
     -------
     np.ndarray
         Vector of transformed points
 
+    Raises
+    ------
+    ValueError
+        Raised when points have more coordinates than `transform_matrix` has columns.
+
     """
-    return np.apply_along_axis(transform(transform_matrix, row_vector=row_vector), 1, points)
+    matrix = np.asarray(transform_matrix)
+    points = np.asarray(points)
+
+    if row_vector:
+        matrix = matrix.swapaxes(-1, -2)
+
+    dimensions = points.shape[-1]
+    columns = matrix.shape[-1]
+    if columns < dimensions:
+        raise ValueError(f"shapes {matrix.shape} and {points.shape} not aligned: "
+                         f"{columns} (matrix columns) < {dimensions} (point coordinates)")
+
+    if np.issubdtype(points.dtype, np.floating):
+        matrix = matrix.astype(points.dtype, copy=False)
+
+    # Rows past `dimensions` would be truncated from the result, so they are never computed.
+    matrix = matrix[..., :dimensions, :]
+
+    out = np.matmul(points, matrix[..., :dimensions].swapaxes(-1, -2), out=out)
+
+    if columns > dimensions:
+        # Padded coordinates are all ones, so their contribution is the sum of the remaining columns.
+        out += matrix[..., dimensions:].sum(axis=-1)[..., np.newaxis, :]
+
+    return out
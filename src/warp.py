@@ -0,0 +1,278 @@
+import numpy as np
+
+import src.utility as utility
+from src.sequence import Sequence
+
+
+INTERPOLATIONS = ("nearest", "bilinear")
+
+
+class ImageWarp:
+    """Geometric warp of images via a sequence of component matrices.
+
+    The coalesced matrix of the sequence is a 3x3 homography (or 2x3 affine matrix) mapping source pixel coordinates
+    (x, y, 1) to destination pixel coordinates, where x is the column and y is the row. Images are warped by inverse
+    mapping: the homogenous coordinates of every destination pixel are transformed by the inverse matrix with one
+    `utility.apply_transform()`, and the source image is sampled there.
+
+    The grid of destination coordinates, the source coordinate buffers and the per-pixel scratch buffers of sampling
+    are allocated once per output shape and reused while only the matrix changes (e.g. from sliders).
+
+    Bilinear interpolation is computed in float32.
+
+    Parameters
+    ----------
+    sequence : Sequence, optional
+        Sequence of warp matrices, by default a new empty sequence.
+
+    interpolation : str, optional
+        "nearest" or "bilinear", by default "bilinear".
+
+    fill : float, optional
+        Value of destination pixels which map outside the source image, by default 0. Must be representable in the
+        dtype of warped images, e.g. a whole number within 0-255 for uint8 images.
+
+    Example
+    -------
+    ```python
+    warp = ImageWarp()
+    warp.register_transform(np.array([[1, 0.2, 0], [0, 1, 0], [0, 0.001, 1]]), label="H")
+    warped = warp.apply(image)
+    ```
+    """
+    def __init__(self, sequence=None, interpolation="bilinear", fill=0):
+        """Construct an instance."""
+        if interpolation not in INTERPOLATIONS:
+            raise ValueError(f"Interpolation must be one of {INTERPOLATIONS}, got {interpolation!r}!")
+
+        self._sequence = Sequence() if sequence is None else sequence
+        self._interpolation = interpolation
+        self._fill = fill
+
+        # Output shape (H, W) the buffers below were allocated for.
+        self._shape = None
+
+        # Homogenous (x, y, 1) coordinates of every destination pixel, as float32 (H·W, 3).
+        self._grid = None
+
+        # Homogenous, then cartesian, source coordinates of every destination pixel.
+        self._source = None
+        self._coordinates = None
+
+        # Per-pixel scratch buffers of sampling: float32 rows (left, top, right weight, bottom weight, left weight,
+        # top weight, corner weight), intp rows (top-left index, corner index) and boolean rows (valid, mask).
+        self._scratch = None
+        self._indices = None
+        self._masks = None
+
+        # ((channels, dtype), gathered corner, weighted sum, weighted corner) buffers of bilinear sampling.
+        self._samples = None
+
+    def get_sequence(self) -> Sequence:
+        """Get sequence of warp matrices."""
+        return self._sequence
+
+    def get_label(self) -> str:
+        """Get string representation of component relationship."""
+        return self._sequence.get_label()
+
+    def register_transform(self, component, coalescer=None, label=None):
+        """Register the warp matrix as a component matrix (see `utility.register_transform()`)."""
+        utility.register_transform(self._sequence, component, coalescer, label)
+
+    def get_homography(self) -> np.ndarray:
+        """Returns the coalesced matrix as a 3x3 homography
+
+        Raises
+        ------
+        ValueError
+            Raised when the coalesced matrix is neither 3x3 nor 2x3.
+
+        """
+        matrix = np.asarray(self._sequence.get_matrix(), dtype=float)
+
+        if matrix.shape == (2, 3):
+            matrix = np.concatenate((matrix, [[0, 0, 1]]))
+        elif matrix.shape != (3, 3):
+            raise ValueError(f"Warp matrix must be 3x3 or 2x3, got {matrix.shape}!")
+
+        return matrix
+
+    def apply(self, image: np.ndarray, shape=None, out: np.ndarray = None) -> np.ndarray:
+        """Warp `image` by the coalesced matrix
+
+        Parameters
+        ----------
+        image : np.ndarray
+            Image of shape (H, W) or (H, W, C).
+
+        shape : typing.Tuple[int, int], optional
+            Shape (H, W) of the warped image, by default the shape of `image`.
+
+        out : np.ndarray, optional
+            Preallocated C-contiguous array of the warped image's shape and `image`'s channels and dtype to write
+            into, by default a new array.
+
+        Returns
+        -------
+        np.ndarray
+            Warped image.
+
+        Raises
+        ------
+        ValueError
+            Raised when `out` does not match the warped image, or the fill value is not representable in `image`'s
+            dtype.
+
+        """
+        height, width = image.shape[:2]
+        channels = image.shape[2:]
+        shape = tuple(shape or (height, width))
+
+        fill = self._convert_fill(image.dtype)
+
+        if out is None:
+            out = np.empty(shape + channels, dtype=image.dtype)
+        else:
+            utility.check_out(out, shape + channels, image.dtype)
+
+        self._prepare(shape)
+
+        inverse = np.linalg.inv(self.get_homography())
+        utility.apply_transform(inverse, self._grid, out=self._source)
+
+        if np.array_equal(inverse[2], [0, 0, 1]):
+            # Affine; w is always 1.
+            self._coordinates[...] = self._source[:, :2]
+        else:
+            # Points behind the camera (w ~ 0) are moved outside the source image.
+            utility.from_homogenous(self._source, out=self._coordinates, epsilon=1e-12, fill=-2)
+
+        pixels = image.reshape(height * width, -1)
+        result = out.reshape(shape[0] * shape[1], -1)
+
+        if self._interpolation == "nearest":
+            self._sample_nearest(pixels, height, width, result, fill)
+        else:
+            self._sample_bilinear(pixels, height, width, result, fill)
+
+        return out
+
+    def _convert_fill(self, dtype):
+        """Returns the fill value as a scalar of `dtype`, raising ValueError when it is not representable."""
+        if np.issubdtype(dtype, np.integer):
+            info = np.iinfo(dtype)
+            if not (info.min <= self._fill <= info.max and float(self._fill).is_integer()):
+                raise ValueError(f"Fill value {self._fill!r} is not representable as {np.dtype(dtype)}!")
+
+        return np.asarray(self._fill).astype(dtype)[()]
+
+    def _prepare(self, shape):
+        """Allocate the destination grid and coordinate buffers for output `shape`, unless already allocated."""
+        if self._shape == shape:
+            return
+
+        rows, columns = np.indices(shape, dtype=np.float32)
+        self._grid = np.stack((columns.ravel(), rows.ravel(), np.ones(rows.size, dtype=np.float32)), axis=1)
+        self._source = np.empty_like(self._grid)
+        self._coordinates = np.empty((rows.size, 2), dtype=np.float32)
+        self._scratch = np.empty((7, rows.size), dtype=np.float32)
+        self._indices = np.empty((2, rows.size), dtype=np.intp)
+        self._masks = np.empty((2, rows.size), dtype=bool)
+        self._shape = shape
+
+    def _find_valid(self, x, y, x_max, y_max):
+        """Find coordinates within [0, x_max] × [0, y_max], into the first mask."""
+        valid, mask = self._masks
+
+        np.greater_equal(x, 0, out=valid)
+        np.less_equal(x, x_max, out=mask)
+        valid &= mask
+        np.greater_equal(y, 0, out=mask)
+        valid &= mask
+        np.less_equal(y, y_max, out=mask)
+        valid &= mask
+
+        return valid
+
+    def _fill_invalid(self, result, valid, fill):
+        """Set pixels of `result` whose coordinates are not `valid` to `fill`."""
+        mask = self._masks[1]
+        np.logical_not(valid, out=mask)
+        np.copyto(result, fill, where=mask[:, np.newaxis])
+
+    def _sample_nearest(self, pixels, height, width, result, fill):
+        """Sample the source pixel nearest to each coordinate."""
+        x, y = self._scratch[:2]
+        np.rint(self._coordinates[:, 0], out=x)
+        np.rint(self._coordinates[:, 1], out=y)
+
+        # Rounded coordinates are whole, so x < width is x <= width - 1.
+        valid = self._find_valid(x, y, width - 1, height - 1)
+
+        index, column = self._indices
+        np.clip(y, 0, height - 1, out=y)
+        np.clip(x, 0, width - 1, out=x)
+        np.copyto(index, y, casting="unsafe")
+        index *= width
+        np.copyto(column, x, casting="unsafe")
+        index += column
+
+        np.take(pixels, index, axis=0, out=result)
+        self._fill_invalid(result, valid, fill)
+
+    def _sample_bilinear(self, pixels, height, width, result, fill):
+        """Sample the source image at each coordinate, interpolating between the four surrounding pixels."""
+        x = self._coordinates[:, 0]
+        y = self._coordinates[:, 1]
+        valid = self._find_valid(x, y, width - 1, height - 1)
+
+        x0, y0, fx, fy, gx, gy, weight = self._scratch
+
+        # Left and top neighbours, kept one pixel from the right and bottom edges so x1 and y1 exist.
+        np.floor(x, out=x0)
+        np.clip(x0, 0, max(width - 2, 0), out=x0)
+        np.floor(y, out=y0)
+        np.clip(y0, 0, max(height - 2, 0), out=y0)
+
+        # Weights of the right and bottom neighbours, and of the left and top neighbours.
+        np.subtract(x, x0, out=fx)
+        np.clip(fx, 0, 1, out=fx)
+        np.subtract(y, y0, out=fy)
+        np.clip(fy, 0, 1, out=fy)
+        np.subtract(1, fx, out=gx)
+        np.subtract(1, fy, out=gy)
+
+        top_left, corner = self._indices
+        np.copyto(top_left, y0, casting="unsafe")
+        top_left *= width
+        np.copyto(corner, x0, casting="unsafe")
+        top_left += corner
+
+        right = 1 if width > 1 else 0
+        down = width if height > 1 else 0
+
+        key = (pixels.shape[1], pixels.dtype)
+        if self._samples is None or self._samples[0] != key or len(self._samples[1]) != len(top_left):
+            self._samples = (key, np.empty((len(top_left), key[0]), dtype=key[1]),
+                             np.empty((len(top_left), key[0]), dtype=np.float32),
+                             np.empty((len(top_left), key[0]), dtype=np.float32))
+        _, gathered, total, weighted = self._samples
+
+        corners = ((0, gx, gy), (right, fx, gy), (down, gx, fy), (down + right, fx, fy))
+
+        for index, (offset, horizontal, vertical) in enumerate(corners):
+            np.add(top_left, offset, out=corner)
+            np.take(pixels, corner, axis=0, out=gathered)
+            np.multiply(horizontal, vertical, out=weight)
+            if index == 0:
+                np.multiply(gathered, weight[:, np.newaxis], out=total)
+            else:
+                np.multiply(gathered, weight[:, np.newaxis], out=weighted)
+                total += weighted
+
+        if np.issubdtype(result.dtype, np.integer):
+            np.rint(total, out=total)
+
+        result[...] = total
+        self._fill_invalid(result, valid, fill)
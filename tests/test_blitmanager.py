@@ -0,0 +1,80 @@
+from unittest import TestCase, mock
+
+import numpy as np
+from matplotlib import widgets
+
+from src.blitmanager import BlitManager
+from src.headless import create_figure
+from src.interactivesquare import InteractiveSquare
+from src.mutablematrix import MutableMatrix
+from src.updatescheduler import UpdateScheduler
+
+
+class TestBlitManager(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        self.figure = create_figure()
+        self.axes = self.figure.add_subplot(2, 1, 1)
+        self.slider = widgets.Slider(self.figure.add_subplot(2, 1, 2), "x", 0, 1, valinit=1)
+
+        self.square = InteractiveSquare(self.axes, (0, 0), label_vertices=True)
+        self.square.register_transform(MutableMatrix("M", np.identity(2)))
+        self.square.register_slider(0, (0, 0), self.slider)
+
+    def test_add_interactive_animates_patch_and_labels(self):
+        uut = BlitManager(self.figure.canvas)
+
+        uut.add_interactive(self.square)
+
+        self.assertEqual(self.square.get_artists(), uut.get_artists())
+        self.assertEqual(5, len(uut.get_artists()))
+        self.assertTrue(all(artist.get_animated() for artist in uut.get_artists()))
+
+    def test_add_artist_of_other_figure(self):
+        uut = BlitManager(self.figure.canvas)
+        other = create_figure().add_subplot()
+
+        with self.assertRaises(ValueError):
+            uut.add_artist(other)
+
+    def test_update_draws_fully_once(self):
+        uut = BlitManager(self.figure.canvas)
+        uut.add_interactive(self.square)
+
+        with mock.patch.object(self.figure, "draw", wraps=self.figure.draw) as draw:
+            uut.update()
+            uut.update()
+            uut.update()
+
+        draw.assert_called_once()
+
+    def test_slider_blits_updated_square(self):
+        uut = BlitManager(self.figure.canvas)
+        uut.add_interactive(self.square)
+        uut.add_slider(self.slider)
+        self.figure.canvas.draw()
+        before = np.asarray(self.figure.canvas.buffer_rgba()).copy()
+
+        with mock.patch.object(self.figure, "draw") as draw:
+            self.slider.set_val(0.25)
+
+        draw.assert_not_called()
+        self.assertFalse(self.slider.drawon)
+        self.assertFalse(np.array_equal(before, np.asarray(self.figure.canvas.buffer_rgba())))
+
+        # Blitted frame matches a full draw of the same state.
+        blitted = np.asarray(self.figure.canvas.buffer_rgba()).copy()
+        self.figure.canvas.draw()
+        np.testing.assert_array_equal(blitted, np.asarray(self.figure.canvas.buffer_rgba()))
+
+    def test_scheduler_redraw(self):
+        uut = BlitManager(self.figure.canvas)
+        redraw = mock.Mock(wraps=uut.update)
+        scheduler = UpdateScheduler(self.figure.canvas, redraw=redraw)
+
+        scheduler.schedule(mock.Mock())
+        scheduler.flush()
+
+        redraw.assert_called_once()
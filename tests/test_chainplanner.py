@@ -0,0 +1,83 @@
+from unittest import TestCase, mock
+
+import numpy as np
+
+from src.chainplanner import ChainPlan, naive_cost
+
+
+class TestChainPlan(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_instance(self):
+        uut = ChainPlan([2, 3, 4])
+
+        self.assertIsNotNone(uut)
+
+    def test_no_matrices(self):
+        with self.assertRaises(ValueError):
+            ChainPlan([2])
+
+    def test_single_matrix(self):
+        uut = ChainPlan([2, 3])
+
+        self.assertEqual(0, uut.get_cost())
+        self.assertEqual("A0", uut.get_order())
+
+    def test_textbook_chain(self):
+        uut = ChainPlan([30, 35, 15, 5, 10, 20, 25])
+
+        self.assertEqual(15125, uut.get_cost())
+        self.assertEqual("((A0 (A1 A2)) ((A3 A4) A5))", uut.get_order())
+
+    def test_few_points_through_large_matrices(self):
+        # 4 points of 64 coordinates pushed through three 64x64 matrices: multiply the points through each in turn.
+        uut = ChainPlan([4, 64, 64, 64, 64])
+
+        self.assertEqual("(((A0 A1) A2) A3)", uut.get_order())
+        self.assertEqual(naive_cost([4, 64, 64, 64, 64]), uut.get_cost())
+
+    def test_many_points_through_small_matrices(self):
+        uut = ChainPlan([10000, 4, 4, 4, 3])
+
+        self.assertEqual("(A0 (A1 (A2 A3)))", uut.get_order())
+        self.assertLess(uut.get_cost(), naive_cost([10000, 4, 4, 4, 3]))
+
+    def test_evaluate(self):
+        rng = np.random.default_rng(0)
+        dimensions = [30, 35, 15, 5, 10, 20, 25]
+        operands = [rng.standard_normal((p, q)) for p, q in zip(dimensions, dimensions[1:])]
+
+        uut = ChainPlan(dimensions)
+
+        expected = np.linalg.multi_dot(operands)
+        actual = uut.evaluate(operands)
+
+        np.testing.assert_allclose(expected, actual)
+
+    def test_evaluate_out(self):
+        operands = [np.ones((2, 3)), np.ones((3, 4))]
+        out = np.empty((2, 4))
+
+        uut = ChainPlan([2, 3, 4])
+
+        actual = uut.evaluate(operands, out=out)
+
+        self.assertIs(out, actual)
+        self.assertEqual([[3] * 4] * 2, out.tolist())
+
+    def test_evaluate_dtype(self):
+        rng = np.random.default_rng(0)
+        points = rng.standard_normal((100, 2)).astype(np.float32)
+        lhs = rng.standard_normal((2, 100))
+        rhs = rng.standard_normal((100, 2))
+
+        # Multiplies lhs and rhs first, then the points by their product.
+        uut = ChainPlan([100, 2, 100, 2])
+
+        with mock.patch("numpy.matmul", wraps=np.matmul) as matmul:
+            actual = uut.evaluate([points, lhs, rhs], dtype=np.float32)
+
+        self.assertEqual([np.float64, np.float32], [call.args[0].dtype for call in matmul.call_args_list])
+        self.assertEqual(np.float32, actual.dtype)
+        np.testing.assert_allclose(points.astype(float) @ lhs @ rhs, actual, rtol=1e-5)
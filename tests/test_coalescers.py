@@ -0,0 +1,80 @@
+from unittest import TestCase
+
+import numpy as np
+
+import src.coalescers as coalescers
+
+
+class TestCoalescers(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_builtin_names(self):
+        self.assertIs(np.dot, coalescers.get_coalescer("dot"))
+        self.assertEqual("matmul", coalescers.get_coalescer_name(np.matmul))
+
+    def test_unregistered(self):
+        self.assertIsNone(coalescers.get_coalescer_name(lambda a, b: a))
+
+        with self.assertRaises(ValueError):
+            coalescers.get_coalescer("test_unregistered")
+
+    def test_register_name_twice(self):
+        coalescers.register_coalescer("test_register_name_twice", np.add)
+        coalescers.register_coalescer("test_register_name_twice", np.add)
+
+        with self.assertRaises(ValueError):
+            coalescers.register_coalescer("test_register_name_twice", np.subtract)
+
+    def test_info(self):
+        info = coalescers.get_info(np.dot)
+
+        self.assertEqual("dot", info.name)
+        self.assertTrue(info.associative)
+        self.assertEqual((2, 4), info.shape((2, 3), (3, 4)))
+        self.assertIs(np.matmul, info.batched)
+        self.assertFalse(coalescers.is_block(np.dot))
+
+    def test_append_column(self):
+        lhs = np.identity(3)
+        rhs = np.array([[1, 2, 3]])
+        info = coalescers.get_info(coalescers.append_column)
+
+        expected = np.concatenate((lhs, rhs.T), axis=1)
+
+        np.testing.assert_array_equal(expected, coalescers.append_column(lhs, rhs))
+        self.assertEqual(expected.shape, info.shape(lhs.shape, rhs.shape))
+        self.assertTrue(coalescers.is_block(coalescers.append_column))
+        self.assertFalse(coalescers.is_associative(coalescers.append_column))
+
+        with self.assertRaises(ValueError):
+            info.shape((3, 3), (1, 2))
+
+    def test_batched_concatenation(self):
+        lhs = np.stack([np.identity(3) * k for k in range(4)])
+        rhs = np.array([[1, 2, 3]])
+
+        actual = coalescers.get_info(coalescers.append_column).batched(lhs, rhs)
+
+        np.testing.assert_array_equal([coalescers.append_column(matrix, rhs) for matrix in lhs], actual)
+
+    def test_register_again_replaces_info(self):
+        def coalescer(lhs, rhs):
+            return lhs + rhs
+
+        coalescers.register_coalescer("test_register_again_replaces_info", coalescer)
+        coalescers.register_coalescer("test_register_again_replaces_info", coalescer, associative=True)
+
+        self.assertTrue(coalescers.is_associative(coalescer))
+        self.assertTrue(coalescers.get_info(coalescer).associative)
+
+    def test_register_alias_keeps_info(self):
+        coalescers.register_coalescer("test_register_alias_keeps_info", np.add)
+
+        self.assertEqual("add", coalescers.get_coalescer_name(np.add))
+        self.assertTrue(coalescers.is_associative(np.add))
+        self.assertIs(np.add, coalescers.get_coalescer("test_register_alias_keeps_info"))
+
+    def test_register_block_without_shape(self):
+        with self.assertRaises(ValueError):
+            coalescers.register_coalescer("test_register_block_without_shape", np.add, place=lambda *_: None)
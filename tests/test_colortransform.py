@@ -0,0 +1,116 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.colortransform import ColorTransform
+from src.mutablematrix import MutableMatrix
+
+
+class TestColorTransform(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.image = rng.integers(0, 256, (16, 12, 3), dtype=np.uint8)
+
+    def test_apply_diagonal(self):
+        color = ColorTransform()
+        color.register_transform(np.diag([0.8, 0.5, 1.2]), label="shift")
+
+        actual = color.apply(self.image)
+
+        self.assertEqual(np.float32, actual.dtype)
+        self.assertEqual(self.image.shape, actual.shape)
+        np.testing.assert_allclose(self.image * np.array([0.8, 0.5, 1.2]), actual, rtol=1e-6)
+
+    def test_apply_affine_chain(self):
+        matrix = np.array([[0.3, 0.6, 0.1, 10], [0.2, 0.7, 0.1, -5], [0.2, 0.1, 0.7, 0], [0, 0, 0, 1]])
+        scale = np.diag([1.0, 2.0, 0.5, 1.0])
+
+        color = ColorTransform()
+        color.register_transform(scale, label="S")
+        color.register_transform(matrix, label="M")
+
+        actual = color.apply(self.image.astype(float))
+
+        combined = scale @ matrix
+        expected = self.image @ combined[:3, :3].T + combined[:3, 3]
+        np.testing.assert_allclose(expected, actual, rtol=1e-5, atol=1e-3)
+
+    def test_apply_reuses_buffer(self):
+        color = ColorTransform()
+        color.register_transform(np.identity(3), label="I")
+
+        first = color.apply(self.image)
+        second = color.apply(self.image)
+
+        self.assertIs(first, second)
+
+    def test_apply_out(self):
+        color = ColorTransform()
+        color.register_transform(np.identity(3), label="I")
+        out = np.empty(self.image.shape, dtype=np.float32)
+
+        actual = color.apply(self.image, out=out)
+
+        self.assertIs(out, actual)
+        self.assertEqual(self.image.tolist(), actual.tolist())
+
+    def test_apply_uint8_matches_float(self):
+        matrix = MutableMatrix("M", [[0.3, 0.6, 0.1, 10], [0.2, 0.7, 0.1, -5], [-0.2, 0.1, 1.7, 0]])
+
+        color = ColorTransform()
+        color.register_transform(matrix)
+
+        actual = color.apply_uint8(self.image)
+        expected = np.clip(np.round(color.apply(self.image)), 0, 255)
+
+        self.assertEqual(np.uint8, actual.dtype)
+        self.assertLessEqual(np.abs(actual.astype(int) - expected).max(), 1)
+
+    def test_apply_uint8_strips(self):
+        color = ColorTransform(strip_size=7)
+        color.register_transform(np.array([[1, 0, 0, 0.4], [0, 1, 0, 0.6], [0, 0, 2, 0]]), label="M")
+
+        actual = color.apply_uint8(self.image)
+        expected = np.clip(np.round(self.image * np.array([1, 1, 2]) + np.array([0.4, 0.6, 0])), 0, 255)
+
+        self.assertEqual(expected.tolist(), actual.tolist())
+
+    def test_apply_uint8_follows_mutation(self):
+        matrix = MutableMatrix("M", np.identity(3))
+
+        color = ColorTransform()
+        color.register_transform(matrix)
+
+        self.assertEqual(self.image.tolist(), color.apply_uint8(self.image).tolist())
+
+        matrix.get_mutator((0, 0))(0)
+
+        self.assertEqual(0, color.apply_uint8(self.image)[..., 0].max())
+
+    def test_apply_uint8_rejects_float(self):
+        color = ColorTransform()
+        color.register_transform(np.identity(3), label="I")
+
+        with self.assertRaises(TypeError):
+            color.apply_uint8(self.image.astype(float))
+
+    def test_apply_rejects_bad_out(self):
+        color = ColorTransform()
+        color.register_transform(np.identity(3), label="I")
+
+        transposed = np.empty((12, 16, 3), dtype=np.float32).transpose(1, 0, 2)
+        for out in (transposed, np.empty(self.image.shape, dtype=float), np.empty((16, 12, 4), dtype=np.float32)):
+            with self.assertRaises(ValueError):
+                color.apply(self.image, out=out)
+
+    def test_apply_uint8_rejects_bad_out(self):
+        color = ColorTransform()
+        color.register_transform(np.identity(3), label="I")
+
+        transposed = np.empty((12, 16, 3), dtype=np.uint8).transpose(1, 0, 2)
+        for out in (transposed, np.empty(self.image.shape, dtype=np.float32)):
+            with self.assertRaises(ValueError):
+                color.apply_uint8(self.image, out=out)
@@ -0,0 +1,84 @@
+from unittest import TestCase, mock
+
+import numpy as np
+
+import src.executor as executor_module
+import src.utility as utility
+from src.colortransform import ColorTransform
+from src.executor import TileExecutor
+
+
+class TestTileExecutor(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.matrix = rng.standard_normal((4, 4))
+        self.points = rng.standard_normal((1001, 3))
+        self.image = rng.integers(0, 256, (31, 7, 3), dtype=np.uint8)
+
+        self.color = ColorTransform()
+        self.color.register_transform(np.array([[0.3, 0.6, 0.1, 10], [0.2, 0.7, 0.1, -5], [0.2, 0.1, 0.7, 0]]),
+                                      label="M")
+
+    def test_get_tiles(self):
+        with TileExecutor(workers=3, min_tile=10) as executor:
+            tiles = executor.get_tiles(100)
+            small = executor.get_tiles(15)
+
+        self.assertEqual([(0, 33), (33, 66), (66, 100)], [(tile.start, tile.stop) for tile in tiles])
+        self.assertEqual([(0, 15)], [(tile.start, tile.stop) for tile in small])
+
+    def test_apply_transform_threads(self):
+        with TileExecutor(workers=4, min_tile=100) as executor:
+            actual = executor.apply_transform(self.matrix, self.points)
+
+        np.testing.assert_allclose(utility.apply_transform(self.matrix, self.points), actual)
+
+    def test_apply_transform_row_vector(self):
+        with TileExecutor(workers=2, min_tile=100) as executor:
+            actual = executor.apply_transform(self.matrix, self.points, row_vector=True)
+
+        np.testing.assert_allclose(utility.apply_transform(self.matrix, self.points, row_vector=True), actual)
+
+    def test_apply_transform_processes(self):
+        with TileExecutor(workers=2, processes=True, min_tile=100) as executor:
+            out = np.empty_like(self.points)
+            actual = executor.apply_transform(self.matrix, self.points, out=out)
+
+        self.assertIs(out, actual)
+        np.testing.assert_allclose(utility.apply_transform(self.matrix, self.points), actual)
+
+    def test_apply_color_uint8(self):
+        with TileExecutor(workers=3, min_tile=16) as executor:
+            actual = executor.apply_color(self.color, self.image)
+
+        self.assertEqual(self.color.apply_uint8(self.image).tolist(), actual.tolist())
+
+    def test_apply_color_float(self):
+        image = self.image.astype(np.float32)
+
+        with TileExecutor(workers=3, processes=True, min_tile=16) as executor:
+            actual = executor.apply_color(self.color, image)
+
+        np.testing.assert_allclose(self.color.apply(image), actual, rtol=1e-6)
+
+    def test_shared_blocks_cleaned_up_when_sharing_fails(self):
+        share = executor_module._share
+        blocks = []
+
+        def fail_second(array, copy=True):
+            if blocks:
+                raise MemoryError
+            shared, block = share(array, copy)
+            blocks.append(block)
+            return shared, block
+
+        with mock.patch.object(executor_module, "_share", side_effect=fail_second):
+            with TileExecutor(workers=2, processes=True, min_tile=100) as executor:
+                with self.assertRaises(MemoryError):
+                    executor.apply_transform(self.matrix, self.points)
+
+        with self.assertRaises(FileNotFoundError):
+            executor_module.shared_memory.SharedMemory(name=blocks[0].name)
@@ -0,0 +1,40 @@
+from unittest import TestCase
+
+import numpy as np
+from matplotlib import widgets
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+from src.headless import create_figure, drive_sliders
+from src.interactivesquare import InteractiveSquare
+from src.mutablematrix import MutableMatrix
+
+
+class TestHeadless(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_create_figure(self):
+        uut = create_figure()
+
+        self.assertIsInstance(uut.canvas, FigureCanvasAgg)
+
+    def test_drive_sliders(self):
+        figure = create_figure()
+        axes = figure.add_subplot(2, 1, 1)
+        slider = widgets.Slider(figure.add_subplot(2, 1, 2), "x", 0, 1, valinit=0)
+
+        square = InteractiveSquare(axes, (0, 0))
+        square.register_transform(MutableMatrix("M", np.identity(2)))
+        square.register_slider(0, (0, 0), slider)
+
+        results = drive_sliders(figure, [square], {slider: [0.25, 0.5]})
+
+        for stage in ("mutate", "coalesce", "transform", "convert", "patch", "draw", "frame", "fps"):
+            self.assertIn(stage, results)
+        self.assertGreater(results["fps"], 0)
+        self.assertTrue(slider.drawon)
+
+        # Last frame scaled x by 0.5.
+        xy = square.get_patch().get_xy()
+        np.testing.assert_allclose([-0.25, -0.5], xy.min(axis=0))
+        np.testing.assert_allclose([0.25, 0.5], xy.max(axis=0))
@@ -0,0 +1,69 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.homogenouspoints import HomogenousPoints
+
+
+class TestHomogenousPoints(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_instance(self):
+        uut = HomogenousPoints([[1, 2], [3, 4]])
+
+        self.assertIsNotNone(uut)
+
+    def test_get_homogenous(self):
+        uut = HomogenousPoints([[1, 2], [3, 4]])
+
+        expected = [[1, 2, 1], [3, 4, 1]]
+        actual = uut.get_homogenous().tolist()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_cartesian_is_view(self):
+        uut = HomogenousPoints([[1, 2], [3, 4]])
+
+        actual = uut.get_cartesian()
+
+        self.assertTrue(np.shares_memory(uut.get_homogenous(), actual))
+        self.assertEqual([[1, 2], [3, 4]], actual.tolist())
+
+    def test_dtype(self):
+        uut = HomogenousPoints(np.zeros((2, 2), dtype=np.float32))
+
+        self.assertEqual(np.float32, uut.get_homogenous().dtype)
+
+    def test_transform(self):
+        uut = HomogenousPoints([[1, 2], [3, 4]])
+
+        T = np.array([
+            [1, 0, 1],
+            [0, 1, 0],
+            [0, 0, 2]
+        ])
+        actual = uut.transform(T)
+
+        self.assertEqual([[2, 2, 2], [4, 4, 2]], actual.get_homogenous().tolist())
+        self.assertEqual([[1, 1], [2, 2]], actual.get_cartesian().tolist())
+        self.assertEqual([[1, 1, 1], [2, 2, 1]], actual.get_homogenous().tolist())
+
+    def test_transform_out(self):
+        uut = HomogenousPoints([[1, 2], [3, 4]])
+        out = HomogenousPoints(np.zeros((2, 2)))
+
+        actual = uut.transform(np.diag([2, 2, 2]), out=out)
+
+        self.assertIs(out, actual)
+        self.assertEqual([[1, 2], [3, 4]], actual.get_cartesian().tolist())
+
+    def test_normalize_epsilon(self):
+        uut = HomogenousPoints.from_homogenous(np.array([[1, 1, 0], [2, 2, 2]]))
+
+        uut.normalize(epsilon=1e-3, fill=np.nan)
+
+        actual = uut.get_cartesian()
+
+        self.assertTrue(np.all(np.isnan(actual[0])))
+        self.assertEqual([1, 1], actual[1].tolist())
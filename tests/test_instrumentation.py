@@ -0,0 +1,96 @@
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+from matplotlib import figure
+
+import src.instrumentation as instrumentation
+from src.instrumentation import Profiler
+from src.interactivesquare import InteractiveSquare
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+
+
+class TestProfiler(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        self.A = MutableMatrix("A", np.identity(2))
+        self.B = MutableMatrix("B", np.identity(2))
+
+        self.sequence = Sequence()
+        self.sequence.register_node(self.A, None)
+        self.sequence.register_node(self.B, np.dot)
+
+    def test_disabled_by_default(self):
+        self.assertIsNone(instrumentation.get_profiler())
+
+    def test_enable_restores_previous(self):
+        with Profiler() as outer:
+            with Profiler() as inner:
+                self.assertIs(inner, instrumentation.get_profiler())
+            self.assertIs(outer, instrumentation.get_profiler())
+        self.assertIsNone(instrumentation.get_profiler())
+
+    def test_sequence_spans_and_cache_counters(self):
+        with Profiler() as uut:
+            self.sequence.get_matrix()
+            self.sequence.get_matrix()
+            self.B.get_mutator((0, 0))(2)
+            self.sequence.get_matrix()
+
+        stats = uut.get_stats()
+        self.assertEqual(1, stats["spans"]["A"]["calls"])
+        self.assertEqual(2, stats["spans"]["dot() B"]["calls"])
+        self.assertEqual(3, stats["counters"]["Sequence prefix misses"])
+        self.assertEqual(3, stats["counters"]["Sequence prefix hits"])
+
+    def test_nothing_recorded_when_disabled(self):
+        uut = Profiler()
+
+        self.sequence.get_matrix()
+
+        self.assertEqual({"spans": {}, "counters": {}}, uut.get_stats())
+
+    def test_interactive_stages_and_updates(self):
+        square = InteractiveSquare(figure.Figure().add_subplot(), (0, 0))
+        square.register_transform(self.sequence)
+
+        with Profiler() as uut:
+            square._update_patch()
+            square._update_patch()
+
+        stats = uut.get_stats()
+        for stage in ("coalesce", "transform", "convert", "patch"):
+            self.assertEqual(2, stats["spans"][f"InteractiveSquare.{stage}"]["calls"])
+        self.assertEqual(2, stats["counters"][f"InteractiveSquare@{id(square):#x} updates"])
+
+    def test_export_chrome_trace(self):
+        with Profiler() as uut:
+            self.sequence.get_matrix()
+
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "trace.json")
+            uut.export_chrome_trace(path)
+
+            with open(path) as file:
+                trace = json.load(file)
+
+        spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+        self.assertEqual(["A", "dot() B"], [event["name"] for event in spans])
+        self.assertTrue(all(event["dur"] >= 0 and event["cat"] == "coalesce" for event in spans))
+
+        counters = [event for event in trace["traceEvents"] if event["ph"] == "C"]
+        self.assertEqual(2, counters[0]["args"]["Sequence prefix misses"])
+
+    def test_max_events(self):
+        uut = Profiler(max_events=1)
+
+        for _ in range(3):
+            uut.record("span", uut.clock())
+
+        self.assertEqual(3, uut.get_stats()["spans"]["span"]["calls"])
+        self.assertEqual(1, len(uut.get_chrome_trace()["traceEvents"]))
@@ -0,0 +1,118 @@
+import tracemalloc
+from unittest import TestCase
+
+import numpy as np
+from matplotlib import collections, figure, patches
+
+import src.utility as utility
+from src.interactiveshape import InteractiveShape
+from src.mutablematrix import MutableMatrix
+
+
+class TestInteractiveShape(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        self.figure = figure.Figure()
+        self.axes = self.figure.add_subplot()
+
+    def test_instance(self):
+        uut = InteractiveShape(self.axes, utility.polygon(5))
+
+        self.assertIsNotNone(uut)
+        self.assertIsInstance(uut.get_patch(), patches.Polygon)
+
+    def test_vertices_contiguous(self):
+        vertices = np.asfortranarray(utility.polygon(6))
+
+        uut = InteractiveShape(self.axes, vertices, add_coords=[0, 1], dtype=np.float32)
+
+        actual = uut.get_vertices()
+
+        self.assertTrue(actual.flags.c_contiguous)
+        self.assertEqual(np.float32, actual.dtype)
+        self.assertEqual((6, 4), actual.shape)
+        self.assertEqual([0, 1], actual[0, 2:].tolist())
+
+    def test_update_polygon(self):
+        uut = InteractiveShape(self.axes, [[0, 0], [1, 0], [0, 1]])
+        uut.register_transform(np.identity(2) * 2, label="S")
+
+        uut._update_patch()
+
+        expected = [[0, 0], [2, 0], [0, 2]]
+        actual = uut.get_patch().get_xy()[:3].tolist()
+
+        self.assertEqual(expected, actual)
+
+    def test_update_mesh(self):
+        vertices, faces = utility.grid(2, 3)
+
+        uut = InteractiveShape(self.axes, vertices, faces)
+        uut.register_transform(np.array([
+            [1, 0, 10],
+            [0, 1, 0],
+            [0, 0, 1]
+        ]), label="T")
+
+        uut._update_patch()
+
+        paths = uut.get_patch().get_paths()
+
+        self.assertIsInstance(uut.get_patch(), collections.PolyCollection)
+        self.assertEqual(6, len(paths))
+        self.assertEqual((vertices[faces[0]] + [10, 0]).tolist(), paths[0].vertices[:4].tolist())
+
+    def test_labels(self):
+        uut = InteractiveShape(self.axes, utility.polygon(3), labels=True)
+
+        self.assertEqual(["0", "1", "2"], [label.get_text() for label in uut._labels])
+
+    def test_labels_disabled_for_large_shapes(self):
+        with self.assertWarns(UserWarning):
+            uut = InteractiveShape(self.axes, utility.polygon(100), labels=True, max_labels=10)
+
+        self.assertEqual([], uut._labels)
+
+    def test_from_obj(self):
+        lines = [
+            "# Square",
+            "v -1 -1 0",
+            "v 1 -1 0",
+            "v 1 1 0",
+            "v -1 1 0",
+            "f 1 2 3 4",
+        ]
+
+        uut = InteractiveShape.from_obj(self.axes, lines)
+
+        self.assertEqual((4, 3), uut.get_vertices().shape)
+        self.assertEqual([[0, 1, 2], [0, 2, 3]], uut.get_faces().tolist())
+
+    def test_update_allocations_bounded(self):
+        for vertices, faces in ((utility.polygon(10000), None), utility.grid(60, 60)):
+            uut = InteractiveShape(self.axes, vertices, faces, add_coords=[1])
+            rotation = MutableMatrix("R", np.identity(3))
+            uut.register_transform(rotation)
+            uut.register_transform(np.array([[1, 0, 5], [0, 1, 0], [0, 0, 1]]), label="T")
+            mutate = rotation.get_mutator((0, 1))
+
+            # The first updates allocate the scratch buffers.
+            for value in range(2):
+                mutate(value)
+                uut._update_patch()
+
+            tracemalloc.start()
+            try:
+                baseline, _ = tracemalloc.get_traced_memory()
+                for value in range(20):
+                    mutate(value / 20)
+                    uut._update_patch()
+                current, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+            # Far less than a single copy of the transformed vertices.
+            self.assertLess(peak - baseline, 4096)
+            self.assertLess(current - baseline, 1024)
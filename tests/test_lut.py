@@ -0,0 +1,79 @@
+import math
+from unittest import TestCase
+
+import numpy as np
+
+from src.lut import ColorLookup, gamma
+
+
+class TestColorLookup(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.image = rng.integers(0, 256, (9, 7, 3), dtype=np.uint8)
+
+    def test_identity(self):
+        lookup = ColorLookup()
+
+        self.assertEqual(self.image.tolist(), lookup.apply(self.image).tolist())
+
+    def test_gamma_all_channels(self):
+        lookup = ColorLookup()
+        lookup.register_modifier(gamma, parameters=(2.2,))
+
+        expected = np.clip(np.rint(255 * (self.image / 255) ** 2.2), 0, 255)
+
+        self.assertEqual(expected.tolist(), lookup.apply(self.image).tolist())
+
+    def test_per_channel_chain(self):
+        lookup = ColorLookup()
+        lookup.register_modifier(lambda value: value * 2, channels=[0])
+        lookup.register_modifier(math.sqrt, channels=[0, 2])
+
+        actual = lookup.apply(self.image)
+
+        self.assertEqual(np.clip(np.rint(np.sqrt(self.image[..., 0] * 2.0)), 0, 255).tolist(),
+                         actual[..., 0].tolist())
+        self.assertEqual(self.image[..., 1].tolist(), actual[..., 1].tolist())
+        self.assertEqual(np.rint(np.sqrt(self.image[..., 2])).tolist(), actual[..., 2].tolist())
+
+    def test_cache_hits_and_eviction(self):
+        lookup = ColorLookup(maxsize=2)
+        stage = lookup.register_modifier(gamma, parameters=(1.0,))
+        mutate = lookup.get_mutator(stage, modifier=lambda value: value / 10)
+
+        for value in (10, 20, 10, 30, 20):
+            mutate(value)
+            lookup.get_tables()
+
+        # 10, 20 miss; 10 hits; 30 misses and evicts 20, which then misses again.
+        self.assertEqual((1, 4, 2), lookup.get_cache_info())
+        self.assertEqual((2.0,), lookup.get_parameters(stage))
+
+    def test_apply_out(self):
+        lookup = ColorLookup()
+        lookup.register_modifier(lambda value: 255 - value, channels=[1])
+        out = np.empty_like(self.image)
+
+        actual = lookup.apply(self.image, out=out)
+
+        self.assertIs(out, actual)
+        self.assertEqual((255 - self.image[..., 1]).tolist(), out[..., 1].tolist())
+
+    def test_apply_rejects_float(self):
+        with self.assertRaises(TypeError):
+            ColorLookup().apply(self.image.astype(float))
+
+    def test_apply_rejects_channels(self):
+        with self.assertRaises(ValueError):
+            ColorLookup().apply(self.image[..., :2])
+
+    def test_apply_rejects_bad_out(self):
+        lookup = ColorLookup()
+        lookup.register_modifier(lambda value: 255 - value, channels=[1])
+
+        for out in (np.empty((9, 7, 2), dtype=np.uint8), np.empty(self.image.shape, dtype=np.float32)):
+            with self.assertRaises(ValueError):
+                lookup.apply(self.image, out=out)
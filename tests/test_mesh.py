@@ -0,0 +1,59 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from src.mesh import load_obj
+
+
+class TestMesh(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_load_obj_triangle(self):
+        vertices, faces = load_obj(["v 0 0 0", "v 1 0 0", "v 0 1 0", "f 1 2 3"])
+
+        self.assertEqual([[0, 0, 0], [1, 0, 0], [0, 1, 0]], vertices.tolist())
+        self.assertEqual([[0, 1, 2]], faces.tolist())
+
+    def test_load_obj_ignores_other_statements(self):
+        lines = [
+            "# comment",
+            "o object",
+            "v 0 0 0",
+            "vt 0 0",
+            "vn 0 0 1",
+            "v 1 0 0",
+            "",
+            "v 0 1 0",
+            "f 1/1/1 2/1/1 3/1/1",
+        ]
+
+        vertices, faces = load_obj(lines)
+
+        self.assertEqual((3, 3), vertices.shape)
+        self.assertEqual([[0, 1, 2]], faces.tolist())
+
+    def test_load_obj_negative_indices(self):
+        _, faces = load_obj(["v 0 0", "v 1 0", "v 0 1", "f -3 -2 -1"])
+
+        self.assertEqual([[0, 1, 2]], faces.tolist())
+
+    def test_load_obj_fan_triangulation(self):
+        _, faces = load_obj(["v 0 0", "v 1 0", "v 2 1", "v 1 2", "v 0 1", "f 1 2 3 4 5"])
+
+        self.assertEqual([[0, 1, 2], [0, 2, 3], [0, 3, 4]], faces.tolist())
+
+    def test_load_obj_missing_vertex(self):
+        with self.assertRaises(ValueError):
+            load_obj(["v 0 0", "v 1 0", "f 1 2 3"])
+
+    def test_load_obj_path(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "triangle.obj")
+            with open(path, "w") as file:
+                file.write("v 0 0\nv 1 0\nv 0 1\nf 1 2 3\n")
+
+            vertices, faces = load_obj(path)
+
+        self.assertEqual(3, len(vertices))
+        self.assertEqual([[0, 1, 2]], faces.tolist())
@@ -1,5 +1,8 @@
 from unittest import TestCase
 
+import numpy as np
+
+import src.structures as structures
 from src.mutablematrix import MutableMatrix
 
 
@@ -48,3 +51,44 @@ class TestMutableMatrix(TestCase):
         actual = uut.get_matrix().tolist()
 
         self.assertEqual(expected, actual)
+
+    def test_get_version(self):
+        uut = MutableMatrix("T", [[1, 0], [0, 1]])
+
+        initial = uut.get_version()
+
+        uut.get_mutator((0, 1))(2)
+        uut.get_mutator((1, 0), lambda v: v + 1)(2)
+
+        self.assertEqual(initial + 2, uut.get_version())
+
+    def test_is_constant(self):
+        uut = MutableMatrix("T", [[1, 0], [0, 1]])
+
+        self.assertTrue(uut.is_constant())
+
+        uut.get_mutator((0, 1))
+
+        self.assertFalse(uut.is_constant())
+
+    def test_get_structure(self):
+        uut = MutableMatrix("T", [[1, 0], [0, 1]])
+
+        self.assertEqual(structures.IDENTITY, uut.get_structure())
+
+        uut.get_mutator((0, 0))(2)
+
+        self.assertEqual(structures.DIAGONAL, uut.get_structure())
+
+        uut.get_mutator((1, 0))(3)
+
+        self.assertEqual(structures.DENSE, uut.get_structure())
+
+    def test_no_copy(self):
+        matrix = np.identity(2)
+
+        uut = MutableMatrix("T", matrix, dtype=matrix.dtype, copy=False)
+        uut.get_mutator((0, 1))(2)
+
+        self.assertIs(matrix, uut.get_matrix())
+        self.assertEqual(2, matrix[0, 1])
@@ -0,0 +1,86 @@
+from unittest import TestCase
+
+import numpy as np
+
+import src.precision as precision
+import src.utility as utility
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.transforms import EulerRotation
+
+
+class TestPrecision(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def tearDown(self):
+        precision.set_precision(points=np.float32, matrices=np.float64)
+
+    def chain(self, count=200):
+        """Sequence of `count` small rotations, each mutated away from identity."""
+        rng = np.random.default_rng(0)
+
+        sequence = Sequence()
+        for index in range(count):
+            rotation = EulerRotation(f"R{index}", angles=rng.uniform(-0.1, 0.1, 3))
+            sequence.register_node(rotation, np.dot)
+
+        return sequence
+
+    def test_defaults(self):
+        self.assertEqual(np.float32, utility.square().dtype)
+        self.assertEqual(np.float32, utility.polygon(5).dtype)
+        self.assertEqual(np.float32, utility.grid(2, 2)[0].dtype)
+        self.assertEqual(np.float64, MutableMatrix("M", [[1, 0], [0, 1]]).get_matrix().dtype)
+
+    def test_explicit_dtype(self):
+        self.assertEqual(np.float64, utility.square(dtype=np.float64).dtype)
+        self.assertEqual(np.float32, MutableMatrix("M", [[1]], dtype=np.float32).get_matrix().dtype)
+
+    def test_set_precision(self):
+        precision.set_precision(points=np.float64)
+
+        self.assertEqual(np.float64, utility.square().dtype)
+
+        with self.assertRaises(TypeError):
+            precision.set_precision(matrices=np.int32)
+
+    def test_int_matrix_does_not_truncate(self):
+        matrix = MutableMatrix("M", [[1, 0], [0, 1]])
+
+        matrix.get_mutator((0, 1))(0.5)
+
+        self.assertEqual([[1, 0.5], [0, 1]], matrix.get_matrix().tolist())
+
+    def test_sequence_accumulates_in_matrix_precision(self):
+        sequence = Sequence()
+        sequence.register_node(MutableMatrix("A", [[1, 0], [0, 1]], dtype=np.float32), np.dot)
+        sequence.register_node(MutableMatrix("B", [[1, 0], [0, 1]], dtype=np.float32), np.dot)
+
+        self.assertEqual(np.float64, sequence.get_matrix().dtype)
+
+    def test_float32_points_accuracy(self):
+        sequence = self.chain()
+        points = utility.grid(50, 50, add_coords=(1,))[0]
+
+        actual = utility.apply_transform(sequence.get_matrix(), points)
+        expected = utility.apply_transform(sequence.get_matrix(), points.astype(np.float64))
+
+        self.assertEqual(np.float32, actual.dtype)
+        np.testing.assert_allclose(expected, actual, rtol=0, atol=1e-4 * np.abs(expected).max())
+
+    def test_float64_accumulation_beats_float32(self):
+        precision.set_precision(matrices=np.float32)
+        single = self.chain().get_matrix()
+
+        precision.set_precision(matrices=np.float64)
+        double = self.chain().get_matrix()
+
+        self.assertEqual(np.float32, single.dtype)
+
+        # A product of rotations is orthogonal; accumulated rounding shows up as drift from orthogonality.
+        single_error = np.abs(single.T.astype(np.float64) @ single - np.identity(3)).max()
+        double_error = np.abs(double.T @ double - np.identity(3)).max()
+
+        self.assertLess(double_error, 1e-12)
+        self.assertLess(double_error, single_error)
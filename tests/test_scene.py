@@ -0,0 +1,122 @@
+from unittest import TestCase
+
+import numpy as np
+from matplotlib import figure, widgets
+
+import src.utility as utility
+from src.scene import Scene
+
+
+class TestScene(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        self.figure = figure.Figure()
+        self.axes = self.figure.add_subplot()
+
+    def test_instance(self):
+        uut = Scene(self.axes)
+
+        self.assertIsNotNone(uut)
+        self.assertIn(uut.get_collection(), self.axes.collections)
+
+    def test_add_shape(self):
+        uut = Scene(self.axes)
+
+        first = uut.add_square((0, 0))
+        second = uut.add_shape([[0, 0], [1, 0], [0, 1]])
+
+        self.assertEqual(0, first)
+        self.assertEqual(1, second)
+        self.assertEqual(2, uut.get_shape_count())
+        self.assertEqual((7, 2), uut.get_vertices().shape)
+        self.assertTrue(uut.get_vertices().flags.c_contiguous)
+
+    def test_add_shapes(self):
+        uut = Scene(self.axes)
+
+        uut.add_square((0, 0))
+        indices = uut.add_shapes(np.zeros((3, 4, 2)))
+
+        self.assertEqual(range(1, 4), indices)
+        self.assertEqual(4, uut.get_shape_count())
+
+    def test_empty_vertices_dtype(self):
+        uut = Scene(self.axes, dtype=np.float32)
+
+        self.assertEqual(np.float32, uut.get_vertices().dtype)
+
+    def test_add_shape_mismatched_coordinates(self):
+        uut = Scene(self.axes)
+
+        uut.add_square((0, 0))
+
+        with self.assertRaises(ValueError):
+            uut.add_square((0, 0), add_coords=[1])
+
+    def test_update_without_transforms(self):
+        uut = Scene(self.axes)
+
+        uut.add_square((0, 0), 2)
+        uut.update()
+
+        paths = uut.get_collection().get_paths()
+
+        self.assertEqual(1, len(paths))
+        self.assertCountEqual([[-1, -1], [-1, 1], [1, 1], [1, -1]], paths[0].vertices[:4].tolist())
+
+    def test_update_shared_transform(self):
+        uut = Scene(self.axes)
+
+        uut.add_square((0, 0), 2)
+        uut.add_square((4, 0), 2)
+        uut.register_transform(np.array([
+            [1, 0, 1],
+            [0, 1, 2],
+            [0, 0, 1]
+        ]), label="T")
+        uut.update()
+
+        paths = uut.get_collection().get_paths()
+
+        self.assertCountEqual([[0, 1], [0, 3], [2, 3], [2, 1]], paths[0].vertices[:4].tolist())
+        self.assertCountEqual([[4, 1], [4, 3], [6, 3], [6, 1]], paths[1].vertices[:4].tolist())
+
+    def test_update_mixed_vertex_counts(self):
+        uut = Scene(self.axes)
+
+        uut.add_square((0, 0), 2)
+        uut.add_shape([[0, 0], [1, 0], [0, 1]])
+        uut.register_transform(np.identity(2) * 2, label="S")
+        uut.update()
+
+        paths = uut.get_collection().get_paths()
+
+        self.assertEqual(2, len(paths))
+        self.assertEqual([[0, 0], [2, 0], [0, 2]], paths[1].vertices[:3].tolist())
+
+    def test_update_homogenous(self):
+        uut = Scene(self.axes, convert_2d=utility.from_homogenous)
+
+        uut.add_square((0, 0), 2, add_coords=[1])
+        uut.register_transform(np.diag([1, 1, 2]), label="W")
+        uut.update()
+
+        paths = uut.get_collection().get_paths()
+
+        self.assertCountEqual([[-0.5, -0.5], [-0.5, 0.5], [0.5, 0.5], [0.5, -0.5]], paths[0].vertices[:4].tolist())
+
+    def test_register_slider(self):
+        uut = Scene(self.axes)
+        slider = widgets.Slider(self.figure.add_axes([0, 0, 1, 0.1]), "Scale", 0, 4, valinit=1)
+
+        uut.add_square((0, 0), 2)
+        uut.register_transform(np.identity(2), label="S")
+        uut.register_slider(0, (0, 0), slider)
+
+        slider.set_val(3)
+
+        paths = uut.get_collection().get_paths()
+
+        self.assertCountEqual([[-3, -1], [-3, 1], [3, 1], [3, -1]], paths[0].vertices[:4].tolist())
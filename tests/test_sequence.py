@@ -1,9 +1,12 @@
-from unittest import TestCase
+from unittest import TestCase, mock
 
 import numpy as np
 
+import src.coalescers as coalescers
+import src.utility as utility
 from src.componentmatrix import ComponentMatrix
-from src.sequence import Sequence
+from src.mutablematrix import MutableMatrix
+from src.sequence import ASSEMBLE_MIN_SIZE, Sequence
 
 
 class MockComponent(ComponentMatrix):
@@ -22,6 +25,16 @@ class MockComponent(ComponentMatrix):
         return self._label
 
 
+class CountingCoalescer:
+    def __init__(self, coalescer=np.dot):
+        self.calls = 0
+        self._coalescer = coalescer
+
+    def __call__(self, lhs, rhs):
+        self.calls += 1
+        return self._coalescer(lhs, rhs)
+
+
 class TestSequence(TestCase):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -99,3 +112,353 @@ class TestSequence(TestCase):
         actual = uut.get_matrix().tolist()
 
         self.assertEqual(expected, actual)
+
+    def test_get_matrix_cached(self):
+        uut = Sequence()
+        coalescer = CountingCoalescer()
+
+        for label in ("T1", "T2", "T3"):
+            uut.register_node(MutableMatrix(label, [[1, 0], [0, 1]]), coalescer)
+
+        first = uut.get_matrix()
+        second = uut.get_matrix()
+
+        self.assertIs(first, second)
+        self.assertEqual(2, coalescer.calls)
+
+    def test_get_matrix_recomputes_from_dirty_node(self):
+        uut = Sequence()
+        coalescer = CountingCoalescer()
+
+        components = [MutableMatrix(f"T{i}", [[1, 0], [0, 1]]) for i in range(5)]
+        for component in components:
+            uut.register_node(component, coalescer)
+
+        uut.get_matrix()
+        coalescer.calls = 0
+
+        components[3].get_mutator((0, 1))(2)
+
+        expected = [[1, 2], [0, 1]]
+        actual = uut.get_matrix().tolist()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(2, coalescer.calls)  # Nodes 3 and 4 only
+
+    def test_get_matrix_register_after_get(self):
+        uut = Sequence()
+        coalescer = CountingCoalescer(np.add)
+
+        uut.register_node(MockComponent("T1"), None)
+        uut.register_node(MockComponent("T2"), coalescer)
+        uut.get_matrix()
+
+        uut.register_node(MockComponent("T3"), coalescer)
+
+        expected = [[3, 0], [0, 3]]
+        actual = uut.get_matrix().tolist()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(2, coalescer.calls)
+
+    def test_get_matrix_nested_sequence_dirty(self):
+        uut = Sequence()
+
+        leaf = MutableMatrix("T2", [[1, 0], [0, 1]])
+        nested = Sequence()
+        nested.register_node(MockComponent("T1"), None)
+        nested.register_node(leaf, np.dot)
+
+        uut.register_node(MockComponent("T3", [[3, 0], [0, 3]]), None)
+        uut.register_node(nested, np.dot)
+        uut.get_matrix()
+
+        leaf.get_mutator((0, 1))(1)
+
+        expected = [[3, 3], [0, 3]]
+        actual = uut.get_matrix().tolist()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_matrix_reuse_buffers(self):
+        uut = Sequence(reuse_buffers=True)
+
+        first = MutableMatrix("T1", [[1, 0], [0, 1]])
+        uut.register_node(first, None)
+        uut.register_node(MutableMatrix("T2", [[2, 0], [0, 2]]), np.dot)
+        uut.register_node(MutableMatrix("T3", [[1, 1], [0, 1]]), np.dot)
+
+        before = uut.get_matrix()
+        first.get_mutator((1, 0))(1)
+        after = uut.get_matrix()
+
+        self.assertIs(before, after)
+        self.assertEqual([[2, 2], [2, 4]], after.tolist())
+
+    def test_apply_matches_apply_transform(self):
+        rng = np.random.default_rng(0)
+
+        uut = Sequence()
+        uut.register_node(MockComponent("K", rng.standard_normal((3, 4))), None)
+        uut.register_node(MockComponent("E1", rng.standard_normal((4, 4))), np.dot)
+        uut.register_node(MockComponent("E2", rng.standard_normal((4, 4))), np.dot)
+
+        for count in (1, 4, 1000):
+            points = rng.standard_normal((count, 3))
+
+            expected = utility.apply_transform(uut.get_matrix(), points)
+            actual = uut.apply(points)
+
+            np.testing.assert_allclose(expected, actual)
+
+    def test_apply_after_non_multiplicative_node(self):
+        rng = np.random.default_rng(0)
+
+        uut = Sequence()
+        uut.register_node(MockComponent("A", rng.standard_normal((3, 3))), None)
+        uut.register_node(MockComponent("T", rng.standard_normal((1, 3))),
+                          lambda lhs, rhs: np.concatenate((lhs, rhs.T), axis=1))
+        uut.register_node(MockComponent("E", rng.standard_normal((4, 4))), np.dot)
+
+        points = rng.standard_normal((5, 4))
+
+        expected = utility.apply_transform(uut.get_matrix(), points)
+        actual = uut.apply(points)
+
+        np.testing.assert_allclose(expected, actual)
+
+    def test_apply_float32_points(self):
+        rng = np.random.default_rng(0)
+        uut = Sequence()
+        uut.register_node(MockComponent("A", rng.standard_normal((2, 50))), None)
+        uut.register_node(MockComponent("B", rng.standard_normal((50, 2))), np.dot)
+
+        points = rng.standard_normal((50, 2)).astype(np.float32)
+
+        expected = utility.apply_transform(uut.get_matrix(), points.astype(float))
+        actual = uut.apply(points)
+
+        self.assertEqual(np.float32, actual.dtype)
+        np.testing.assert_allclose(expected, actual, rtol=1e-4)
+
+    def test_apply_plan_cached(self):
+        uut = Sequence()
+        uut.register_node(MockComponent("T1"), None)
+        uut.register_node(MockComponent("T2"), np.dot)
+
+        uut.apply(np.ones((4, 2)))
+        plan = uut.get_plan()
+        uut.apply(np.ones((4, 2)))
+
+        self.assertIs(plan, uut.get_plan())
+
+        uut.apply(np.ones((8, 2)))
+
+        self.assertIsNot(plan, uut.get_plan())
+
+    def test_apply_few_points_multiplied_through_chain(self):
+        uut = Sequence()
+        for index in range(4):
+            uut.register_node(MockComponent(f"T{index}", np.identity(64)), np.dot)
+
+        uut.apply(np.ones((4, 64)))
+
+        self.assertEqual("((((A0 A1) A2) A3) A4)", uut.get_plan().get_order())
+
+    def test_get_label(self):
+        uut = Sequence()
+        uut.register_node(MockComponent("A"), None)
+        uut.register_node(MockComponent("B"), np.dot)
+        uut.register_node(MockComponent("C"), lambda a, b: a)
+
+        self.assertEqual("[A → dot() → B → lambda() → C]", uut.get_label())
+
+    def test_get_label_cached(self):
+        uut = Sequence()
+        component = MockComponent("A")
+        uut.register_node(component, None)
+        uut.register_node(MockComponent("B"), np.dot)
+
+        label = uut.get_label()
+        component._label = "changed"
+
+        self.assertIs(label, uut.get_label())
+
+    def test_get_label_invalidated_by_nested_register_node(self):
+        inner = Sequence()
+        inner.register_node(MockComponent("A"), None)
+
+        middle = Sequence()
+        middle.register_node(inner, None)
+
+        uut = Sequence()
+        uut.register_node(MockComponent("B"), None)
+        uut.register_node(middle, np.dot)
+
+        self.assertEqual("[B → dot() → A]", uut.get_label())
+
+        inner.register_node(MockComponent("C"), np.dot)
+
+        self.assertEqual("[B → dot() → [A → dot() → C]]", uut.get_label())
+
+    def test_get_tree(self):
+        inner = Sequence()
+        inner.register_node(MutableMatrix("A", np.identity(2)), None)
+
+        uut = Sequence()
+        uut.register_node(MockComponent("B"), None)
+        uut.register_node(inner, np.dot)
+
+        self.assertEqual({
+            "type": "Sequence",
+            "label": "[B → dot() → A]",
+            "nodes": [
+                {"coalescer": None, "component": {"type": "MockComponent", "label": "B"}},
+                {"coalescer": "dot", "component": {
+                    "type": "Sequence",
+                    "label": "A",
+                    "nodes": [{"coalescer": None, "component": {"type": "MutableMatrix", "label": "A"}}]
+                }}
+            ]
+        }, uut.get_tree())
+
+    def test_get_matrix_block_assembly(self):
+        R = MutableMatrix("R", [[1, 2, 3], [4, 5, 6], [7, 8, 9]])
+        T = MutableMatrix("T", [[1, 2, 3]])
+        B = MutableMatrix("B", [[0, 0, 0, 1]])
+
+        # Concatenated one node at a time, assembled into new arrays, and assembled into a reused buffer.
+        for reuse_buffers, min_size in ((False, ASSEMBLE_MIN_SIZE), (False, 0), (True, ASSEMBLE_MIN_SIZE)):
+            with mock.patch("src.sequence.ASSEMBLE_MIN_SIZE", min_size):
+                uut = Sequence(reuse_buffers=reuse_buffers)
+                uut.register_node(R, None)
+                uut.register_node(T, coalescers.append_column)
+                uut.register_node(B, coalescers.concatenate_rows)
+
+                for value in range(3):
+                    T.get_mutator((0, 1))(value)
+
+                    expected = np.concatenate((np.concatenate((R.get_matrix(), T.get_matrix().T), axis=1),
+                                               B.get_matrix()), axis=0)
+                    np.testing.assert_array_equal(expected, uut.get_matrix())
+
+                B.get_mutator((0, 0))(value)
+                np.testing.assert_array_equal(value, uut.get_matrix()[3, 0])
+
+                R.get_mutator((0, 0))(-value)
+                np.testing.assert_array_equal(-value, uut.get_matrix()[0, 0])
+
+    def test_get_matrix_block_assembly_prefixes(self):
+        uut = Sequence(reuse_buffers=True)
+        uut.register_node(MockComponent("R", np.identity(2)), None)
+        uut.register_node(MockComponent("T", [[5, 6]]), coalescers.append_column)
+        uut.register_node(MockComponent("B", [[0, 0, 1]]), coalescers.concatenate_rows)
+        uut.register_node(MockComponent("S", np.identity(3) * 2), np.dot)
+
+        np.testing.assert_array_equal([[1, 0, 5], [0, 1, 6]], uut._get_prefix(2))
+        np.testing.assert_array_equal([[2, 0, 10], [0, 2, 12], [0, 0, 2]], uut.get_matrix())
+
+    def test_get_matrix_block_assembly_misaligned(self):
+        uut = Sequence()
+        uut.register_node(MockComponent("R", np.identity(2)), None)
+        uut.register_node(MockComponent("T", [[1, 2, 3]]), coalescers.append_column)
+
+        with self.assertRaises(ValueError):
+            uut.get_matrix()
+
+    def test_get_matrix_folds_constant_nodes(self):
+        uut = Sequence()
+
+        rng = np.random.default_rng(0)
+        components = [MutableMatrix(label, rng.random((3, 3))) for label in "ABCD"]
+        mutator = components[1].get_mutator((0, 0))
+
+        for index, component in enumerate(components):
+            uut.register_node(component, np.dot if index else None)
+
+        with mock.patch.object(components[3], "get_matrix", wraps=components[3].get_matrix) as get_matrix:
+            uut.get_matrix()
+            mutator(5)
+            actual = uut.get_matrix()
+
+        expected = np.linalg.multi_dot([component.get_matrix() for component in components])
+
+        np.testing.assert_allclose(expected, actual)
+        self.assertEqual(1, uut.get_eliminated())
+        self.assertEqual(1, get_matrix.call_count)
+
+    def test_get_matrix_folded_node_changes(self):
+        uut = Sequence()
+
+        components = [MutableMatrix(label, np.identity(2)) for label in "ABCD"]
+        components[0].get_mutator((0, 0))
+
+        for index, component in enumerate(components):
+            uut.register_node(component, np.dot if index else None)
+
+        uut.get_matrix()
+        self.assertEqual(2, uut.get_eliminated())
+
+        components[2].get_mutator((0, 1))(2)
+
+        self.assertEqual([[1, 2], [0, 1]], uut.get_matrix().tolist())
+        self.assertEqual(0, uut.get_eliminated())
+
+    def test_get_eliminated_not_folded(self):
+        def build(coalescer, **kwargs):
+            uut = Sequence(**kwargs)
+            components = [MutableMatrix(label, np.identity(2)) for label in "ABCD"]
+            components[1].get_mutator((0, 0))
+            for index, component in enumerate(components):
+                uut.register_node(component, coalescer if index else None)
+            return uut
+
+        # Only nodes after the first non-constant node (B) are folded, and only with associative coalescers.
+        self.assertEqual(1, build(np.dot).get_eliminated())
+        self.assertEqual(0, build(np.subtract).get_eliminated())
+        self.assertEqual(0, build(np.dot, fold_constants=False).get_eliminated())
+
+    def test_is_constant(self):
+        uut = Sequence()
+        uut.register_node(MutableMatrix("A", np.identity(2)), None)
+
+        self.assertTrue(uut.is_constant())
+
+        uut.register_node(MockComponent("B"), np.dot)
+
+        self.assertFalse(uut.is_constant())
+
+    def test_get_matrix_structured_components(self):
+        uut = Sequence(fold_constants=False)
+
+        rng = np.random.default_rng(0)
+        components = [
+            MutableMatrix("A", rng.random((3, 3))),
+            MutableMatrix("I", np.identity(3)),
+            MutableMatrix("D", np.diag([2, 3, 4])),
+            MutableMatrix("P", np.identity(3)[[1, 2, 0]])
+        ]
+        for index, component in enumerate(components):
+            uut.register_node(component, np.dot if index else None)
+
+        expected = np.linalg.multi_dot([component.get_matrix() for component in components])
+
+        np.testing.assert_allclose(expected, uut.get_matrix())
+        self.assertIs(uut._get_prefix(1), uut._get_prefix(2))  # Identity skipped
+
+        # Structure is detected again after a mutation.
+        components[1].get_mutator((0, 1))(5)
+
+        expected = np.linalg.multi_dot([component.get_matrix() for component in components])
+
+        np.testing.assert_allclose(expected, uut.get_matrix())
+
+    def test_apply_skips_identity(self):
+        uut = Sequence()
+        uut.register_node(MutableMatrix("A", [[2, 0, 1], [0, 2, 0], [0, 0, 1]]), None)
+        uut.register_node(MutableMatrix("I", np.identity(3)), np.dot)
+
+        points = np.array([[1.0, 1.0], [2.0, 3.0]])
+
+        np.testing.assert_allclose([[3, 2], [5, 6]], uut.apply(points))
+        self.assertIsNone(uut.get_plan())
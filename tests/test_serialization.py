@@ -0,0 +1,142 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+import src.coalescers as coalescers
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.serialization import load_sequence, save_sequence
+from src.transforms import EulerRotation
+from src.treesequence import TreeSequence
+
+
+def _append_column(a, b):
+    return np.concatenate((a, b.T), axis=1)
+
+
+class TestSerialization(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "sequence")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        inner = TreeSequence()
+        inner.register_node(MutableMatrix("A", [[1, 2], [3, 4]]), None)
+        inner.register_node(MutableMatrix("B", [[0, 1], [1, 0]]), np.dot)
+
+        uut = Sequence()
+        uut.register_node(MutableMatrix("K", [[1, 0], [0, 2], [5, 6]]), None)
+        uut.register_node(inner, np.matmul)
+
+        save_sequence(uut, self.path)
+        loaded = load_sequence(self.path)
+
+        self.assertIsInstance(loaded.get_node(1).get_component(), TreeSequence)
+        self.assertEqual(uut.get_tree(), loaded.get_tree())
+        np.testing.assert_array_equal(uut.get_matrix(), loaded.get_matrix())
+
+    def test_shared_component_stays_shared(self):
+        shared = MutableMatrix("S", np.identity(2))
+
+        uut = Sequence()
+        uut.register_node(shared, None)
+        uut.register_node(shared, np.dot)
+
+        save_sequence(uut, self.path)
+        loaded = load_sequence(self.path)
+
+        self.assertIs(loaded.get_node(0).get_component(), loaded.get_node(1).get_component())
+
+    def test_load_memory_mapped_copy_on_write(self):
+        uut = Sequence()
+        uut.register_node(MutableMatrix("A", np.identity(2)), None)
+
+        save_sequence(uut, self.path)
+        loaded = load_sequence(self.path)
+        component = loaded.get_node(0).get_component()
+
+        component.get_mutator((0, 1))(5)
+
+        np.testing.assert_array_equal([[1, 5], [0, 1]], loaded.get_matrix())
+        np.testing.assert_array_equal(np.identity(2), load_sequence(self.path).get_matrix())
+
+    def test_load_memory_mapped_read_only(self):
+        uut = Sequence()
+        uut.register_node(MutableMatrix("A", np.identity(2)), None)
+
+        save_sequence(uut, self.path)
+        loaded = load_sequence(self.path, mmap_mode="r")
+
+        with self.assertRaises(ValueError):
+            loaded.get_node(0).get_component().get_mutator((0, 1))(5)
+
+    def test_load_into_memory(self):
+        uut = Sequence()
+        uut.register_node(MutableMatrix("A", np.identity(2)), None)
+
+        save_sequence(uut, self.path)
+        loaded = load_sequence(self.path, mmap_mode=None)
+        loaded.get_node(0).get_component().get_mutator((0, 1))(5)
+
+        np.testing.assert_array_equal([[1, 5], [0, 1]], loaded.get_matrix())
+
+    def test_unregistered_coalescer(self):
+        uut = Sequence()
+        uut.register_node(MutableMatrix("A", np.identity(2)), None)
+        uut.register_node(MutableMatrix("T", [[1, 1]]), _append_column)
+
+        with self.assertRaises(ValueError):
+            save_sequence(uut, self.path)
+
+        coalescers.register_coalescer("test_append_column", _append_column)
+        save_sequence(uut, self.path)
+
+        np.testing.assert_array_equal(uut.get_matrix(), load_sequence(self.path).get_matrix())
+
+    def test_first_coalescer_not_saved(self):
+        uut = Sequence()
+        uut.register_node(MutableMatrix("A", np.identity(2)), _append_column)
+        uut.register_node(MutableMatrix("B", np.identity(2)), np.dot)
+
+        save_sequence(uut, self.path)
+
+        self.assertIsNone(load_sequence(self.path).get_node(0).get_coalescer())
+
+    def test_options(self):
+        def coalescer(lhs, rhs):
+            return lhs + rhs
+
+        coalescers.register_coalescer("test_options", coalescer)
+
+        inner = TreeSequence(associative=[coalescer])
+        inner.register_node(MutableMatrix("A", np.identity(2)), None)
+
+        uut = Sequence(reuse_buffers=True, fold_constants=False)
+        uut.register_node(inner, None)
+
+        save_sequence(uut, self.path)
+        loaded = load_sequence(self.path)
+
+        self.assertEqual(uut.get_options(), loaded.get_options())
+        self.assertEqual(inner.get_options(), loaded.get_node(0).get_component().get_options())
+
+    def test_freeze(self):
+        uut = Sequence()
+        uut.register_node(EulerRotation("R", (90, 0, 0)), None)
+
+        with self.assertRaises(TypeError):
+            save_sequence(uut, self.path)
+
+        save_sequence(uut, self.path, freeze=True)
+        loaded = load_sequence(self.path)
+
+        self.assertIsInstance(loaded.get_node(0).get_component(), MutableMatrix)
+        np.testing.assert_allclose(uut.get_matrix(), loaded.get_matrix())
@@ -0,0 +1,86 @@
+import os
+import tempfile
+from unittest import TestCase
+
+import numpy as np
+
+from src.colortransform import ColorTransform
+from src.streaming import iter_strips, open_image, transform_image
+
+
+class TestStreaming(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+
+        rng = np.random.default_rng(0)
+        self.image = rng.integers(0, 256, (17, 5, 3), dtype=np.uint8)
+
+        self.color = ColorTransform()
+        self.color.register_transform(np.array([[0.3, 0.6, 0.1, 10], [0.2, 0.7, 0.1, -5], [0.2, 0.1, 0.7, 0]]),
+                                      label="M")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_iter_strips(self):
+        actual = [(rows.start, rows.stop) for rows in iter_strips(10, 4)]
+
+        self.assertEqual([(0, 4), (4, 8), (8, 10)], actual)
+
+    def test_open_image_raw(self):
+        self.image.tofile(self.path("image.raw"))
+
+        actual = open_image(self.path("image.raw"), shape=self.image.shape, dtype=np.uint8)
+
+        self.assertEqual(self.image.tolist(), actual.tolist())
+
+    def test_open_image_raw_requires_shape(self):
+        with self.assertRaises(ValueError):
+            open_image(self.path("image.raw"))
+
+    def test_transform_image_uint8(self):
+        np.save(self.path("source.npy"), self.image)
+
+        actual = transform_image(self.color, self.path("source.npy"), self.path("destination.npy"), strip_rows=3)
+
+        self.assertEqual(np.uint8, actual.dtype)
+        self.assertEqual(self.color.apply_uint8(self.image).tolist(), np.load(self.path("destination.npy")).tolist())
+
+    def test_transform_image_float(self):
+        np.save(self.path("source.npy"), self.image.astype(np.float32))
+
+        actual = transform_image(self.color, self.path("source.npy"), self.path("destination.npy"), strip_pixels=12)
+
+        self.assertEqual(np.float32, actual.dtype)
+        np.testing.assert_allclose(self.color.apply(self.image), np.load(self.path("destination.npy")), rtol=1e-6)
+
+    def test_transform_image_float_into_uint8(self):
+        destination = np.empty((17, 5, 3), dtype=np.uint8)
+
+        actual = transform_image(self.color, self.image.astype(np.float32), destination, strip_rows=4)
+
+        self.assertIs(destination, actual)
+        # Within rounding of the float32 products, which are accumulated in a different order.
+        np.testing.assert_allclose(self.color.apply_uint8(self.image), destination, atol=1)
+
+    def test_transform_image_into_array(self):
+        destination = np.empty((17, 5, 3), dtype=np.float32)
+
+        actual = transform_image(self.color, self.image, destination, strip_rows=4)
+
+        self.assertIs(destination, actual)
+        np.testing.assert_allclose(self.color.apply(self.image), destination, rtol=1e-6)
+
+    def test_transform_image_into_float64_array(self):
+        destination = np.empty((17, 5, 3), dtype=np.float64)
+
+        actual = transform_image(self.color, self.image, destination, strip_rows=4)
+
+        self.assertIs(destination, actual)
+        np.testing.assert_allclose(self.color.apply(self.image), destination, rtol=1e-6)
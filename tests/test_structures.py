@@ -0,0 +1,59 @@
+from unittest import TestCase
+
+import numpy as np
+
+import src.structures as structures
+
+
+class TestStructures(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_detect_structure(self):
+        self.assertEqual(structures.IDENTITY, structures.detect_structure(np.identity(3)))
+        self.assertEqual(structures.DIAGONAL, structures.detect_structure(np.diag([1, 2, 3])))
+        self.assertEqual(structures.PERMUTATION, structures.detect_structure(np.identity(3)[[2, 0, 1]]))
+        self.assertEqual(structures.AFFINE, structures.detect_structure([[0, 1, 5], [1, 1, 6], [0, 0, 1]]))
+        self.assertEqual(structures.DENSE, structures.detect_structure([[1, 2], [3, 4]]))
+        self.assertEqual(structures.DENSE, structures.detect_structure([[1, 0, 0], [0, 1, 0]]))
+
+    def test_detect_structure_not_permutation(self):
+        # A single 1 in every column, but not in every row.
+        self.assertEqual(structures.DENSE, structures.detect_structure([[1, 1], [0, 0]]))
+
+    def test_multiply(self):
+        rng = np.random.default_rng(0)
+
+        for size in (3, 96):
+            lhs = rng.random((4, size))
+
+            for rhs in (np.identity(size), np.diag(rng.random(size)), np.identity(size)[rng.permutation(size)],
+                        rng.random((size, size))):
+                structure = structures.detect_structure(rhs)
+                np.testing.assert_allclose(np.matmul(lhs, rhs), structures.multiply(lhs, rhs, structure))
+
+    def test_multiply_identity_skipped(self):
+        lhs = np.ones((2, 2))
+
+        self.assertIs(lhs, structures.multiply(lhs, np.identity(2), structures.IDENTITY))
+
+    def test_multiply_out(self):
+        lhs = np.ones((2, 96))
+        rhs = np.diag(np.arange(96.0))
+        out = np.empty((2, 96))
+
+        actual = structures.multiply(lhs, rhs, structures.DIAGONAL, out=out)
+
+        self.assertIs(out, actual)
+        np.testing.assert_array_equal(np.matmul(lhs, rhs), actual)
+
+    def test_multiply_promotes(self):
+        lhs = np.ones((2, 2), dtype=np.float32)
+
+        actual = structures.multiply(lhs, np.identity(2), structures.IDENTITY)
+
+        self.assertEqual(np.float64, actual.dtype)
+
+    def test_multiply_misaligned(self):
+        with self.assertRaises(ValueError):
+            structures.multiply(np.ones((2, 3)), np.identity(2), structures.IDENTITY)
@@ -0,0 +1,97 @@
+import math
+from unittest import TestCase
+
+import numpy as np
+
+import src.utility as utility
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.sweep import sweep
+from src.transforms import EulerRotation
+
+
+def projection():
+    """Sequence shaped like the projection experiment's K·[R|T; B] chain."""
+    K = MutableMatrix("K", [[1, 0, 0, 0], [0, 1, 0, 0], [0, 0, 1, 0]])
+    R = EulerRotation("R", axes="zyx")
+    T = MutableMatrix("T", [[0, 0, 1]])
+    B = MutableMatrix("B", [[0, 0, 0, 1]])
+
+    RT = Sequence()
+    RT.register_node(R, None)
+    RT.register_node(T, lambda a, b: np.concatenate((a, b.T), axis=1))
+    RT.register_node(B, lambda a, b: np.concatenate((a, b), axis=0))
+
+    sequence = Sequence()
+    sequence.register_node(K, None)
+    sequence.register_node(RT, np.dot)
+
+    return sequence, K, R, T
+
+
+class TestSweep(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_sweep_no_slots(self):
+        sequence = Sequence()
+        sequence.register_node(MutableMatrix("T", [[1, 2], [3, 4]]), None)
+
+        actual = sweep(sequence, [], np.empty((3, 0)))
+
+        self.assertEqual((3, 2, 2), actual.shape)
+        self.assertEqual([[1, 2], [3, 4]], actual[2].tolist())
+
+    def test_sweep_mismatched_values(self):
+        sequence, *_ = projection()
+
+        with self.assertRaises(ValueError):
+            sweep(sequence, [(0, (0, 0))], np.zeros((4, 2)))
+
+    def test_sweep_matches_mutators(self):
+        sequence, K, R, T = projection()
+        slots = [
+            ((1, 0), 0, math.radians),
+            ((1, 0), 2, math.radians),
+            ((1, 1), (0, 2)),
+            (0, (0, 0), lambda v: v * 2)
+        ]
+        values = np.array([[0, 0, 1, 1], [30, 45, 2, 0.5], [90, -10, 3, 1.5]], dtype=float)
+        points = utility.square((0, 0), 1, add_coords=(0, 1))
+
+        matrices, transformed = sweep(sequence, slots, values, points=points)
+
+        mutators = [
+            R.get_mutator(0, math.radians),
+            R.get_mutator(2, math.radians),
+            T.get_mutator((0, 2)),
+            K.get_mutator((0, 0), lambda v: v * 2)
+        ]
+        for row, matrix, frame in zip(values, matrices, transformed):
+            for mutate, value in zip(mutators, row):
+                mutate(value)
+
+            expected = sequence.get_matrix()
+
+            np.testing.assert_allclose(expected, matrix, atol=1e-12)
+            np.testing.assert_allclose(utility.apply_transform(expected, points), frame, atol=1e-12)
+
+    def test_sweep_does_not_mutate(self):
+        sequence, K, R, T = projection()
+
+        before = sequence.get_matrix().copy()
+        versions = (K.get_version(), R.get_version(), T.get_version())
+
+        sweep(sequence, [((1, 1), (0, 2)), (0, (1, 1))], np.ones((5, 2)))
+
+        self.assertEqual(versions, (K.get_version(), R.get_version(), T.get_version()))
+        self.assertEqual(before.tolist(), sequence.get_matrix().tolist())
+
+    def test_sweep_single_slot(self):
+        sequence = Sequence()
+        sequence.register_node(MutableMatrix("S", np.identity(2, dtype=int)), None)
+        sequence.register_node(MutableMatrix("T", [[1, 0], [0, 1]]), np.dot)
+
+        actual = sweep(sequence, [(0, (0, 1))], [0.5, 1.5])
+
+        self.assertEqual([[[1, 0.5], [0, 1]], [[1, 1.5], [0, 1]]], actual.tolist())
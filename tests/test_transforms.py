@@ -0,0 +1,190 @@
+import math
+from unittest import TestCase
+
+import numpy as np
+from matplotlib import figure, widgets
+
+import src.structures as structures
+from src.interactivesquare import InteractiveSquare
+from src.transforms import (Composite, EulerRotation, Perspective, Rotation,
+                            Scale, Shear, Translation, compose)
+
+
+def rotation_x(angle):
+    c, s = math.cos(angle), math.sin(angle)
+    return np.array([[1, 0, 0], [0, c, -s], [0, s, c]])
+
+
+def rotation_y(angle):
+    c, s = math.cos(angle), math.sin(angle)
+    return np.array([[c, 0, s], [0, 1, 0], [-s, 0, c]])
+
+
+def rotation_z(angle):
+    c, s = math.cos(angle), math.sin(angle)
+    return np.array([[c, -s, 0], [s, c, 0], [0, 0, 1]])
+
+
+class TestTransforms(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_rotation_identity(self):
+        uut = Rotation("R")
+
+        np.testing.assert_allclose(np.identity(3), uut.get_matrix())
+
+    def test_rotation_homogenous(self):
+        uut = Rotation("R", homogenous=True)
+
+        np.testing.assert_allclose(np.identity(4), uut.get_matrix())
+
+    def test_rotation_normalizes_quaternion(self):
+        uut = Rotation("R", (2, 0, 0, 2))  # 90° about z
+
+        np.testing.assert_allclose(rotation_z(math.pi / 2), uut.get_matrix(), atol=1e-12)
+
+    def test_euler_rotation(self):
+        angles = (0.3, -1.1, 2.0)
+
+        uut = EulerRotation("R", angles, axes="zyx")
+
+        expected = rotation_z(angles[0]) @ rotation_y(angles[1]) @ rotation_x(angles[2])
+
+        np.testing.assert_allclose(expected, uut.get_matrix(), atol=1e-12)
+
+    def test_euler_rotation_invalid_axes(self):
+        with self.assertRaises(ValueError):
+            EulerRotation("R", axes="xw")
+
+    def test_mutator(self):
+        uut = EulerRotation("R", axes="xyz")
+
+        version = uut.get_version()
+        uut.get_mutator(0, math.radians)(90)
+
+        self.assertEqual(version + 1, uut.get_version())
+        np.testing.assert_allclose(rotation_x(math.pi / 2), uut.get_matrix(), atol=1e-12)
+
+    def test_matrix_built_once_per_change(self):
+        uut = Translation("T", [1, 2])
+
+        first = uut.get_matrix()
+
+        self.assertIs(first, uut.get_matrix())
+
+        uut.set_parameters([3, 4])
+
+        self.assertIsNot(first, uut.get_matrix())
+        self.assertEqual([[1, 0, 3], [0, 1, 4], [0, 0, 1]], uut.get_matrix().tolist())
+
+    def test_is_constant(self):
+        mutated = EulerRotation("R")
+        mutated.get_mutator(0)
+        assigned = Translation("T", [1, 2])
+        assigned.set_parameters([3, 4])
+
+        self.assertTrue(Scale("S", [2, 2]).is_constant())
+        self.assertFalse(mutated.is_constant())
+        self.assertFalse(assigned.is_constant())
+        self.assertFalse(Composite("M", [Scale("S", [2, 2]), mutated]).is_constant())
+
+    def test_get_structure(self):
+        self.assertEqual(structures.DIAGONAL, Scale("S", [2, 3]).get_structure())
+        self.assertEqual(structures.AFFINE, Translation("T", [1, 2]).get_structure())
+
+        rotation = EulerRotation("R")
+        self.assertEqual(structures.IDENTITY, rotation.get_structure())
+
+        rotation.get_mutator(1)(0.5)
+        self.assertEqual(structures.DENSE, rotation.get_structure())
+
+    def test_scale(self):
+        uut = Scale("S", [2, 3], homogenous=True)
+
+        self.assertEqual([[2, 0, 0], [0, 3, 0], [0, 0, 1]], uut.get_matrix().tolist())
+
+    def test_shear(self):
+        uut = Shear("H", [0.5, 0.25])
+
+        self.assertEqual([[1, 0.5], [0.25, 1]], uut.get_matrix().tolist())
+
+    def test_shear_invalid_factors(self):
+        with self.assertRaises(ValueError):
+            Shear("H", [0.5, 0.25, 1])
+
+    def test_perspective(self):
+        uut = Perspective("K", focal=(2, 3), principal=(4, 5), skew=6)
+
+        expected = [[2, 6, 4, 0], [0, 3, 5, 0], [0, 0, 1, 0]]
+
+        self.assertEqual(expected, uut.get_matrix().tolist())
+
+    def test_get_matrices(self):
+        uut = EulerRotation("R", axes="zyx")
+
+        parameters = np.array([[0.1, 0.2, 0.3], [1.0, -0.5, 0.25]])
+
+        actual = uut.get_matrices(parameters)
+
+        self.assertEqual((2, 3, 3), actual.shape)
+        for angles, matrix in zip(parameters, actual):
+            np.testing.assert_allclose(EulerRotation("R", angles).get_matrix(), matrix, atol=1e-12)
+
+    def test_compose_rotations(self):
+        lhs = EulerRotation("A", (0.3, 0.2, 0.1))
+        rhs = Rotation("B", (0.5, 0.5, 0.5, 0.5))
+
+        actual = compose(lhs, rhs)
+
+        self.assertIsInstance(actual, Rotation)
+        np.testing.assert_allclose(lhs.get_matrix() @ rhs.get_matrix(), actual.get_matrix(), atol=1e-12)
+
+    def test_compose_translations(self):
+        actual = compose(Translation("A", [1, 2]), Translation("B", [3, -1]))
+
+        self.assertIsInstance(actual, Translation)
+        self.assertEqual([4, 1], actual.get_parameters().tolist())
+
+    def test_compose_scales(self):
+        actual = compose(Scale("A", [2, 3]), Scale("B", [0.5, 2]))
+
+        self.assertEqual([[1, 0], [0, 6]], actual.get_matrix().tolist())
+
+    def test_compose_unsupported(self):
+        with self.assertRaises(TypeError):
+            compose(Translation("T", [1, 2]), Scale("S", [1, 2], homogenous=True))
+
+    def test_composite(self):
+        transforms = [
+            Translation("T", [1, 2, 3]),
+            EulerRotation("Rz", (0.4, 0, 0), homogenous=True),
+            EulerRotation("Ry", (0, 0.7, 0), homogenous=True),
+            Scale("S", [2, 2, 2], homogenous=True)
+        ]
+
+        uut = Composite("M", transforms)
+
+        expected = np.linalg.multi_dot([transform.get_matrix() for transform in transforms])
+
+        np.testing.assert_allclose(expected, uut.get_matrix(), atol=1e-12)
+
+        transforms[2].get_mutator(1)(-0.2)
+
+        expected = np.linalg.multi_dot([transform.get_matrix() for transform in transforms])
+
+        np.testing.assert_allclose(expected, uut.get_matrix(), atol=1e-12)
+
+    def test_register_transform(self):
+        fig = figure.Figure()
+        slider = widgets.Slider(fig.add_axes([0, 0, 1, 0.1]), "θ", 0, 360, valinit=0)
+
+        rotation = EulerRotation("R", axes="zyx")
+
+        uut = InteractiveSquare(fig.add_subplot(), scale=2)
+        uut.register_transform(rotation)
+        uut.register_slider(0, 0, slider, math.radians)
+
+        slider.set_val(90)
+
+        np.testing.assert_allclose([[1, -1], [-1, -1], [-1, 1], [1, 1]], uut.get_patch().get_xy()[:4], atol=1e-12)
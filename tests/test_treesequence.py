@@ -0,0 +1,193 @@
+from unittest import TestCase, mock
+
+import numpy as np
+
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.treesequence import TreeSequence
+from tests.test_sequence import CountingCoalescer, MockComponent
+
+
+def hstack_column(lhs, rhs):
+    return np.concatenate((lhs, rhs.T), axis=1)
+
+
+def vstack_row(lhs, rhs):
+    return np.concatenate((lhs, rhs), axis=0)
+
+
+class TestTreeSequence(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def test_instance(self):
+        uut = TreeSequence()
+
+        self.assertIsNotNone(uut)
+
+    def test_get_matrix_no_elements(self):
+        uut = TreeSequence()
+
+        with self.assertRaises(ValueError):
+            uut.get_matrix()
+
+    def test_get_matrix_one_element(self):
+        uut = TreeSequence()
+
+        component = MockComponent("T")
+        uut.register_node(component, None)
+
+        expected = component.get_matrix().tolist()
+        actual = uut.get_matrix().tolist()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_matrix_matches_sequence(self):
+        rng = np.random.default_rng(0)
+        matrices = rng.standard_normal((13, 3, 3))
+
+        expected = Sequence()
+        uut = TreeSequence()
+        for index, matrix in enumerate(matrices):
+            coalescer = np.add if index in (4, 5) else np.dot
+            expected.register_node(MockComponent(f"T{index}", matrix), coalescer)
+            uut.register_node(MockComponent(f"T{index}", matrix), coalescer)
+
+        np.testing.assert_allclose(expected.get_matrix(), uut.get_matrix())
+
+    def test_get_matrix_non_associative_split(self):
+        R = [MutableMatrix(f"R{i}", np.identity(3)) for i in range(3)]
+        T = MutableMatrix("T", [[1, 2, 3]])
+        B = MutableMatrix("B", [[0, 0, 0, 1]])
+
+        expected = Sequence()
+        uut = TreeSequence()
+        for sequence in (expected, uut):
+            sequence.register_node(R[0], None)
+            sequence.register_node(R[1], np.dot)
+            sequence.register_node(R[2], np.dot)
+            sequence.register_node(T, hstack_column)
+            sequence.register_node(B, vstack_row)
+
+        R[1].get_mutator((0, 1))(0.5)
+        T.get_mutator((0, 2))(-1)
+
+        self.assertEqual(expected.get_matrix().tolist(), uut.get_matrix().tolist())
+        self.assertEqual((4, 4), uut.get_matrix().shape)
+
+    def test_get_matrix_logarithmic_update(self):
+        coalescer = CountingCoalescer()
+        uut = TreeSequence(associative=[coalescer])
+
+        components = [MutableMatrix(f"T{i}", np.identity(2)) for i in range(64)]
+        for component in components:
+            uut.register_node(component, coalescer)
+
+        uut.get_matrix()
+        coalescer.calls = 0
+
+        components[21].get_mutator((0, 1))(2)
+
+        expected = [[1, 2], [0, 1]]
+        actual = uut.get_matrix().tolist()
+
+        self.assertEqual(expected, actual)
+        self.assertEqual(6, coalescer.calls)  # log2(64)
+
+    def test_get_matrix_cached(self):
+        coalescer = CountingCoalescer()
+        uut = TreeSequence(associative=[coalescer])
+
+        for index in range(5):
+            uut.register_node(MutableMatrix(f"T{index}", np.identity(2)), coalescer)
+
+        first = uut.get_matrix()
+        coalescer.calls = 0
+        second = uut.get_matrix()
+
+        self.assertIs(first, second)
+        self.assertEqual(0, coalescer.calls)
+
+    def test_get_matrix_clean_read_skips_versions(self):
+        uut = TreeSequence()
+
+        components = [MutableMatrix(f"T{i}", np.identity(2)) for i in range(16)]
+        for component in components:
+            uut.register_node(component, np.dot)
+
+        components[3].get_mutator((0, 1))(2)
+        first = uut.get_matrix()
+
+        with mock.patch.object(MutableMatrix, "get_version", autospec=True) as get_version:
+            second = uut.get_matrix()
+
+        self.assertIs(first, second)
+        get_version.assert_not_called()
+
+    def test_get_matrix_updates_dirty_paths(self):
+        for (first, second), expected_calls in (((0, 1), 6), ((0, 63), 11)):
+            coalescer = CountingCoalescer()
+            uut = TreeSequence(associative=[coalescer])
+
+            components = [MutableMatrix(f"T{i}", np.identity(2)) for i in range(64)]
+            for component in components:
+                uut.register_node(component, coalescer)
+
+            uut.get_matrix()
+            coalescer.calls = 0
+
+            components[first].get_mutator((0, 1))(2)
+            components[second].get_mutator((1, 0))(3)
+
+            with mock.patch.object(components[32], "get_matrix", wraps=components[32].get_matrix) as get_matrix:
+                actual = uut.get_matrix().tolist()
+
+            self.assertEqual([[7, 2], [3, 1]], actual)
+            self.assertEqual(expected_calls, coalescer.calls)
+            get_matrix.assert_not_called()
+
+    def test_get_matrix_repeated_component(self):
+        component = MutableMatrix("T", np.identity(2))
+
+        uut = TreeSequence()
+        for _ in range(3):
+            uut.register_node(component, np.dot)
+        uut.get_matrix()
+
+        component.get_mutator((0, 1))(1)
+
+        expected = [[1, 3], [0, 1]]
+        actual = uut.get_matrix().tolist()
+
+        self.assertEqual(expected, actual)
+
+    def test_get_matrix_polls_nested_sequence(self):
+        inner = Sequence()
+        component = MutableMatrix("R", np.identity(2))
+        inner.register_node(component, None)
+
+        uut = TreeSequence()
+        uut.register_node(MutableMatrix("T", [[1, 1], [0, 1]]), None)
+        uut.register_node(inner, np.dot)
+        uut.get_matrix()
+
+        component.get_mutator((1, 1))(2)
+
+        expected = [[1, 2], [0, 2]]
+        actual = uut.get_matrix().tolist()
+
+        self.assertEqual(expected, actual)
+
+    def test_register_node_after_get(self):
+        uut = TreeSequence()
+
+        uut.register_node(MockComponent("T1"), None)
+        uut.register_node(MockComponent("T2"), np.add)
+        uut.get_matrix()
+
+        uut.register_node(MockComponent("T3"), np.add)
+
+        expected = [[3, 0], [0, 3]]
+        actual = uut.get_matrix().tolist()
+
+        self.assertEqual(expected, actual)
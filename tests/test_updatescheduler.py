@@ -0,0 +1,83 @@
+from unittest import TestCase, mock
+
+import numpy as np
+from matplotlib import figure, widgets
+
+from src.interactivesquare import InteractiveSquare
+from src.updatescheduler import UpdateScheduler
+
+
+class TestUpdateScheduler(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        self.canvas = mock.Mock()
+        self.timer = self.canvas.new_timer.return_value
+
+    def test_instance(self):
+        uut = UpdateScheduler(self.canvas, max_fps=50)
+
+        self.assertIsNotNone(uut)
+        self.canvas.new_timer.assert_called_once_with(interval=20)
+        self.timer.add_callback.assert_called_once_with(uut.flush)
+
+    def test_schedule_starts_timer_once(self):
+        uut = UpdateScheduler(self.canvas)
+
+        uut.schedule(mock.Mock())
+        uut.schedule(mock.Mock())
+
+        self.timer.start.assert_called_once()
+        self.assertEqual(2, uut.pending())
+
+    def test_schedule_coalesces_callback(self):
+        uut = UpdateScheduler(self.canvas)
+        callback = mock.Mock()
+
+        for _ in range(5):
+            uut.schedule(callback)
+
+        uut.flush()
+
+        callback.assert_called_once()
+        self.canvas.draw_idle.assert_called_once()
+        self.assertEqual(0, uut.pending())
+
+    def test_flush_nothing_pending(self):
+        uut = UpdateScheduler(self.canvas)
+
+        uut.flush()
+
+        self.canvas.draw_idle.assert_not_called()
+
+    def test_schedule_after_flush_restarts_timer(self):
+        uut = UpdateScheduler(self.canvas)
+
+        uut.schedule(mock.Mock())
+        uut.flush()
+        uut.schedule(mock.Mock())
+
+        self.assertEqual(2, self.timer.start.call_count)
+
+    def test_interactive_square_sliders(self):
+        fig = figure.Figure()
+        axes = fig.add_subplot()
+        slider = widgets.Slider(fig.add_axes([0, 0, 1, 0.1]), "Shear", 0, 1, valinit=0)
+
+        uut = UpdateScheduler(fig.canvas)
+        square = InteractiveSquare(axes, scale=2, scheduler=uut)
+        square.register_transform(np.identity(2), label="S")
+        square.register_slider(0, (0, 1), slider)
+
+        with mock.patch.object(square, "_update_patch", wraps=square._update_patch) as update_patch:
+            slider.set_val(0.25)
+            slider.set_val(0.5)
+
+            update_patch.assert_not_called()
+
+            uut.flush()
+
+            update_patch.assert_called_once()
+
+        self.assertCountEqual([[-1.5, -1], [-0.5, 1], [1.5, 1], [0.5, -1]], square.get_patch().get_xy()[:4].tolist())
@@ -2,8 +2,10 @@ from unittest import TestCase, mock
 
 import numpy as np
 
-from src.utility import (apply_transform, from_homogenous, square,
-                         to_homogenous, transform)
+from src.mutablematrix import MutableMatrix
+from src.sequence import Sequence
+from src.utility import (add_coordinates, apply_transform, check_out, from_homogenous,
+                         grid, polygon, register_transform, square, to_homogenous, transform)
 
 
 class TestUtility(TestCase):
@@ -30,6 +32,39 @@ class TestUtility(TestCase):
         self.assertEqual(value_in.tolist(), value_base)
         self.assertEqual(expected, actual.tolist())
 
+    def test_to_homogenous_out(self):
+        value_in = np.array([[-1, -1], [1, 1]], dtype=float)
+        out = np.zeros((2, 3))
+
+        actual = to_homogenous(value_in, out=out)
+
+        self.assertIs(out, actual)
+        self.assertEqual([[-1, -1, 1], [1, 1, 1]], out.tolist())
+
+    def test_from_homogenous_in_place(self):
+        value_in = np.array([[2, 4, 2], [3, 6, 3]], dtype=float)
+
+        actual = from_homogenous(value_in, out=value_in[:, :-1])
+
+        self.assertTrue(np.shares_memory(value_in, actual))
+        self.assertEqual([[1, 2], [1, 2]], actual.tolist())
+
+    def test_from_homogenous_epsilon_clip(self):
+        value_in = np.array([[1, 1, 0], [1, 1, -1e-9], [2, 2, 2]], dtype=float)
+
+        actual = from_homogenous(value_in, epsilon=1e-3)
+
+        self.assertTrue(np.all(np.isfinite(actual)))
+        self.assertEqual([[1e3, 1e3], [-1e3, -1e3], [1, 1]], actual.tolist())
+
+    def test_from_homogenous_epsilon_fill(self):
+        value_in = np.array([[1, 1, 0], [2, 2, 2]], dtype=float)
+
+        actual = from_homogenous(value_in, epsilon=1e-3, fill=np.nan)
+
+        self.assertTrue(np.all(np.isnan(actual[0])))
+        self.assertEqual([1, 1], actual[1].tolist())
+
     def test_square(self):
         expected = [[-1, -1], [-1, 1], [1, -1], [1,  1]]
         actual = square((0, 0), 2)  # Square with width/height 2 centered around (0, 0)
@@ -48,6 +83,29 @@ class TestUtility(TestCase):
 
         self.assertCountEqual(expected, actual.tolist())
 
+    def test_polygon(self):
+        actual = polygon(4, (1, 1), 2)
+
+        np.testing.assert_allclose([[2, 1], [1, 2], [0, 1], [1, 0]], actual, atol=1e-12)
+
+    def test_polygon_homogenous(self):
+        actual = polygon(6, add_coords=[1])
+
+        self.assertEqual((6, 3), actual.shape)
+        self.assertEqual([1] * 6, actual[:, 2].tolist())
+
+    def test_grid(self):
+        vertices, faces = grid(1, 2, scale=2)
+
+        self.assertCountEqual([[-2, -1], [0, -1], [2, -1], [-2, 1], [0, 1], [2, 1]], vertices.tolist())
+        self.assertEqual([[-2, -1], [-2, 1], [0, 1], [0, -1]], vertices[faces[0]].tolist())
+        self.assertEqual([[0, -1], [0, 1], [2, 1], [2, -1]], vertices[faces[1]].tolist())
+
+    def test_add_coordinates_none(self):
+        array = np.zeros((2, 2))
+
+        self.assertIs(array, add_coordinates(array))
+
     def test_transform_matching_dimensions(self):
         expected = square((0, 0), 2)
         actual = square((0, 0), 2)
@@ -130,3 +188,98 @@ class TestUtility(TestCase):
         actual = apply_transform(T_, actual, row_vector=True)
 
         self.assertEqual(expected.tolist(), actual.tolist())
+
+    def test_apply_transform_matches_transform(self):
+        rng = np.random.default_rng(0)
+        points = rng.standard_normal((100, 3))
+        T = rng.standard_normal((4, 4))
+
+        expected = np.apply_along_axis(transform(T), 1, points)
+        actual = apply_transform(T, points)
+
+        np.testing.assert_allclose(expected, actual)
+
+    def test_apply_transform_truncates_rows(self):
+        points = np.array([[1, 2], [3, 4]], dtype=float)
+
+        T = np.array([
+            [1, 0, 0],
+            [0, 1, 0],
+            [0, 0, 1]
+        ])
+        actual = apply_transform(T, points)
+
+        self.assertEqual((2, 2), actual.shape)
+        self.assertEqual(points.tolist(), actual.tolist())
+
+    def test_apply_transform_preserves_float32(self):
+        points = square((0, 0), 2).astype(np.float32)
+
+        T = np.array([
+            [2, 0],
+            [0, 2]
+        ], dtype=np.float64)
+        actual = apply_transform(T, points)
+
+        self.assertEqual(np.float32, actual.dtype)
+        self.assertCountEqual([[-2, -2], [-2, 2], [2, -2], [2, 2]], actual.tolist())
+
+    def test_apply_transform_out(self):
+        points = square((0, 0), 2)
+        out = np.empty_like(points)
+
+        T = np.array([
+            [1, 0, 1],
+            [0, 1, 2],
+            [0, 0, 1]
+        ])
+        actual = apply_transform(T, points, out=out)
+
+        self.assertIs(out, actual)
+        self.assertCountEqual([[0, 1], [0, 3], [2, 1], [2, 3]], out.tolist())
+
+    def test_apply_transform_stacked_matrices(self):
+        points = square((0, 0), 2)
+
+        T = np.array([
+            [[1, 0, 1], [0, 1, 0], [0, 0, 1]],
+            [[1, 0, 0], [0, 1, 1], [0, 0, 1]]
+        ])
+        actual = apply_transform(T, points)
+
+        self.assertEqual((2, 4, 2), actual.shape)
+        self.assertEqual(apply_transform(T[0], points).tolist(), actual[0].tolist())
+        self.assertEqual(apply_transform(T[1], points).tolist(), actual[1].tolist())
+
+    def test_apply_transform_too_many_coordinates(self):
+        points = square((0, 0), 2, add_coords=[0])
+
+        T = np.identity(2)
+
+        with self.assertRaises(ValueError):
+            apply_transform(T, points)
+
+    def test_check_out(self):
+        out = np.empty((4, 3), dtype=np.float32)
+
+        self.assertIs(out, check_out(out, (4, 3), np.float32))
+
+        for bad in (out.T, out[:, :2], out.astype(float), np.empty((3, 4), dtype=np.float32).T):
+            with self.assertRaises(ValueError):
+                check_out(bad, (4, 3), np.float32)
+
+    def test_register_transform(self):
+        sequence = Sequence()
+        component = MutableMatrix("R", np.identity(2))
+
+        register_transform(sequence, component)
+        register_transform(sequence, [[1, 2], [0, 1]], label="T")
+
+        self.assertIs(component, sequence.get_node(0).get_component())
+        self.assertEqual("T", sequence.get_node(1).get_component().get_label())
+        self.assertIs(np.dot, sequence.get_node(1).get_coalescer())
+        self.assertEqual([[1, 2], [0, 1]], sequence.get_matrix().tolist())
+
+    def test_register_transform_requires_label(self):
+        with self.assertRaises(TypeError):
+            register_transform(Sequence(), np.identity(2))
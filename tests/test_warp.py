@@ -0,0 +1,122 @@
+from unittest import TestCase
+
+import numpy as np
+
+from src.mutablematrix import MutableMatrix
+from src.warp import ImageWarp
+
+
+class TestImageWarp(TestCase):
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+
+    def setUp(self):
+        rng = np.random.default_rng(0)
+        self.image = rng.integers(0, 256, (6, 8, 3), dtype=np.uint8)
+
+    def test_invalid_interpolation(self):
+        with self.assertRaises(ValueError):
+            ImageWarp(interpolation="cubic")
+
+    def test_identity(self):
+        for interpolation in ("nearest", "bilinear"):
+            warp = ImageWarp(interpolation=interpolation)
+            warp.register_transform(np.identity(3), label="I")
+
+            self.assertEqual(self.image.tolist(), warp.apply(self.image).tolist())
+
+    def test_translation(self):
+        warp = ImageWarp(interpolation="nearest", fill=7)
+        warp.register_transform(np.array([[1, 0, 2], [0, 1, 1]]), label="T")
+
+        actual = warp.apply(self.image)
+
+        self.assertEqual(self.image[:-1, :-2].tolist(), actual[1:, 2:].tolist())
+        self.assertTrue(np.all(actual[0] == 7))
+        self.assertTrue(np.all(actual[:, :2] == 7))
+
+    def test_bilinear_half_pixel(self):
+        image = np.array([[0, 10], [20, 30]], dtype=float)
+
+        warp = ImageWarp()
+        warp.register_transform(np.array([[1, 0, -0.5], [0, 1, -0.5], [0, 0, 1]]), label="T")
+
+        actual = warp.apply(image, shape=(1, 1))
+
+        self.assertEqual([[15]], actual.tolist())
+
+    def test_homography_matches_inverse_mapping(self):
+        homography = np.array([[1.1, 0.1, 0.5], [0.05, 0.9, 0.2], [0.01, 0.02, 1]])
+
+        warp = ImageWarp(interpolation="nearest")
+        warp.register_transform(homography, label="H")
+
+        image = np.arange(20 * 20, dtype=float).reshape(20, 20)
+
+        actual = warp.apply(image, shape=(12, 15))
+
+        inverse = np.linalg.inv(homography)
+        for row in range(12):
+            for column in range(15):
+                x, y, w = inverse @ [column, row, 1]
+                x, y = int(np.rint(x / w)), int(np.rint(y / w))
+                expected = image[y, x] if 0 <= x < 20 and 0 <= y < 20 else 0
+                self.assertEqual(expected, actual[row, column])
+
+    def test_reuses_grid_while_matrix_changes(self):
+        matrix = MutableMatrix("T", np.identity(3))
+
+        warp = ImageWarp()
+        warp.register_transform(matrix)
+        warp.apply(self.image)
+        buffers = (warp._grid, warp._scratch, warp._indices, warp._masks)
+
+        matrix.get_mutator((0, 2))(1)
+        actual = warp.apply(self.image)
+
+        for before, after in zip(buffers, (warp._grid, warp._scratch, warp._indices, warp._masks)):
+            self.assertIs(before, after)
+        self.assertEqual(self.image[:, :-1].tolist(), actual[:, 1:].tolist())
+
+    def test_invalid_matrix(self):
+        warp = ImageWarp()
+        warp.register_transform(np.identity(4), label="I")
+
+        with self.assertRaises(ValueError):
+            warp.apply(self.image)
+
+    def test_out(self):
+        warp = ImageWarp()
+        warp.register_transform(np.identity(3), label="I")
+        out = np.empty(self.image.shape, dtype=np.uint8)
+
+        actual = warp.apply(self.image, out=out)
+
+        self.assertIs(out, actual)
+        self.assertEqual(self.image.tolist(), actual.tolist())
+
+    def test_invalid_out(self):
+        warp = ImageWarp()
+        warp.register_transform(np.identity(3), label="I")
+
+        transposed = np.empty((8, 6, 3), dtype=np.uint8).transpose(1, 0, 2)
+        for out in (transposed, np.empty(self.image.shape, dtype=float), np.empty((6, 8), dtype=np.uint8)):
+            with self.assertRaises(ValueError):
+                warp.apply(self.image, out=out)
+
+    def test_invalid_fill(self):
+        for fill in (-1, 256, 0.5, np.nan):
+            warp = ImageWarp(fill=fill)
+            warp.register_transform(np.identity(3), label="I")
+
+            with self.assertRaises(ValueError):
+                warp.apply(self.image)
+
+    def test_float_fill(self):
+        warp = ImageWarp(interpolation="nearest", fill=np.nan)
+        warp.register_transform(np.array([[1, 0, 2], [0, 1, 0]]), label="T")
+
+        actual = warp.apply(self.image.astype(np.float32))
+
+        self.assertTrue(np.isnan(actual[:, :2]).all())
+        self.assertEqual(self.image[:, :-2].tolist(), actual[:, 2:].tolist())